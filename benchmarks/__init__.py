@@ -0,0 +1,6 @@
+"""
+Micro-benchmarks for the py-dmmjp hot paths.
+
+Run a benchmark as a module from the repository root, e.g.
+`python -m benchmarks.bench_json`.
+"""
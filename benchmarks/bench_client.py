@@ -0,0 +1,91 @@
+"""
+Measure end-to-end client throughput against a local FakeDMMServer.
+
+The server serves the recorded product fixtures, so the whole pipeline (HTTP,
+JSON decoding and parsing) runs on production-shaped payloads without network
+access to the DMM API.
+
+Usage:
+    python -m benchmarks.bench_client [--count 20000] [--latency 0.0]
+        [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, List, Tuple
+
+from py_dmmjp import AsyncDMMClient, DMMClient
+from py_dmmjp.fakeserver import FakeDMMServer
+
+from .fixtures import make_item_list_response
+
+
+def main() -> None:
+    """Time iterating over the whole fake catalog with each client method."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    responses = {"ItemList": make_item_list_response(100)}
+
+    with FakeDMMServer(
+        responses=responses, total_count=args.count, latency=args.latency
+    ) as server:
+        client = DMMClient("bench", "bench-990", base_url=server.base_url)
+
+        async def iterate_async(raw: bool) -> int:
+            async with AsyncDMMClient(
+                "bench", "bench-990", base_url=server.base_url
+            ) as async_client:
+                iterate = (
+                    async_client.iter_products_raw
+                    if raw
+                    else async_client.iter_products
+                )
+                items = iterate(site="FANZA", hits=100, concurrency=args.concurrency)
+
+                return len([item async for item in items])
+
+        cases: List[Tuple[str, Callable[[], Any]]] = [
+            (
+                "DMMClient.iter_products_raw",
+                lambda: sum(
+                    1 for _ in client.iter_products_raw(site="FANZA", hits=100)
+                ),
+            ),
+            (
+                "DMMClient.iter_products",
+                lambda: sum(1 for _ in client.iter_products(site="FANZA", hits=100)),
+            ),
+            (
+                f"AsyncDMMClient.iter_products_raw (x{args.concurrency})",
+                lambda: asyncio.run(iterate_async(raw=True)),
+            ),
+            (
+                f"AsyncDMMClient.iter_products (x{args.concurrency})",
+                lambda: asyncio.run(iterate_async(raw=False)),
+            ),
+        ]
+
+        print(
+            f"{args.count} products in pages of 100, {args.latency * 1000:.0f} ms "
+            "server latency"
+        )
+        print(f"{'method':<42} {'seconds':>8} {'items/sec':>12}")
+
+        for name, run in cases:
+            start = time.perf_counter()
+            count = run()
+            seconds = time.perf_counter() - start
+
+            assert count == args.count, f"{name} returned {count} items"
+
+            print(f"{name:<42} {seconds:>8.2f} {count / seconds:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
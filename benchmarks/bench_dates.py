@@ -0,0 +1,58 @@
+"""
+Compare strptime with the fast date parser on the release date of every floor.
+
+Usage:
+    python -m benchmarks.bench_dates [--number 100000]
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from functools import partial
+from typing import Optional
+
+from py_dmmjp.dates import parse_datetime
+
+from .fixtures import load_product_fixtures
+
+STRPTIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+"Format Product.from_dict used to parse release dates with"
+
+
+def parse_with_strptime(value: str) -> Optional[datetime]:
+    """Parse a release date the way Product.from_dict used to."""
+
+    try:
+        return datetime.strptime(value, STRPTIME_FORMAT)
+    except ValueError:
+        return None
+
+
+def main() -> None:
+    """Time both parsers on the recorded date of each service/floor."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(
+        f"{'floor':<20} {'date':<21} {'strptime ns':>12} {'fast ns':>9} {'speedup':>9}"
+    )
+
+    for item in load_product_fixtures():
+        value = item["date"]
+        timings = [
+            min(timeit.repeat(partial(parse, value), number=args.number, repeat=3))
+            / args.number
+            * 1e9
+            for parse in (parse_with_strptime, parse_datetime)
+        ]
+
+        print(
+            f"{item['floor_code']:<20} {value:<21} {timings[0]:>12.0f} "
+            f"{timings[1]:>9.0f} {timings[0] / timings[1]:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
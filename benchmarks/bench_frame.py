@@ -0,0 +1,86 @@
+"""
+Compare queries over Product lists with the same queries over a ProductFrame.
+
+Requires numpy (`pip install py-dmmjp[numpy]`).
+
+Usage:
+    python -m benchmarks.bench_frame [--count 100000] [--repeat 5]
+"""
+
+import argparse
+import math
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from py_dmmjp import Product
+from py_dmmjp.frame import ProductFrame
+
+from .fixtures import load_product_fixtures
+
+
+def main() -> None:
+    """Time filtering, sorting and aggregating on both representations."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fixtures = load_product_fixtures()
+    items = [fixtures[i % len(fixtures)] for i in range(args.count)]
+    products = [Product.from_dict(item, keep_raw=False) for item in items]
+    frame = ProductFrame.from_items(items)
+
+    def mean_price_loop() -> float:
+        prices = [p.current_price for p in products if p.current_price is not None]
+
+        return sum(prices) / len(prices)
+
+    def top_rated_loop() -> List[str]:
+        rated = [p for p in products if p.review_average is not None]
+        rated.sort(key=lambda p: p.review_average or 0.0, reverse=True)
+
+        return [p.content_id for p in rated[:100]]
+
+    queries: List[Tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        (
+            "filter price < 1000",
+            lambda: [p for p in products if (p.current_price or math.inf) < 1000],
+            lambda: frame[frame.current_price < 1000],
+        ),
+        (
+            "filter floor videoa",
+            lambda: [p for p in products if p.floor_code == "videoa"],
+            lambda: frame[frame.floor_code.isin("videoa")],
+        ),
+        ("mean price", mean_price_loop, lambda: frame.current_price.mean()),
+        (
+            "top 100 by rating",
+            top_rated_loop,
+            lambda: frame.sort_by("review_average", descending=True).content_id[:100],
+        ),
+        (
+            "count per floor",
+            lambda: {
+                code: sum(p.floor_code == code for p in products)
+                for code in {p.floor_code for p in products}
+            },
+            lambda: frame.floor_code.value_counts(),
+        ),
+    ]
+
+    print(f"{args.count} products built from the recorded fixtures")
+    print(f"{'query':<22} {'products ms':>12} {'frame ms':>10} {'speedup':>10}")
+
+    for name, loop, vectorized in queries:
+        loop_seconds = min(timeit.repeat(loop, number=1, repeat=args.repeat))
+        frame_seconds = min(timeit.repeat(vectorized, number=1, repeat=args.repeat))
+
+        print(
+            f"{name:<22} {loop_seconds * 1000:>12.2f} {frame_seconds * 1000:>10.2f} "
+            f"{loop_seconds / frame_seconds:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
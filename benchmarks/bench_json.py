@@ -0,0 +1,61 @@
+"""
+Compare JSON backends on a 100-item ItemList response.
+
+Usage:
+    python -m benchmarks.bench_json [--hits 100] [--repeat 200]
+"""
+
+import argparse
+import json
+import timeit
+from typing import Callable, Dict
+
+from py_dmmjp.jsonlib import JSON_BACKENDS, get_json_loads
+
+from .fixtures import make_item_list_body
+
+
+def main() -> None:
+    """Time every installed JSON backend on the same raw response body."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hits", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    body = make_item_list_body(args.hits)
+    candidates: Dict[str, Callable[[], object]] = {
+        "json (text)": lambda: json.loads(body.decode("utf-8")),
+    }
+
+    missing = []
+
+    for name in JSON_BACKENDS:
+        try:
+            loads = get_json_loads(name)
+        except ImportError:
+            missing.append(name)
+            continue
+
+        candidates[f"{name} (bytes)"] = lambda loads=loads: loads(body)  # type: ignore[misc]
+
+    print(f"ItemList body: {args.hits} items, {len(body) / 1024:.1f} KiB")
+    print(f"{'backend':<14} {'ms/parse':>10} {'MiB/s':>10} {'speedup':>10}")
+
+    baseline = None
+
+    for name, parse in candidates.items():
+        seconds = min(timeit.repeat(parse, number=args.repeat, repeat=5)) / args.repeat
+        baseline = baseline or seconds
+
+        print(
+            f"{name:<14} {seconds * 1000:>10.3f} "
+            f"{len(body) / seconds / 2**20:>10.1f} {baseline / seconds:>9.2f}x"
+        )
+
+    if missing:
+        print(f"Not installed: {', '.join(missing)}")
+
+
+if __name__ == "__main__":
+    main()
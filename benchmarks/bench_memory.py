@@ -0,0 +1,105 @@
+"""
+Compare the memory held by the dataclass models, their compact variants and
+products parsed with an Interner.
+
+Usage:
+    python -m benchmarks.bench_memory [--count 5000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+from typing import Any, Callable, List, Optional, Tuple
+
+from py_dmmjp import Interner, ItemInfo, Product
+from py_dmmjp.compact import CompactItemInfo, CompactProduct
+from py_dmmjp.jsonlib import default_json_loads
+
+from .fixtures import load_product_fixtures
+
+
+def measure(build: Callable[[], List[Any]]) -> int:
+    """
+    Measure the memory still allocated by the objects `build` returns.
+
+    Args:
+        build: Function creating the objects to measure.
+
+    Returns:
+        Bytes held by the returned objects.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        objects = build()
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del objects
+
+    return held
+
+
+def main() -> None:
+    """Report per-object memory of ItemInfo and Product variants."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    fixtures = load_product_fixtures()
+    # Products are decoded from their own JSON body, as in a crawl, so that the
+    # strings they keep are fresh objects instead of the shared fixture strings.
+    bodies = [json.dumps(fixtures[i % len(fixtures)]) for i in range(args.count)]
+    infos = [
+        info
+        for item in fixtures
+        for values in item.get("iteminfo", {}).values()
+        for info in values
+    ]
+    infos = [infos[i % len(infos)] for i in range(args.count)]
+
+    def products(model: Any, interner: Optional[Interner] = None) -> List[Any]:
+        return [
+            model.from_dict(default_json_loads(body), keep_raw=False, interner=interner)
+            for body in bodies
+        ]
+
+    # The interner outlives the build, so its table is counted like a client's.
+    interner = Interner()
+
+    # (name, name of the variant it is compared to, build)
+    candidates: List[Tuple[str, str, Callable[[], List[Any]]]] = [
+        ("ItemInfo", "", lambda: [ItemInfo.from_dict(i) for i in infos]),
+        (
+            "CompactItemInfo",
+            "ItemInfo",
+            lambda: [CompactItemInfo.from_dict(i) for i in infos],
+        ),
+        ("Product", "", lambda: products(Product)),
+        ("CompactProduct", "Product", lambda: products(CompactProduct)),
+        ("Product+Interner", "Product", lambda: products(Product, interner)),
+    ]
+
+    print(f"{args.count} objects per model, built from the recorded fixtures")
+    print(f"{'model':<18} {'bytes/object':>14} {'saving':>10}")
+
+    results = {}
+
+    for name, reference, build in candidates:
+        results[name] = measure(build) / args.count
+        saving = (
+            f"{1 - results[name] / results[reference]:>9.0%}"
+            if reference
+            else f"{'':>9}"
+        )
+
+        print(f"{name:<18} {results[name]:>14.0f} {saving:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Measure parsing and serialization throughput over the recorded fixtures.
+
+Every case reports items/sec and the peak memory allocated while it runs. Save
+the results of a release with `--save` and compare a later run against them with
+`--compare`: the command exits with status 1 if a case got slower or allocates
+more than the tolerance allows, so parsing regressions are caught before release.
+
+Usage:
+    python -m benchmarks.bench_parse [--hits 100] [--repeat 5]
+        [--save results.json] [--compare results.json] [--tolerance 0.25]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from py_dmmjp import (
+    ActressSearchResponse,
+    GenreSearchResponse,
+    Product,
+    ProductApiResponse,
+)
+
+from .fixtures import make_item_list_response, make_search_response
+
+Case = Tuple[str, int, Callable[[], Any]]
+"Name, number of items handled per call, and the call to measure"
+
+
+def build_cases(hits: int) -> List[Case]:
+    """
+    Build the benchmark cases.
+
+    Args:
+        hits: Number of items in every response.
+
+    Returns:
+        Cases to measure, in report order.
+    """
+
+    item_list = make_item_list_response(hits)
+    items = item_list["result"]["items"]
+    products = [Product.from_dict(item) for item in items]
+    actresses = make_search_response("test_actress_*.py", "actress", hits)
+    genres = make_search_response("test_genre_search_response_*.py", "genre", hits)
+
+    return [
+        ("Product.from_dict", hits, lambda: [Product.from_dict(i) for i in items]),
+        (
+            "Product.from_dict(keep_raw=False)",
+            hits,
+            lambda: [Product.from_dict(i, keep_raw=False) for i in items],
+        ),
+        (
+            "Product.from_dict(lazy=True)",
+            hits,
+            lambda: [Product.from_dict(i, lazy=True) for i in items],
+        ),
+        (
+            "ProductApiResponse.from_dict",
+            hits,
+            lambda: ProductApiResponse.from_dict(item_list),
+        ),
+        (
+            "ActressSearchResponse.from_dict",
+            hits,
+            lambda: ActressSearchResponse.from_dict(actresses),
+        ),
+        (
+            "GenreSearchResponse.from_dict",
+            hits,
+            lambda: GenreSearchResponse.from_dict(genres),
+        ),
+        ("Product.to_dict", hits, lambda: [p.to_dict() for p in products]),
+    ]
+
+
+def measure_peak(run: Callable[[], Any]) -> int:
+    """
+    Measure the peak memory allocated by one call.
+
+    Args:
+        run: Call to measure.
+
+    Returns:
+        Peak bytes allocated during the call, including its result.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+
+    return peak
+
+
+def run_cases(cases: List[Case], repeat: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure the throughput and peak memory of every case.
+
+    Args:
+        cases: Cases to measure.
+        repeat: Number of timing runs; the fastest one is kept.
+
+    Returns:
+        Results keyed by case name, with 'items_per_sec' and 'peak_bytes'.
+    """
+
+    results = {}
+
+    for name, count, run in cases:
+        timer = timeit.Timer(run)
+        number, _ = timer.autorange()
+        seconds = min(timer.repeat(number=number, repeat=repeat)) / number
+
+        results[name] = {
+            "items_per_sec": count / seconds,
+            "peak_bytes": float(measure_peak(run)),
+        }
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """
+    Find the cases that regressed against a baseline.
+
+    Args:
+        results: Results of this run.
+        baseline: Results of a previous run.
+        tolerance: Allowed relative drop of items/sec and growth of peak memory.
+
+    Returns:
+        One message per regression.
+    """
+
+    regressions = []
+
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+
+        speed = result["items_per_sec"] / baseline[name]["items_per_sec"]
+        memory = result["peak_bytes"] / baseline[name]["peak_bytes"]
+
+        if speed < 1 - tolerance:
+            regressions.append(f"{name}: {1 - speed:.0%} fewer items/sec")
+
+        if memory > 1 + tolerance:
+            regressions.append(f"{name}: {memory - 1:.0%} more peak memory")
+
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, report it, and optionally save or compare the results."""
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--hits", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", type=Path, help="write the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="JSON file of a previous run")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run_cases(build_cases(args.hits), args.repeat)
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    print(f"{args.hits} items per call, built from the recorded fixtures")
+    print(f"{'case':<34} {'items/sec':>12} {'peak KiB':>10} {'vs baseline':>12}")
+
+    for name, result in results.items():
+        change = ""
+
+        if name in baseline:
+            ratio = result["items_per_sec"] / baseline[name]["items_per_sec"]
+            change = f"{ratio:.2f}x"
+
+        print(
+            f"{name:<34} {result['items_per_sec']:>12,.0f} "
+            f"{result['peak_bytes'] / 1024:>10.1f} {change:>12}"
+        )
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2) + "\n")
+
+    regressions = compare(results, baseline, args.tolerance)
+
+    if regressions:
+        print("Regressions:")
+        print("\n".join(f"  {message}" for message in regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
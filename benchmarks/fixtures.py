@@ -0,0 +1,121 @@
+"""
+Benchmark payloads built from the recorded product fixtures in `tests/`.
+"""
+
+import ast
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+TESTS_DIR = Path(__file__).resolve().parent.parent / "tests"
+"Directory holding the recorded `test_product_*.py` fixtures"
+
+
+def load_fixtures(pattern: str, name: str) -> List[Dict[str, Any]]:
+    """
+    Load the pytest fixtures named `name` from the test files matching `pattern`.
+
+    The fixtures are extracted with `ast` and evaluated on their own (they are
+    dict literals, some with concatenated strings), so the benchmarks neither
+    depend on pytest nor run any test code.
+
+    Args:
+        pattern: Glob of the test files in `tests/` (e.g., 'test_product_*.py').
+        name: Name of the fixture function (e.g., 'product_data').
+
+    Returns:
+        Value returned by every matching fixture, in file order.
+    """
+
+    values = []
+
+    for path in sorted(TESTS_DIR.glob(pattern)):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.FunctionDef) and node.name == name:
+                returned = next(n for n in ast.walk(node) if isinstance(n, ast.Return))
+                expression = ast.Expression(returned.value)  # type: ignore[arg-type]
+                code = compile(expression, str(path), "eval")
+                data = eval(code, {"__builtins__": {}})  # pylint: disable=eval-used
+                values.append(data)
+
+    return values
+
+
+def load_product_fixtures() -> List[Dict[str, Any]]:
+    """
+    Load every recorded product item from the product tests.
+
+    Returns:
+        Product items as returned by the ItemList API, one per service/floor.
+    """
+
+    return load_fixtures("test_product_*.py", "product_data")
+
+
+def make_search_response(pattern: str, key: str, hits: int = 100) -> Dict[str, Any]:
+    """
+    Build a search response by cycling through the items of recorded responses.
+
+    Args:
+        pattern: Glob of the test files holding `response_data` fixtures (e.g.,
+                 'test_actress_*.py').
+        key: Key of the item list in the response result (e.g., 'actress').
+        hits: Number of items in the built response.
+
+    Returns:
+        Decoded response, with the request and result fields of the first
+        recorded response.
+    """
+
+    responses = load_fixtures(pattern, "response_data")
+    items = [item for response in responses for item in response["result"][key]]
+    result = dict(responses[0]["result"])
+    result.update(
+        result_count=hits,
+        total_count=str(hits),
+        **{key: [items[i % len(items)] for i in range(hits)]},
+    )
+
+    return {"request": responses[0]["request"], "result": result}
+
+
+def make_item_list_response(hits: int = 100) -> Dict[str, Any]:
+    """
+    Build a full ItemList response by cycling through the recorded products.
+
+    Args:
+        hits: Number of items in the response (the API allows up to 100).
+
+    Returns:
+        Decoded ItemList response.
+    """
+
+    fixtures = load_product_fixtures()
+    items = [fixtures[i % len(fixtures)] for i in range(hits)]
+
+    return {
+        "request": {"parameters": {"site": "FANZA", "hits": str(hits)}},
+        "result": {
+            "status": 200,
+            "result_count": hits,
+            "total_count": 50000,
+            "first_position": 1,
+            "items": items,
+        },
+    }
+
+
+def make_item_list_body(hits: int = 100) -> bytes:
+    """
+    Encode an ItemList response the way the API sends it over the wire.
+
+    Args:
+        hits: Number of items in the response.
+
+    Returns:
+        UTF-8 encoded JSON body.
+    """
+
+    return json.dumps(make_item_list_response(hits)).encode("utf-8")
@@ -20,11 +20,30 @@ from .actress import (
     ActressSearchResult,
 )
 from .author import Author, AuthorSearchResponse, AuthorSearchResult
+from .cache import CacheBackend, MemoryCache, SQLiteCache
 from .client import DMMClient
 from .commons import ApiRequest, RequestParameters
-from .exceptions import DMMAPIError, DMMAuthError, DMMError
+from .compact import (
+    CompactActress,
+    CompactAuthor,
+    CompactFloor,
+    CompactGenre,
+    CompactItemInfo,
+    CompactMaker,
+    CompactProduct,
+    CompactSeries,
+    to_compact,
+)
+from .exceptions import (
+    DMMAPIError,
+    DMMAuthError,
+    DMMConnectionError,
+    DMMError,
+    DMMTimeoutError,
+)
 from .floor import Floor, FloorListResponse, FloorListResult, Service, Site
 from .genre import Genre, GenreSearchResponse, GenreSearchResult
+from .interning import Interner
 from .maker import Maker, MakerSearchResponse, MakerSearchResult
 from .product import (
     Campaign,
@@ -34,6 +53,7 @@ from .product import (
     ImageURL,
     ItemDetails,
     ItemInfo,
+    LazyProduct,
     Prices,
     Product,
     ProductApiResponse,
@@ -44,7 +64,16 @@ from .product import (
     SampleMovieURL,
     TachiyomiInfo,
 )
+from .ratelimit import RateLimit, TokenBucket
+from .retry import RetryPolicy
 from .series import Series, SeriesSearchResponse, SeriesSearchResult
+from .transport import (
+    AsyncConnectionPool,
+    AsyncTransport,
+    ConnectionPool,
+    Transport,
+    TransportResponse,
+)
 
 if sys.version_info >= (3, 9):
     from .async_client import AsyncDMMClient
@@ -57,7 +86,22 @@ __all__ = [
     "DMMError",
     "DMMAPIError",
     "DMMAuthError",
+    "DMMTimeoutError",
+    "DMMConnectionError",
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "RateLimit",
+    "TokenBucket",
+    "RetryPolicy",
+    "ConnectionPool",
+    "AsyncConnectionPool",
+    "Transport",
+    "AsyncTransport",
+    "TransportResponse",
+    "Interner",
     "Product",
+    "LazyProduct",
     "ProductApiResponse",
     "ProductApiResult",
     "RequestParameters",
@@ -96,4 +140,13 @@ __all__ = [
     "Maker",
     "MakerSearchResponse",
     "MakerSearchResult",
+    "CompactProduct",
+    "CompactItemInfo",
+    "CompactActress",
+    "CompactFloor",
+    "CompactGenre",
+    "CompactSeries",
+    "CompactAuthor",
+    "CompactMaker",
+    "to_compact",
 ]
@@ -3,9 +3,23 @@ Async client class for the py-dmm library.
 """
 
 import asyncio
-import json
 import sys
-from typing import Any, Dict, List, Literal, Optional, cast
+from collections import deque
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 if sys.version_info < (3, 9):  # pragma: no cover
     raise ImportError(
@@ -18,18 +32,193 @@ from aiohttp import ClientTimeout
 
 from .actress import Actress, ActressSearchParams, ActressSearchResponse
 from .author import Author, AuthorSearchParams, AuthorSearchResponse
+from .cache import CacheBackend, is_cacheable_response, make_cache_key
+from .commons import DMM_API_BASE_URL
 from .exceptions import DMMAPIError, DMMAuthError, DMMError
 from .floor import FloorListResponse, Site
 from .genre import Genre, GenreSearchParams, GenreSearchResponse
+from .interning import Interner
+from .jsonlib import JSONLoads, default_json_loads
 from .maker import Maker, MakerSearchParams, MakerSearchResponse
-from .product import Product, ProductSearchParams
+from .product import (
+    ITEM_LIST_MAX_HITS,
+    ITEM_LIST_MAX_OFFSET,
+    Product,
+    ProductSearchParams,
+)
+from .ratelimit import RateLimit, TokenBucket, get_token_bucket
+from .retry import RetryPolicy
 from .series import Series, SeriesSearchParams, SeriesSearchResponse
+from .sharding import DateWindow
+from .singleflight import AsyncSingleFlight
+from .transport import (
+    AsyncConnectionPool,
+    AsyncTransport,
+    TransportResponse,
+    check_response,
+    translate_errors,
+)
 
 try:
     from typing import Unpack
 except ImportError:  # pragma: no cover
     from typing_extensions import Unpack
 
+if sys.version_info >= (3, 10):
+    from contextlib import aclosing
+else:  # pragma: no cover
+    from contextlib import asynccontextmanager
+
+    @asynccontextmanager
+    async def aclosing(thing: Any) -> AsyncIterator[Any]:
+        """Close an async generator when the block exits, like Python 3.10's."""
+
+        try:
+            yield thing
+        finally:
+            await thing.aclose()
+
+
+class AiohttpTransport(AsyncTransport):
+    """Default AsyncDMMClient transport, sending requests over an aiohttp session."""
+
+    timeout_errors = (aiohttp.ServerTimeoutError, asyncio.TimeoutError)
+    connection_errors = (aiohttp.ClientConnectionError,)
+    request_errors = (aiohttp.ClientError,)
+
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        max_response_size: Optional[int] = None,
+        pool: Optional[AsyncConnectionPool] = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            session: Session to send requests over. It is used as-is and is not
+                     closed by the transport. By default, the transport creates
+                     (and closes) its own on first use.
+            timeout: Total request timeout in seconds.
+            headers: Headers sent by the session the transport creates.
+            max_response_size: Optional limit in bytes on a response body. Larger
+                               responses are abandoned with a DMMAPIError.
+            pool: Connection pool of the sessions the transport creates.
+
+        Raises:
+            ValueError: If both a session and a pool are given.
+        """
+
+        if session is not None and pool is not None:
+            raise ValueError("A connection pool cannot be set on a given session")
+
+        self.owns_session = session is None
+        self.session = session
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.max_response_size = max_response_size
+        self.pool = pool
+
+    async def ensure_session(self) -> aiohttp.ClientSession:
+        """
+        Ensure that a session exists, creating one if necessary.
+
+        Returns:
+            aiohttp.ClientSession: The active session.
+        """
+
+        if self.owns_session and (self.session is None or self.session.closed):
+            self.session = aiohttp.ClientSession(
+                connector=self._make_connector(),
+                headers=self.headers,
+                timeout=ClientTimeout(total=self.timeout),
+            )
+
+        return cast(aiohttp.ClientSession, self.session)
+
+    def _make_connector(self) -> Optional[aiohttp.TCPConnector]:
+        """Create the connector configured by `pool`, if any."""
+
+        pool = self.pool
+
+        if pool is None:
+            return None
+
+        # aiohttp rejects a keep-alive timeout on connectors that force close.
+        keep_alive: Dict[str, Any] = (
+            {"keepalive_timeout": pool.keepalive_timeout}
+            if pool.keep_alive
+            else {"force_close": True}
+        )
+
+        return aiohttp.TCPConnector(
+            limit=pool.limit,
+            limit_per_host=pool.limit_per_host,
+            use_dns_cache=pool.use_dns_cache,
+            ttl_dns_cache=pool.ttl_dns_cache,
+            **keep_alive,
+        )
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        """Send a GET request over the session."""
+
+        session = await self.ensure_session()
+
+        async with session.get(url, params=params) as response:
+            if response.status in (401, 403):
+                return TransportResponse(response.status, b"")
+
+            return TransportResponse(response.status, await self._read_body(response))
+
+    async def _read_body(self, response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read the raw response body, enforcing `max_response_size` if set.
+
+        Args:
+            response: Response whose body has not been read yet.
+
+        Returns:
+            The response body.
+
+        Raises:
+            DMMAPIError: If the body is larger than `max_response_size`.
+        """
+
+        limit = self.max_response_size
+
+        if limit is None:
+            return await response.read()
+
+        too_large = DMMAPIError(
+            f"Response body exceeds max_response_size ({limit} bytes)",
+            status_code=response.status,
+        )
+
+        if response.content_length is not None and response.content_length > limit:
+            raise too_large
+
+        chunks: List[bytes] = []
+        size = 0
+
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            size += len(chunk)
+
+            if size > limit:
+                raise too_large
+
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    async def close(self) -> None:
+        """Close the session, if the transport created it."""
+
+        if self.owns_session and self.session and not self.session.closed:
+            await self.session.close()
+            self.session = None
+
 
 class AsyncDMMClient:
     """
@@ -41,6 +230,20 @@ class AsyncDMMClient:
         api_key: str,
         affiliate_id: str,
         timeout: int = 10,
+        cache: Optional[CacheBackend] = None,
+        *,
+        coalesce: bool = True,
+        rate_limit: Optional[Union[RateLimit, TokenBucket]] = None,
+        retry: Optional[RetryPolicy] = None,
+        max_response_size: Optional[int] = None,
+        json_loads: Optional[JSONLoads] = None,
+        lazy_products: bool = False,
+        keep_raw: Optional[bool] = None,
+        interner: Optional[Interner] = None,
+        base_url: str = DMM_API_BASE_URL,
+        session: Optional[aiohttp.ClientSession] = None,
+        transport: Optional[AsyncTransport] = None,
+        pool: Optional[AsyncConnectionPool] = None,
     ) -> None:
         """
         Initialize the async DMM client.
@@ -49,9 +252,44 @@ class AsyncDMMClient:
             api_key: Your DMM API key for authentication.
             affiliate_id: Your DMM affiliate ID.
             timeout: Request timeout in seconds.
+            cache: Optional response cache (e.g., MemoryCache). Responses are keyed
+                   on endpoint and parameters, excluding the API key.
+            coalesce: Whether identical concurrent requests share a single HTTP call
+                      instead of each sending their own.
+            rate_limit: Optional client-side rate limit. A RateLimit is enforced by a
+                        token bucket shared with every client using the same API key
+                        and rate; pass a TokenBucket to control sharing explicitly.
+            retry: Optional policy for retrying timeouts, connection errors and
+                   transient HTTP statuses. Failures are not retried by default.
+            max_response_size: Optional limit in bytes on a response body. Larger
+                               responses are abandoned with a DMMAPIError.
+            json_loads: Optional function decoding raw response bytes (e.g., from
+                        `get_json_loads`). Defaults to orjson when installed.
+            lazy_products: Whether to return LazyProduct objects, whose date and
+                           nested models are parsed on first access.
+            keep_raw: Whether products keep a copy of their raw API item as
+                      `raw_data`. By default, products from `get_products` keep it
+                      and products streamed by `iter_products`/`crawl_products`
+                      do not.
+            interner: Optional Interner shared by every product the client parses,
+                      so equal ItemInfo records and repeated strings (service and
+                      floor names, ...) are stored once.
+            base_url: Base URL of the API, e.g., of a FakeDMMServer for offline
+                      load tests and benchmarks.
+            session: Optional `aiohttp.ClientSession` to send requests over (e.g.,
+                     from `Cassette.client_session()`). It is used as-is and is
+                     not closed by the client.
+            transport: Optional AsyncTransport sending the requests instead of an
+                       aiohttp session (e.g., over httpx or an in-process fake).
+                       It is closed with the client.
+            pool: Optional AsyncConnectionPool settings (connection limits, DNS
+                  cache, keep-alive) of the session the client creates.
+                  Defaults to the settings of aiohttp, i.e., 100 connections.
 
         Raises:
             DMMAuthError: If the API key is invalid or missing.
+            ValueError: If a session or transport is given along with a
+                        transport or pool.
         """
 
         if (
@@ -62,32 +300,65 @@ class AsyncDMMClient:
         ):
             raise DMMAuthError("API_KEY and AFFILIATE_KEY are required")
 
+        if transport is not None and (session is not None or pool is not None):
+            raise ValueError("A transport cannot be combined with a session or pool")
+
         self._api_key = api_key
         self._affiliate_id = affiliate_id
-        self._base_url = "https://api.dmm.com/affiliate/v3"
+        self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._cache = cache
+        self._rate_limiter = (
+            get_token_bucket(api_key, rate_limit)
+            if isinstance(rate_limit, RateLimit)
+            else rate_limit
+        )
+        self._flights: Optional[AsyncSingleFlight[Dict[str, Any]]] = (
+            AsyncSingleFlight() if coalesce else None
+        )
+        self._retry = retry
+        self._json_loads = json_loads or default_json_loads
+        self._lazy_products = lazy_products
+        self._keep_raw = keep_raw
+        self._interner = interner
         self._headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._transport: AsyncTransport = transport or AiohttpTransport(
+            session, timeout, self._headers, max_response_size, pool
+        )
+        self._page_tasks: Set["asyncio.Task[Dict[str, Any]]"] = set()
+
+    @property
+    def _session(self) -> Optional[aiohttp.ClientSession]:
+        """The aiohttp session of the default transport, if created."""
+
+        if not isinstance(self._transport, AiohttpTransport):
+            raise AttributeError("The client does not send requests over a session")
+
+        return self._transport.session
+
+    @_session.deleter
+    def _session(self) -> None:
+        """Detach the session from the default transport, without closing it."""
+
+        if isinstance(self._transport, AiohttpTransport):
+            self._transport.session = None
 
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """
-        Ensure that a session exists, creating one if necessary.
+        Ensure that the default transport has a session, creating one if necessary.
 
         Returns:
             aiohttp.ClientSession: The active session.
         """
 
-        if self._session is None or self._session.closed:
-            timeout = ClientTimeout(total=self._timeout)
-            self._session = aiohttp.ClientSession(
-                headers=self._headers, timeout=timeout
-            )
+        if not isinstance(self._transport, AiohttpTransport):
+            raise AttributeError("The client does not send requests over a session")
 
-        return self._session
+        return await self._transport.ensure_session()
 
     def _prepare_params(
         self, params: Optional[Dict[str, Any]] = None
@@ -111,18 +382,18 @@ class AsyncDMMClient:
 
         return params
 
-    def _load_json_from_response(self, response_text: str) -> Dict[str, Any]:
+    def _load_json_from_response(self, response_body: bytes) -> Dict[str, Any]:
         """
-        Load JSON data from the response text.
+        Load JSON data from the raw response body.
 
         Args:
-            response_text: The raw response text from the API.
+            response_body: The raw response bytes from the API.
         Returns:
             JSON data as a dictionary.
         """
 
         try:
-            return cast(Dict[str, Any], json.loads(response_text))
+            return cast(Dict[str, Any], self._json_loads(response_body))
         except ValueError as e:
             raise DMMAPIError("Error while formatting DMM Response") from e
 
@@ -139,45 +410,115 @@ class AsyncDMMClient:
             params: Query parameters to include.
 
         Returns:
-            JSON response data.
+            JSON response data, served from the cache when one is configured or
+            shared with an identical request already in flight.
 
         Raises:
             DMMAPIError: If the API request fails.
             DMMAuthError: If authentication fails.
         """
 
-        url = f"{self._base_url}{endpoint}"
         prep_params = self._prepare_params(params)
-        session = await self._ensure_session()
 
-        try:
-            async with session.get(url, params=prep_params) as response:
-                print(await response.text())
-                response_text = await response.text()
+        if self._cache is not None:
+            cached = self._cache.get(endpoint, prep_params)
 
-                if response.status == 401:
-                    raise DMMAuthError("Invalid API key or authentication failed")
+            if cached is not None:
+                return cached
 
-                if response.status == 403:
-                    raise DMMAuthError(
-                        "Access forbidden - check your API key permissions"
-                    )
+        if self._flights is None:
+            return await self._fetch(endpoint, prep_params)
 
-                if response.status >= 400:
-                    raise DMMAPIError(
-                        f"HTTP {response.status}: {response_text}",
-                        status_code=response.status,
-                        response_data=response_text,
-                    )
+        return await self._flights.do(
+            make_cache_key(endpoint, prep_params),
+            lambda: self._fetch(endpoint, prep_params),
+        )
 
-                return self._load_json_from_response(response_text)
+    async def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a request, retrying it if configured, and cache a successful response.
 
-        except aiohttp.ServerTimeoutError as e:
-            raise DMMAPIError("Request timed out") from e
-        except aiohttp.ClientConnectionError as e:
-            raise DMMAPIError("Connection error occurred") from e
-        except aiohttp.ClientError as e:
-            raise DMMAPIError(f"Request failed: {str(e)}") from e
+        Args:
+            endpoint: API endpoint to call.
+            params: Prepared query parameters.
+
+        Returns:
+            JSON response data.
+        """
+
+        if self._retry is None:
+            response_data = await self._attempt(endpoint, params)
+        else:
+            response_data = await self._retry.call_async(
+                lambda: self._attempt(endpoint, params)
+            )
+
+        if self._cache is not None and is_cacheable_response(response_data):
+            self._cache.set(endpoint, params, response_data)
+
+        return response_data
+
+    async def _attempt(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait for the rate limiter, then send a single request.
+
+        Args:
+            endpoint: API endpoint to call.
+            params: Prepared query parameters.
+
+        Returns:
+            JSON response data.
+        """
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+
+        return await self._send_request(f"{self._base_url}{endpoint}", params)
+
+    async def _send_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a GET request over the transport and decode the response.
+
+        Args:
+            url: Full URL of the endpoint.
+            params: Prepared query parameters, including authentication details.
+
+        Returns:
+            JSON response data.
+
+        Raises:
+            DMMAPIError: If the API request fails.
+            DMMAuthError: If authentication fails.
+        """
+
+        with translate_errors(self._transport):
+            response = await self._transport.get(url, params)
+
+        check_response(response)
+
+        return self._load_json_from_response(response.body)
+
+    def _parse_product(self, item: Dict[str, Any], bulk: bool) -> Product:
+        """
+        Build a Product from an ItemList item according to the client options.
+
+        Args:
+            item: Product item from an ItemList response.
+            bulk: Whether the product comes from a bulk path (e.g., iter_products),
+                  where raw items are dropped unless `keep_raw` is set.
+
+        Returns:
+            Product (or LazyProduct) instance.
+        """
+
+        keep_raw = self._keep_raw if self._keep_raw is not None else not bulk
+
+        return Product.from_dict(
+            item,
+            lazy=self._lazy_products,
+            keep_raw=keep_raw,
+            interner=self._interner,
+        )
 
     @property
     def app_id(self) -> str:
@@ -200,6 +541,39 @@ class AsyncDMMClient:
         """
         return self._affiliate_id
 
+    @property
+    def cache(self) -> Optional[CacheBackend]:
+        """
+        Get the response cache used by the client.
+
+        Returns:
+            The cache backend, or None if caching is disabled.
+        """
+
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """
+        Get the token bucket limiting the client's request rate.
+
+        Returns:
+            The token bucket, exposing wait-time metrics, or None if unlimited.
+        """
+
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Get the retry policy used by the client.
+
+        Returns:
+            The retry policy, exposing retry counters, or None if retries are off.
+        """
+
+        return self._retry
+
     async def get_products(
         self,
         **kwargs: Unpack[ProductSearchParams],
@@ -234,8 +608,372 @@ class AsyncDMMClient:
             DMMAuthError: If authentication fails or API key is invalid.
         """
 
+        try:
+            items = await self.get_products_raw(**kwargs)
+
+            return [self._parse_product(item, bulk=False) for item in items]
+
+        except Exception as e:
+            if isinstance(e, (DMMError, DMMAPIError, DMMAuthError)):
+                raise
+
+            raise DMMAPIError(f"Failed to get products: {str(e)}") from e
+
+    async def get_products_raw(
+        self,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the decoded product items asynchronously without building Products.
+
+        Takes the same parameters as `get_products` and goes through the same
+        cache, coalescing, rate limiting and retries, but returns the `items` list
+        of the ItemList response as decoded. Items may be shared with the response
+        cache and must be treated as read-only.
+
+        Args:
+            **kwargs: Product search parameters.
+
+        Returns:
+            List[Dict[str, Any]]: Product items, as returned by the API.
+
+        Raises:
+            DMMAPIError: If the API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
         params: Dict[str, Any] = {}
         params.update(kwargs)
+        result = await self._get_item_list(params)
+
+        return cast(List[Dict[str, Any]], result.get("items", []))
+
+    async def iter_products(
+        self,
+        *,
+        concurrency: int = 5,
+        ordered: bool = True,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> AsyncGenerator[Product, None]:
+        """
+        Iterate over every product matching the search parameters asynchronously.
+
+        The first page is requested on its own to learn `total_count`; every later
+        page offset is then known up front, so those pages are fetched concurrently.
+        At most `concurrency` pages are in flight or buffered at any time, which keeps
+        memory bounded regardless of the size of the result set. Iteration stops at
+        the ItemList offset ceiling (50,000).
+
+        Args:
+            concurrency: Maximum number of pages requested at the same time.
+            ordered: Yield products in API order when True, or page by page as
+                     requests complete when False.
+            hits: Page size used while walking the result set. Default and maximum is 100.
+            offset: Position to start iterating from. Default is 1.
+            **kwargs: Any other product search parameters.
+
+        Yields:
+            Product: Each product of the result set.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+
+        Example:
+            >>> async with AsyncDMMClient(api_key="key", affiliate_id="id") as client:
+            ...     async for product in client.iter_products(
+            ...         site="FANZA", floor="videoa", concurrency=8
+            ...     ):
+            ...         print(product.content_id)
+        """
+
+        async with aclosing(
+            self.iter_products_raw(concurrency=concurrency, ordered=ordered, **kwargs)
+        ) as items:
+            async for item in items:
+                yield self._parse_product(item, bulk=True)
+
+    async def iter_products_raw(
+        self,
+        *,
+        concurrency: int = 5,
+        ordered: bool = True,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Iterate over the decoded items of every matching product asynchronously.
+
+        The raw counterpart of `iter_products`: pages are fetched the same way, but
+        items are yielded as decoded, without building Product objects. Items may
+        be shared with the response cache and must be treated as read-only.
+
+        Args:
+            concurrency: Maximum number of pages requested at the same time.
+            ordered: Yield items in API order when True, or page by page as
+                     requests complete when False.
+            **kwargs: Product search parameters.
+
+        Yields:
+            Dict[str, Any]: Each product item of the result set.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        params: Dict[str, Any] = {}
+        params.update(kwargs)
+
+        hits = min(int(params.pop("hits", ITEM_LIST_MAX_HITS)), ITEM_LIST_MAX_HITS)
+        offset = int(params.pop("offset", 1))
+
+        if offset > ITEM_LIST_MAX_OFFSET:
+            return
+
+        first_page = await self._get_item_list(
+            {**params, "hits": hits, "offset": offset}
+        )
+        items = first_page.get("items", [])
+
+        for item in items:
+            yield item
+
+        if not items:
+            return
+
+        total_count = int(first_page.get("total_count", 0))
+        next_offset = int(first_page.get("first_position", offset)) + len(items)
+        last_offset = min(total_count, ITEM_LIST_MAX_OFFSET)
+        offsets = range(next_offset, last_offset + 1, hits)
+
+        async with aclosing(
+            self._fan_out_item_list(params, hits, offsets, concurrency, ordered)
+        ) as pages:
+            async for page in pages:
+                for item in page.get("items", []):
+                    yield item
+
+    async def plan_product_shards(
+        self,
+        *,
+        concurrency: int = 5,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> List[ProductSearchParams]:
+        """
+        Split a product search into release date windows small enough to crawl asynchronously.
+
+        The `gte_date`/`lte_date` window of the search is recursively halved until
+        every shard holds at most `max_shard_size` products. Both halves of a split
+        are probed concurrently, with at most `concurrency` probes in flight.
+
+        Args:
+            concurrency: Maximum number of probe requests in flight.
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters. An existing date range is respected.
+
+        Returns:
+            List[ProductSearchParams]: Search parameters for each non-empty shard,
+            in chronological order.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        params: Dict[str, Any] = {}
+        params.update(kwargs)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def plan(window: DateWindow) -> List[ProductSearchParams]:
+            shard = {**params, **window.to_params()}
+
+            async with semaphore:
+                result = await self._get_item_list({**shard, "hits": 1, "offset": 1})
+
+            total_count = int(result.get("total_count", 0))
+
+            if total_count == 0:
+                return []
+
+            if total_count <= max_shard_size or not window.can_split():
+                return [cast(ProductSearchParams, shard)]
+
+            earlier, later = await asyncio.gather(*map(plan, window.split()))
+
+            return earlier + later
+
+        return await plan(DateWindow.from_params(params))
+
+    async def crawl_products(
+        self,
+        *,
+        concurrency: int = 5,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> AsyncGenerator[Product, None]:
+        """
+        Crawl every product of a search asynchronously, including result sets beyond 50,000 items.
+
+        The search is split with `plan_product_shards` and every shard is walked with
+        `iter_products`, fetching up to `concurrency` pages at once. Products that
+        show up in more than one shard are yielded only once, keyed by `content_id`.
+
+        Args:
+            concurrency: Maximum number of requests in flight.
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters.
+
+        Yields:
+            Product: Each distinct product of the search.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        async with aclosing(
+            self.crawl_products_raw(
+                concurrency=concurrency, max_shard_size=max_shard_size, **kwargs
+            )
+        ) as items:
+            async for item in items:
+                yield self._parse_product(item, bulk=True)
+
+    async def crawl_products_raw(
+        self,
+        *,
+        concurrency: int = 5,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Crawl the decoded items of every product of a search asynchronously.
+
+        The raw counterpart of `crawl_products`: shards are planned and walked the
+        same way, and duplicates are dropped by `content_id`, but items are yielded
+        as decoded. Items may be shared with the response cache and must be treated
+        as read-only.
+
+        Args:
+            concurrency: Maximum number of requests in flight.
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters.
+
+        Yields:
+            Dict[str, Any]: Each distinct product item of the search.
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        shards = await self.plan_product_shards(
+            concurrency=concurrency, max_shard_size=max_shard_size, **kwargs
+        )
+        seen: Set[str] = set()
+
+        for shard in shards:
+            async with aclosing(
+                self.iter_products_raw(concurrency=concurrency, **shard)
+            ) as items:
+                async for item in items:
+                    content_id = item.get("content_id", "")
+
+                    if content_id in seen:
+                        continue
+
+                    seen.add(content_id)
+
+                    yield item
+
+    async def _fan_out_item_list(
+        self,
+        params: Dict[str, Any],
+        hits: int,
+        offsets: Iterable[int],
+        concurrency: int,
+        ordered: bool,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Fetch ItemList pages at known offsets with a bounded number of requests in flight.
+
+        Args:
+            params: Product search parameters shared by every page.
+            hits: Page size for every request.
+            offsets: Start positions of the pages to fetch.
+            concurrency: Maximum number of pages requested at the same time.
+            ordered: Yield pages in offset order when True, or as they complete.
+
+        Yields:
+            The `result` section of each page.
+        """
+
+        remaining = iter(offsets)
+        pending: Deque["asyncio.Task[Dict[str, Any]]"] = deque()
+
+        def schedule() -> None:
+            page_offset = next(remaining, None)
+
+            if page_offset is not None:
+                task = asyncio.ensure_future(
+                    self._get_item_list({**params, "hits": hits, "offset": page_offset})
+                )
+                self._page_tasks.add(task)
+                task.add_done_callback(self._page_tasks.discard)
+                pending.append(task)
+
+        try:
+            for _ in range(concurrency):
+                schedule()
+
+            while pending:
+                if ordered:
+                    page = await pending.popleft()
+                else:
+                    done, _ = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    task = done.pop()
+                    pending.remove(task)
+                    page = task.result()
+
+                schedule()
+
+                yield page
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _get_item_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Request a single ItemList page and return its result section.
+
+        Args:
+            params: Product search parameters for the page.
+
+        Returns:
+            The `result` section of the API response.
+
+        Raises:
+            DMMAPIError: If the API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
 
         try:
             response_data = await self._make_request("/ItemList", params)
@@ -243,11 +981,7 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            result = response_data["result"]
-            items = result.get("items", [])
-            products = [Product.from_dict(item) for item in items]
-
-            return products
+            return cast(Dict[str, Any], response_data["result"])
 
         except Exception as e:
             if isinstance(e, (DMMError, DMMAPIError, DMMAuthError)):
@@ -329,7 +1063,7 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            floor_response = FloorListResponse.from_dict(response_data)
+            floor_response = FloorListResponse.from_dict(response_data, keep_raw=False)
             sites = floor_response.result.sites
 
             return sites
@@ -383,7 +1117,9 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            actress_response = ActressSearchResponse.from_dict(response_data)
+            actress_response = ActressSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return actress_response.actresses
 
@@ -426,7 +1162,9 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            genre_response = GenreSearchResponse.from_dict(response_data)
+            genre_response = GenreSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
             return genre_response.genres
 
         except Exception as e:
@@ -468,7 +1206,9 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            maker_response = MakerSearchResponse.from_dict(response_data)
+            maker_response = MakerSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return maker_response.makers
 
@@ -511,7 +1251,9 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            series_response = SeriesSearchResponse.from_dict(response_data)
+            series_response = SeriesSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return series_response.series
 
@@ -554,7 +1296,9 @@ class AsyncDMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            author_response = AuthorSearchResponse.from_dict(response_data)
+            author_response = AuthorSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return author_response.authors
 
@@ -566,26 +1310,42 @@ class AsyncDMMClient:
 
     async def close(self) -> None:
         """
-        Explicitly close the HTTP session.
+        Explicitly close the transport and its HTTP session, unless the session
+        was passed in as `session`.
+
+        Page requests still in flight for an iteration that was abandoned without
+        being closed are cancelled first. The client can be used again afterwards;
+        a new session is then created.
         """
 
-        if self._session and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        tasks = list(self._page_tasks)
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._transport.close()
 
     def __del__(self) -> None:
         """
         Destructor to clean up session if not properly closed.
         """
 
-        if hasattr(self, "_session") and self._session and not self._session.closed:
+        transport = getattr(self, "_transport", None)
+
+        if (
+            isinstance(transport, AiohttpTransport)
+            and transport.owns_session
+            and transport.session
+            and not transport.session.closed
+        ):
             try:
                 loop = asyncio.get_event_loop()
 
                 if loop.is_running():
-                    loop.create_task(self._session.close())
+                    loop.create_task(transport.close())
                 else:
-                    loop.run_until_complete(self._session.close())
+                    loop.run_until_complete(transport.close())
             except Exception as e:
                 raise DMMAPIError("Error occurred while closing the session") from e
 
@@ -597,7 +1357,8 @@ class AsyncDMMClient:
             AsyncDMMClient: The client instance for use in the context.
         """
 
-        await self._ensure_session()
+        if isinstance(self._transport, AiohttpTransport):
+            await self._transport.ensure_session()
 
         return self
 
@@ -0,0 +1,499 @@
+"""
+Response cache backends for the DMM API clients.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple, cast
+from urllib.parse import urlencode
+
+CACHE_KEY_EXCLUDED_PARAMS = frozenset({"api_id"})
+"Request parameters left out of cache keys so credentials never reach the cache"
+
+
+def make_cache_key(endpoint: str, params: Mapping[str, Any]) -> str:
+    """
+    Build a stable cache key from an endpoint and its query parameters.
+
+    Parameters are sorted and url-encoded, so the key does not depend on the order
+    in which they were passed, nor on whether numbers were given as int or str.
+
+    Args:
+        endpoint: API endpoint (e.g., '/ItemList').
+        params: Query parameters of the request.
+
+    Returns:
+        The cache key.
+    """
+
+    items = sorted(
+        (key, value)
+        for key, value in params.items()
+        if key not in CACHE_KEY_EXCLUDED_PARAMS and value is not None
+    )
+
+    return f"{endpoint}?{urlencode(items, doseq=True)}"
+
+
+def is_cacheable_response(data: Dict[str, Any]) -> bool:
+    """
+    Check whether a decoded API response may be stored in a cache.
+
+    Only responses with a `result` section and a successful (or absent) status are
+    cached, so transient API-level errors are never replayed from the cache.
+
+    Args:
+        data: Decoded API response.
+
+    Returns:
+        True if the response can be cached.
+    """
+
+    result = data.get("result")
+
+    if not isinstance(result, dict):
+        return False
+
+    return str(result.get("status", 200)) == "200"
+
+
+class CacheBackend(ABC):
+    """
+    Base class for response caches used by `DMMClient` and `AsyncDMMClient`.
+
+    Subclasses only implement raw key/value storage; keying, per-endpoint TTLs and
+    hit/miss accounting are handled here.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = 300.0,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ) -> None:
+        """
+        Initialize the cache backend.
+
+        Args:
+            ttl: Default time-to-live in seconds. None caches responses forever.
+            endpoint_ttls: Per-endpoint TTL overrides (e.g., {'/FloorList': 86400}).
+                           A TTL of 0 disables caching for that endpoint.
+        """
+
+        self.ttl = ttl
+        self.endpoint_ttls: Dict[str, Optional[float]] = dict(endpoint_ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """
+        Get the time-to-live that applies to an endpoint.
+
+        Args:
+            endpoint: API endpoint (e.g., '/ItemList').
+
+        Returns:
+            TTL in seconds, or None if responses never expire.
+        """
+
+        return self.endpoint_ttls.get(endpoint, self.ttl)
+
+    def get(self, endpoint: str, params: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response.
+
+        Args:
+            endpoint: API endpoint of the request.
+            params: Query parameters of the request.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+
+        if self.ttl_for(endpoint) == 0:
+            return None
+
+        value = self._get(make_cache_key(endpoint, params))
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return value
+
+    def set(
+        self, endpoint: str, params: Mapping[str, Any], value: Dict[str, Any]
+    ) -> None:
+        """
+        Store a response.
+
+        Args:
+            endpoint: API endpoint of the request.
+            params: Query parameters of the request.
+            value: Decoded API response.
+        """
+
+        ttl = self.ttl_for(endpoint)
+
+        if ttl == 0:
+            return
+
+        expires_at = None if ttl is None else time.time() + ttl
+
+        self._set(make_cache_key(endpoint, params), value, expires_at)
+
+    def delete(self, endpoint: str, params: Mapping[str, Any]) -> None:
+        """
+        Remove a cached response, if present.
+
+        Args:
+            endpoint: API endpoint of the request.
+            params: Query parameters of the request.
+        """
+
+        self._delete(make_cache_key(endpoint, params))
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups served from the cache."""
+
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset the hit and miss counters."""
+
+        with self._stats_lock:
+            self.hits = 0
+            self.misses = 0
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the unexpired value stored under key, or None."""
+
+    @abstractmethod
+    def _set(
+        self, key: str, value: Dict[str, Any], expires_at: Optional[float]
+    ) -> None:
+        """Store value under key until the expires_at timestamp (None for never)."""
+
+    @abstractmethod
+    def _delete(self, key: str) -> None:
+        """Remove the value stored under key, if any."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response."""
+
+
+class MemoryCache(CacheBackend):
+    """
+    Thread-safe in-memory cache with TTL expiry and least-recently-used eviction.
+
+    Cached responses are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = 300.0,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+    ) -> None:
+        """
+        Initialize the in-memory cache.
+
+        Args:
+            maxsize: Maximum number of responses kept before the least recently
+                     used one is evicted.
+            ttl: Default time-to-live in seconds. None caches responses forever.
+            endpoint_ttls: Per-endpoint TTL overrides. A TTL of 0 disables caching
+                           for that endpoint.
+        """
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[Optional[float], Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Get the number of cached responses, including expired ones not yet purged."""
+
+        return len(self._entries)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def _set(
+        self, key: str, value: Dict[str, Any], expires_at: Optional[float]
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache(CacheBackend):
+    """
+    Persistent cache stored in a single SQLite file, shareable across processes.
+
+    The database runs in WAL mode so many readers (e.g., gunicorn workers on one
+    host) can share hits while another process writes. Responses are stored as
+    zlib-compressed JSON together with their expiry timestamp. Call `vacuum`
+    periodically to purge expired rows and keep the file under `max_size_bytes`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: Optional[float] = 300.0,
+        endpoint_ttls: Optional[Mapping[str, Optional[float]]] = None,
+        *,
+        max_size_bytes: Optional[int] = None,
+        compress_level: int = 6,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize the SQLite cache, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            ttl: Default time-to-live in seconds. None caches responses forever.
+            endpoint_ttls: Per-endpoint TTL overrides. A TTL of 0 disables caching
+                           for that endpoint.
+            max_size_bytes: Size budget of the database file enforced by `vacuum`.
+                            When set, reads also track recency for LRU eviction.
+            compress_level: zlib compression level for stored responses (0-9).
+            timeout: Seconds to wait for a lock held by another connection.
+        """
+
+        super().__init__(ttl=ttl, endpoint_ttls=endpoint_ttls)
+
+        self.path = path
+        self.max_size_bytes = max_size_bytes
+        self.compress_level = compress_level
+        self.timeout = timeout
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )
+                """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the SQLite connection of the current thread and process.
+
+        Connections are never shared between threads, nor reused after a fork.
+
+        Returns:
+            An open connection in WAL mode.
+        """
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+
+        if conn is not None and getattr(self._local, "pid", None) == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+
+        return conn
+
+    def __len__(self) -> int:
+        """Get the number of stored responses, including expired ones not yet purged."""
+
+        row = self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()
+
+        return int(row[0])
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the current size of the database file in bytes."""
+
+        conn = self._connect()
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+
+        return int(page_count * page_size)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        value, expires_at = row
+        now = time.time()
+
+        if expires_at is not None and expires_at <= now:
+            self._delete(key)
+
+            return None
+
+        if self.max_size_bytes is not None:
+            with conn:
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                )
+
+        return cast(Dict[str, Any], json.loads(zlib.decompress(value)))
+
+    def _set(
+        self, key: str, value: Dict[str, Any], expires_at: Optional[float]
+    ) -> None:
+        payload = zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+                "utf-8"
+            ),
+            self.compress_level,
+        )
+
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, payload, expires_at, time.time()),
+            )
+
+    def _delete(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+        self._compact()
+
+    def vacuum(self) -> int:
+        """
+        Purge expired responses and evict least recently used ones over the size budget.
+
+        Safe to run from a cron job or background thread while other processes keep
+        using the cache. On a file created without incremental auto-vacuum, the
+        first call rebuilds the file once with a full VACUUM.
+
+        Returns:
+            Number of responses removed.
+        """
+
+        conn = self._connect()
+
+        with conn:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+
+        self._compact()
+
+        if self.max_size_bytes is None:
+            return removed
+
+        size = self.size_bytes
+
+        while size > self.max_size_bytes:
+            count = len(self)
+
+            if count == 0:
+                break
+
+            # drop the oldest quarter of the entries, then reclaim their pages
+            with conn:
+                removed += conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (max(1, count // 4),),
+                ).rowcount
+
+            self._compact()
+            previous_size, size = size, self.size_bytes
+
+            if size >= previous_size:
+                # the file cannot shrink any further, so evicting more would not help
+                break
+
+        return removed
+
+    def _compact(self) -> None:
+        """Return free pages to the file system and truncate the write-ahead log."""
+
+        conn = self._connect()
+
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # files created without incremental auto-vacuum are converted by a full
+            # VACUUM, once; until then incremental_vacuum frees nothing
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+
+        # executescript steps the pragma to completion; execute frees a single page
+        conn.executescript("PRAGMA incremental_vacuum;")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    def close(self) -> None:
+        """Close the connection of the current thread."""
+
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,435 @@
+"""
+Record/replay of DMM API responses, for deterministic offline benchmarks.
+
+A Cassette records the responses of real API calls to a compact file and
+replays them without network access. It plugs into the clients as their HTTP
+session: `Cassette.session()` for DMMClient and `Cassette.client_session()` for
+AsyncDMMClient.
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .cache import make_cache_key
+from .exceptions import DMMAPIError
+
+if TYPE_CHECKING:
+    import aiohttp
+
+CASSETTE_KEY_EXCLUDED_PARAMS = frozenset({"api_id", "affiliate_id"})
+"Request parameters left out of cassette keys, so recordings replay with any credentials"
+
+REDACTED_API_ID = "***REDACTED_APP_ID***"
+"Replacement of the API key in recorded response bodies"
+
+CassetteMode = Literal["record", "replay"]
+
+
+def cassette_key(url: str, params: Mapping[str, Any]) -> str:
+    """
+    Build the key a request is recorded and replayed under.
+
+    Only the endpoint name and the query parameters, without credentials, are
+    used, so a cassette recorded against the API replays against any base URL.
+    A parameter repeated in the query string (e.g., `article`) keeps all its
+    values, as when it is given as a list in `params`.
+
+    Args:
+        url: Request URL, with or without a query string.
+        params: Query parameters not included in the URL.
+
+    Returns:
+        The cassette key (e.g., '/ItemList?hits=100&offset=1&site=FANZA').
+    """
+
+    parts = urlsplit(url)
+    query: Dict[str, Any] = {}
+
+    for name, value in parse_qsl(parts.query, keep_blank_values=True):
+        query.setdefault(name, []).append(value)
+
+    query.update(params)
+    endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+
+    return make_cache_key(
+        f"/{endpoint}",
+        {k: v for k, v in query.items() if k not in CASSETTE_KEY_EXCLUDED_PARAMS},
+    )
+
+
+class Cassette:
+    """
+    Recorded API responses, replayed in the order they were recorded.
+
+    In "record" mode, requests are sent over the network and every response
+    (status and raw body) is recorded; `save` writes them to disk as gzipped
+    JSON lines, with the API key redacted from the bodies. In "replay" mode,
+    nothing is sent: each request gets the next response recorded for the same
+    endpoint and parameters, starting over after the last one. Replays are
+    thread-safe, so one cassette can serve several clients concurrently.
+
+    Example:
+        >>> cassette = Cassette("products.jsonl.gz", mode="record")
+        >>> with DMMClient(key, affiliate_id, session=cassette.session()) as client:
+        ...     list(client.iter_products(site="FANZA", floor="videoa"))
+        >>> cassette.save()
+        >>> replay = Cassette("products.jsonl.gz")
+        >>> client = DMMClient(key, affiliate_id, session=replay.session())
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, os.PathLike]] = None,
+        mode: CassetteMode = "replay",
+    ) -> None:
+        """
+        Initialize the cassette, loading `path` in replay mode.
+
+        Args:
+            path: Cassette file. Required to replay from or save to disk; an
+                  in-memory cassette can record and replay without one.
+            mode: "record" to send requests and record the responses, or
+                  "replay" to answer requests from the recorded responses.
+
+        Raises:
+            ValueError: If the mode is unknown.
+        """
+
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode {mode!r}")
+
+        self.path = path
+        self.mode = mode
+        self._interactions: List[Tuple[str, int, bytes]] = []
+        self._responses: Dict[str, List[Tuple[int, bytes]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay" and path is not None:
+            self.load(path)
+
+    def __len__(self) -> int:
+        """Get the number of recorded responses."""
+
+        return len(self._interactions)
+
+    def record(self, key: str, status: int, body: bytes) -> None:
+        """
+        Record a response.
+
+        Args:
+            key: Request key, from `cassette_key`.
+            status: HTTP status of the response.
+            body: Raw response body.
+        """
+
+        with self._lock:
+            self._interactions.append((key, status, body))
+            self._responses.setdefault(key, []).append((status, body))
+
+    def play(self, key: str) -> Tuple[int, bytes]:
+        """
+        Get the next recorded response to a request.
+
+        Args:
+            key: Request key, from `cassette_key`.
+
+        Returns:
+            HTTP status and raw body of the response.
+
+        Raises:
+            DMMAPIError: If no response was recorded for the request.
+        """
+
+        with self._lock:
+            responses = self._responses.get(key)
+
+            if not responses:
+                raise DMMAPIError(f"No recorded response for {key}")
+
+            position = self._positions.get(key, 0)
+            self._positions[key] = (position + 1) % len(responses)
+
+            return responses[position]
+
+    def rewind(self) -> None:
+        """Replay every request from its first recorded response again."""
+
+        with self._lock:
+            self._positions.clear()
+
+    def load(self, path: Union[str, os.PathLike]) -> None:
+        """
+        Load the responses recorded in a cassette file, after the current ones.
+
+        Args:
+            path: Cassette file written by `save`.
+        """
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                self.record(entry["key"], entry["status"], _decode_body(entry))
+
+    def save(self, path: Optional[Union[str, os.PathLike]] = None) -> None:
+        """
+        Write the recorded responses to a cassette file.
+
+        Args:
+            path: Cassette file; defaults to the cassette's `path`.
+
+        Raises:
+            ValueError: If no path is given and the cassette has none.
+        """
+
+        path = path if path is not None else self.path
+
+        if path is None:
+            raise ValueError("Cassette.save requires a path")
+
+        with self._lock:
+            interactions = list(self._interactions)
+
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            for key, status, body in interactions:
+                entry = {"key": key, "status": status, **_encode_body(body)}
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def session(self, session: Optional[requests.Session] = None) -> requests.Session:
+        """
+        Route the requests of a `requests` session through the cassette.
+
+        Args:
+            session: Session to mount the cassette on; a new one by default.
+
+        Returns:
+            The session, to pass to DMMClient as `session`.
+        """
+
+        session = session or requests.Session()
+        adapter = CassetteAdapter(self)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def client_session(
+        self, session: Optional["aiohttp.ClientSession"] = None
+    ) -> "aiohttp.ClientSession":
+        """
+        Wrap an aiohttp session so its GET requests go through the cassette.
+
+        Args:
+            session: Session sending the requests in record mode. Not needed in
+                     replay mode.
+
+        Returns:
+            Stand-in for the session, to pass to AsyncDMMClient as `session`.
+
+        Raises:
+            ValueError: If no session is given in record mode.
+        """
+
+        if self.mode == "record" and session is None:
+            raise ValueError("Recording with aiohttp requires a ClientSession")
+
+        return cast("aiohttp.ClientSession", CassetteClientSession(self, session))
+
+
+def _encode_body(body: bytes) -> Dict[str, str]:
+    """Store a body as text, or as base64 if it is not UTF-8 (e.g., a proxy error page)."""
+
+    try:
+        return {"body": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    """Get the body of a cassette file entry written by `_encode_body`."""
+
+    if "body_base64" in entry:
+        return base64.b64decode(entry["body_base64"])
+
+    return cast(str, entry["body"]).encode("utf-8")
+
+
+def _redact(body: bytes, api_id: Optional[str]) -> bytes:
+    """Replace the API key echoed in a response body."""
+
+    if not api_id:
+        return body
+
+    return body.replace(api_id.encode("utf-8"), REDACTED_API_ID.encode("utf-8"))
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter recording or replaying `requests` responses."""
+
+    def __init__(self, cassette: Cassette) -> None:
+        super().__init__()
+        self.cassette = cassette
+        self._http = HTTPAdapter()
+
+    def send(  # type: ignore[override]  # pylint: disable=arguments-differ
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """Record the response to a request, or replay it."""
+
+        url = request.url or ""
+        key = cassette_key(url, {})
+
+        if self.cassette.mode == "record":
+            response = self._http.send(request, **kwargs)
+            api_id = dict(parse_qsl(urlsplit(url).query)).get("api_id")
+            self.cassette.record(
+                key, response.status_code, _redact(response.content, api_id)
+            )
+
+            return response
+
+        status, body = self.cassette.play(key)
+        response = requests.Response()
+        response.status_code = status
+        response._content = body  # pylint: disable=protected-access
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.encoding = "utf-8"
+        response.url = url
+        response.request = request
+
+        return response
+
+    def close(self) -> None:
+        """Close the network connections used for recording."""
+
+        self._http.close()
+
+
+class _RecordedBody:
+    """Stand-in for `aiohttp.StreamReader` over a recorded body."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    async def iter_chunked(self, size: int) -> AsyncIterator[bytes]:
+        """Yield the body in chunks of `size` bytes."""
+
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class RecordedResponse:
+    """Stand-in for `aiohttp.ClientResponse` holding a recorded response."""
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self.content_length = len(body)
+        self.content = _RecordedBody(body)
+        self._body = body
+
+    async def read(self) -> bytes:
+        """Get the response body."""
+
+        return self._body
+
+    async def __aenter__(self) -> "RecordedResponse":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+
+class CassetteClientSession:
+    """Stand-in for `aiohttp.ClientSession` recording or replaying GET requests."""
+
+    def __init__(
+        self, cassette: Cassette, session: Optional["aiohttp.ClientSession"] = None
+    ) -> None:
+        self.cassette = cassette
+        self._session = session
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Whether the session was closed."""
+
+        return self._closed
+
+    def get(
+        self, url: str, params: Optional[Mapping[str, Any]] = None, **kwargs: Any
+    ) -> Union[RecordedResponse, "_PendingResponse"]:
+        """
+        Get the response to a GET request, usable as `async with session.get(...)`.
+
+        In record mode, the request is sent when the response is entered.
+        """
+
+        key = cassette_key(url, params or {})
+
+        if self.cassette.mode == "replay":
+            return RecordedResponse(*self.cassette.play(key))
+
+        return _PendingResponse(lambda: self._record(key, url, params, kwargs))
+
+    async def _record(
+        self,
+        key: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> RecordedResponse:
+        """Send a request over the wrapped session and record its response."""
+
+        session = cast("aiohttp.ClientSession", self._session)
+
+        async with session.get(url, params=params, **kwargs) as response:
+            status, body = response.status, await response.read()
+
+        api_id = str((params or {}).get("api_id", "")) or None
+        self.cassette.record(key, status, _redact(body, api_id))
+
+        return RecordedResponse(status, body)
+
+    async def close(self) -> None:
+        """Close the wrapped session, if any."""
+
+        self._closed = True
+
+        if self._session is not None:
+            await self._session.close()
+
+
+class _PendingResponse:
+    """Response to a request that is sent when entered."""
+
+    def __init__(self, send: Callable[[], Awaitable[RecordedResponse]]) -> None:
+        self._send = send
+
+    async def __aenter__(self) -> RecordedResponse:
+        return await self._send()
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
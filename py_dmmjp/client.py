@@ -2,32 +2,80 @@
 Main client class for the py-dmm library.
 """
 
-import json
-from typing import Any, Dict, List, Literal, Optional, cast
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import requests
-import requests.exceptions
 
 from .actress import Actress, ActressSearchParams, ActressSearchResponse
 from .author import Author, AuthorSearchParams, AuthorSearchResponse
+from .cache import CacheBackend, is_cacheable_response, make_cache_key
+from .commons import DMM_API_BASE_URL
 from .exceptions import DMMAPIError, DMMAuthError, DMMError
 from .floor import FloorListResponse, Site
 from .genre import Genre, GenreSearchParams, GenreSearchResponse
+from .interning import Interner
+from .jsonlib import JSONLoads, default_json_loads
 from .maker import Maker, MakerSearchParams, MakerSearchResponse
-from .product import Product, ProductSearchParams
+from .parallel import map_in_threads
+from .product import (
+    ITEM_LIST_MAX_HITS,
+    ITEM_LIST_MAX_OFFSET,
+    Product,
+    ProductSearchParams,
+)
+from .ratelimit import RateLimit, TokenBucket, get_token_bucket
+from .retry import RetryPolicy
 from .series import Series, SeriesSearchParams, SeriesSearchResponse
+from .sharding import DateWindow
+from .singleflight import SingleFlight
+from .transport import (
+    ConnectionPool,
+    RequestsTransport,
+    Transport,
+    check_response,
+    translate_errors,
+)
 
 try:
     from typing import Unpack
 except ImportError:  # pragma: no cover
     from typing_extensions import Unpack
 
+T = TypeVar("T")
+
+ShardPage = Union[List[Dict[str, Any]], Exception, None]
+"Page of items handed over by a shard crawler thread, its error, or None when done"
+
 
 class DMMClient:
     """
     A client for interacting with the DMM API.
 
-    Core class to handle main DMM API interactions.
+    Core class to handle main DMM API interactions. A client can be shared by
+    threads: its connection pool, cache, rate limiter, request coalescing and
+    retry statistics are thread-safe. Size `pool` to the number of threads.
     """
 
     def __init__(
@@ -35,6 +83,19 @@ class DMMClient:
         api_key: str,
         affiliate_id: str,
         timeout: int = 10,
+        cache: Optional[CacheBackend] = None,
+        *,
+        coalesce: bool = True,
+        rate_limit: Optional[Union[RateLimit, TokenBucket]] = None,
+        retry: Optional[RetryPolicy] = None,
+        json_loads: Optional[JSONLoads] = None,
+        lazy_products: bool = False,
+        keep_raw: Optional[bool] = None,
+        interner: Optional[Interner] = None,
+        base_url: str = DMM_API_BASE_URL,
+        session: Optional[requests.Session] = None,
+        transport: Optional[Transport] = None,
+        pool: Optional[ConnectionPool] = None,
     ) -> None:
         """
         Initialize the DMM client.
@@ -43,9 +104,42 @@ class DMMClient:
             api_key: Your DMM API key for authentication.
             affiliate_id: Your DMM affiliate ID.
             timeout: Request timeout in seconds.
+            cache: Optional response cache (e.g., MemoryCache). Responses are keyed
+                   on endpoint and parameters, excluding the API key.
+            coalesce: Whether identical concurrent requests share a single HTTP call
+                      instead of each sending their own.
+            rate_limit: Optional client-side rate limit. A RateLimit is enforced by a
+                        token bucket shared with every client using the same API key
+                        and rate; pass a TokenBucket to control sharing explicitly.
+            retry: Optional policy for retrying timeouts, connection errors and
+                   transient HTTP statuses. Failures are not retried by default.
+            json_loads: Optional function decoding raw response bytes (e.g., from
+                        `get_json_loads`). Defaults to orjson when installed.
+            lazy_products: Whether to return LazyProduct objects, whose date and
+                           nested models are parsed on first access.
+            keep_raw: Whether products keep a copy of their raw API item as
+                      `raw_data`. By default, products from `get_products` keep it
+                      and products streamed by `iter_products`/`crawl_products`
+                      do not.
+            interner: Optional Interner shared by every product the client parses,
+                      so equal ItemInfo records and repeated strings (service and
+                      floor names, ...) are stored once.
+            base_url: Base URL of the API, e.g., of a FakeDMMServer for offline
+                      load tests and benchmarks.
+            session: Optional `requests.Session` to send requests over (e.g., from
+                     `Cassette.session()`). It is used as-is and is not closed by
+                     the client.
+            transport: Optional Transport sending the requests instead of a
+                       `requests.Session` (e.g., over httpx or an in-process
+                       fake). It is closed with the client.
+            pool: Optional ConnectionPool settings (size, blocking, keep-alive)
+                  of the session the client creates. Defaults to the settings
+                  of `requests`, i.e., 10 connections.
 
         Raises:
             DMMAuthError: If the API key is invalid or missing.
+            ValueError: If a session or transport is given along with a
+                        transport or pool.
         """
 
         if (
@@ -56,18 +150,52 @@ class DMMClient:
         ):
             raise DMMAuthError("API_KEY and AFFILIATE_KEY are required")
 
+        if transport is not None and (session is not None or pool is not None):
+            raise ValueError("A transport cannot be combined with a session or pool")
+
         self._api_key = api_key
         self._affiliate_id = affiliate_id
-        self._base_url = "https://api.dmm.com/affiliate/v3"
+        self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._cache = cache
+        self._rate_limiter = (
+            get_token_bucket(api_key, rate_limit)
+            if isinstance(rate_limit, RateLimit)
+            else rate_limit
+        )
+        self._flights: Optional[SingleFlight[Dict[str, Any]]] = (
+            SingleFlight() if coalesce else None
+        )
+        self._retry = retry
+        self._json_loads = json_loads or default_json_loads
+        self._lazy_products = lazy_products
+        self._keep_raw = keep_raw
+        self._interner = interner
         self._headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/",
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
-        self._session = requests.Session()
+        self._transport: Transport = transport or RequestsTransport(
+            session, timeout, self._headers, pool
+        )
+
+    @property
+    def _session(self) -> requests.Session:
+        """The `requests.Session` of the default transport."""
+
+        if not isinstance(self._transport, RequestsTransport):
+            raise AttributeError("The client does not send requests over a session")
+
+        return self._transport.session
+
+    @property
+    def _owns_session(self) -> bool:
+        """Whether the default transport created its session."""
 
-        self._session.headers.update(self._headers)
+        return isinstance(self._transport, RequestsTransport) and (
+            self._transport.owns_session
+        )
 
     def _prepare_params(
         self, params: Optional[Dict[str, Any]] = None
@@ -90,18 +218,18 @@ class DMMClient:
 
         return params
 
-    def _load_json_from_response(self, response_text: str) -> Dict[str, Any]:
+    def _load_json_from_response(self, response_body: bytes) -> Dict[str, Any]:
         """
-        Load JSON data from the response text.
+        Load JSON data from the raw response body.
 
         Args:
-            response_text: The raw response text from the API.
+            response_body: The raw response bytes from the API.
         Returns:
             JSON data as a dictionary.
         """
 
         try:
-            return cast(Dict[str, Any], json.loads(response_text))
+            return cast(Dict[str, Any], self._json_loads(response_body))
         except ValueError as e:
             raise DMMAPIError("Error while formatting DMM Response") from e
 
@@ -116,44 +244,115 @@ class DMMClient:
         Args:
             endpoint: API endpoint to call.
             params: Query parameters to include.
-            method: HTTP method to use.
 
         Returns:
-            JSON response data.
+            JSON response data, served from the cache when one is configured or
+            shared with an identical request already in flight.
 
         Raises:
             DMMAPIError: If the API request fails.
             DMMAuthError: If authentication fails.
         """
 
-        url = f"{self._base_url}{endpoint}"
         prep_params = self._prepare_params(params)
 
-        try:
-            response = self._session.get(url, params=prep_params, timeout=self._timeout)
-            response.raise_for_status()
-        except requests.exceptions.Timeout as e:
-            raise DMMAPIError("Request timed out") from e
-        except requests.exceptions.ConnectionError as e:
-            raise DMMAPIError("Connection error occurred") from e
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 401:
-                raise DMMAuthError("Invalid API key or authentication failed") from e
-
-            if response.status_code == 403:
-                raise DMMAuthError(
-                    "Access forbidden - check your API key permissions"
-                ) from e
-
-            raise DMMAPIError(
-                f"HTTP {response.status_code}: {response.text}",
-                status_code=response.status_code,
-                response_data=response.text,
-            ) from e
-        except requests.exceptions.RequestException as e:
-            raise DMMAPIError(f"Request failed: {str(e)}") from e
-
-        return self._load_json_from_response(response.text)
+        if self._cache is not None:
+            cached = self._cache.get(endpoint, prep_params)
+
+            if cached is not None:
+                return cached
+
+        if self._flights is None:
+            return self._fetch(endpoint, prep_params)
+
+        return self._flights.do(
+            make_cache_key(endpoint, prep_params),
+            lambda: self._fetch(endpoint, prep_params),
+        )
+
+    def _fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a request, retrying it if configured, and cache a successful response.
+
+        Args:
+            endpoint: API endpoint to call.
+            params: Prepared query parameters.
+
+        Returns:
+            JSON response data.
+        """
+
+        if self._retry is None:
+            response_data = self._attempt(endpoint, params)
+        else:
+            response_data = self._retry.call(lambda: self._attempt(endpoint, params))
+
+        if self._cache is not None and is_cacheable_response(response_data):
+            self._cache.set(endpoint, params, response_data)
+
+        return response_data
+
+    def _attempt(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wait for the rate limiter, then send a single request.
+
+        Args:
+            endpoint: API endpoint to call.
+            params: Prepared query parameters.
+
+        Returns:
+            JSON response data.
+        """
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+        return self._send_request(f"{self._base_url}{endpoint}", params)
+
+    def _send_request(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a GET request over the transport and decode the response.
+
+        Args:
+            url: Full URL of the endpoint.
+            params: Prepared query parameters, including authentication details.
+
+        Returns:
+            JSON response data.
+
+        Raises:
+            DMMAPIError: If the API request fails.
+            DMMAuthError: If authentication fails.
+        """
+
+        with translate_errors(self._transport):
+            response = self._transport.get(url, params)
+
+        check_response(response)
+
+        return self._load_json_from_response(response.body)
+
+    def _parse_product(self, item: Dict[str, Any], bulk: bool) -> Product:
+        """
+        Build a Product from an ItemList item according to the client options.
+
+        Args:
+            item: Product item from an ItemList response.
+            bulk: Whether the product comes from a bulk path (e.g., iter_products),
+                  where raw items are dropped unless `keep_raw` is set.
+
+        Returns:
+            Product (or LazyProduct) instance.
+        """
+
+        keep_raw = self._keep_raw if self._keep_raw is not None else not bulk
+
+        return Product.from_dict(
+            item,
+            lazy=self._lazy_products,
+            keep_raw=keep_raw,
+            interner=self._interner,
+        )
 
     @property
     def app_id(self) -> str:
@@ -175,6 +374,39 @@ class DMMClient:
         """
         return self._affiliate_id
 
+    @property
+    def cache(self) -> Optional[CacheBackend]:
+        """
+        Get the response cache used by the client.
+
+        Returns:
+            The cache backend, or None if caching is disabled.
+        """
+
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> Optional[TokenBucket]:
+        """
+        Get the token bucket limiting the client's request rate.
+
+        Returns:
+            The token bucket, exposing wait-time metrics, or None if unlimited.
+        """
+
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        """
+        Get the retry policy used by the client.
+
+        Returns:
+            The retry policy, exposing retry counters, or None if retries are off.
+        """
+
+        return self._retry
+
     def get_products(
         self,
         **kwargs: Unpack[ProductSearchParams],
@@ -244,20 +476,508 @@ class DMMClient:
             ...     print(f"- {product.title}")
         """
 
+        try:
+            items = self.get_products_raw(**kwargs)
+
+            return [self._parse_product(item, bulk=False) for item in items]
+
+        except Exception as e:
+            if isinstance(e, (DMMError, DMMAPIError, DMMAuthError)):
+                raise
+
+            raise DMMAPIError(f"Failed to get products: {str(e)}") from e
+
+    def get_products_raw(
+        self,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve the decoded product items without building Product objects.
+
+        Takes the same parameters as `get_products` and goes through the same
+        cache, coalescing, rate limiting and retries, but returns the `items` list
+        of the ItemList response as decoded. Use it when products are written
+        elsewhere (e.g., to a warehouse) and the model layer would only be undone.
+        Items may be shared with the response cache and must be treated as
+        read-only.
+
+        Args:
+            **kwargs: Product search parameters (typed as ProductSearchParams).
+
+        Returns:
+            List[Dict[str, Any]]: Product items, as returned by the API.
+
+        Raises:
+            DMMAPIError: If the API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> items = client.get_products_raw(site="FANZA", floor="videoa")
+            >>> print(items[0]["content_id"])
+        """
+
         params: Dict[str, Any] = {}
         params.update(kwargs)
 
+        return cast(List[Dict[str, Any]], self._get_item_list(params).get("items", []))
+
+    def iter_products(
+        self,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> Iterator[Product]:
+        """
+        Lazily iterate over every product matching the search parameters.
+
+        Pages are requested one at a time as the iterator is consumed, so only a
+        single page of items is held in memory. Iteration stops once the reported
+        `total_count` is exhausted or the ItemList offset ceiling (50,000) is reached.
+
+        Args:
+            hits: Page size used while walking the result set. Default and maximum is 100.
+            offset: Position to start iterating from. Default is 1.
+            **kwargs: Any other product search parameters (typed as ProductSearchParams).
+
+        Yields:
+            Product: Each product of the result set, in API order.
+
+        Raises:
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> for product in client.iter_products(
+            ...     site="FANZA", service="digital", floor="videoa", sort="date"
+            ... ):
+            ...     print(product.content_id)
+        """
+
+        for item in self.iter_products_raw(**kwargs):
+            yield self._parse_product(item, bulk=True)
+
+    def iter_products_raw(
+        self,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over the decoded items of every matching product.
+
+        The raw counterpart of `iter_products`: pages are walked the same way, but
+        items are yielded as decoded, without building Product objects. Items may
+        be shared with the response cache and must be treated as read-only.
+
+        Args:
+            **kwargs: Product search parameters (typed as ProductSearchParams).
+
+        Yields:
+            Dict[str, Any]: Each product item of the result set, in API order.
+
+        Raises:
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        for items in self._iter_item_pages(kwargs):
+            yield from items
+
+    def _iter_item_pages(
+        self, search: ProductSearchParams
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the ItemList pages of a product search.
+
+        Args:
+            search: Product search parameters.
+
+        Yields:
+            List[Dict[str, Any]]: Product items of each page, in API order.
+        """
+
+        params: Dict[str, Any] = {}
+        params.update(search)
+
+        hits = min(int(params.pop("hits", ITEM_LIST_MAX_HITS)), ITEM_LIST_MAX_HITS)
+        offset = int(params.pop("offset", 1))
+
+        while offset <= ITEM_LIST_MAX_OFFSET:
+            result = self._get_item_list({**params, "hits": hits, "offset": offset})
+            items = result.get("items", [])
+
+            yield items
+
+            total_count = int(result.get("total_count", 0))
+            first_position = int(result.get("first_position", offset))
+            offset = first_position + len(items)
+
+            if not items or offset > total_count:
+                return
+
+    def plan_product_shards(
+        self,
+        *,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> List[ProductSearchParams]:
+        """
+        Split a product search into release date windows small enough to crawl.
+
+        The ItemList API rejects offsets above 50,000, so larger result sets cannot
+        be paginated in one go. This method probes `total_count` for the search and
+        recursively halves its `gte_date`/`lte_date` window until every shard holds
+        at most `max_shard_size` products. A window that cannot be split any further
+        (a single second) is kept as-is even if it is larger.
+
+        Args:
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters (typed as ProductSearchParams).
+                      An existing `gte_date`/`lte_date` range is respected.
+
+        Returns:
+            List[ProductSearchParams]: Search parameters for each non-empty shard,
+            in chronological order.
+
+        Raises:
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> shards = client.plan_product_shards(
+            ...     site="FANZA", service="digital", floor="videoa"
+            ... )
+            >>> print(f"Crawl needs {len(shards)} shards")
+        """
+
+        params: Dict[str, Any] = {}
+        params.update(kwargs)
+
+        shards: List[ProductSearchParams] = []
+        windows = [DateWindow.from_params(params)]
+
+        while windows:
+            window = windows.pop()
+            shard = {**params, **window.to_params()}
+            total_count = int(
+                self._get_item_list({**shard, "hits": 1, "offset": 1}).get(
+                    "total_count", 0
+                )
+            )
+
+            if total_count == 0:
+                continue
+
+            if total_count <= max_shard_size or not window.can_split():
+                shards.append(cast(ProductSearchParams, shard))
+                continue
+
+            earlier, later = window.split()
+            windows.extend((later, earlier))
+
+        return shards
+
+    def crawl_products(
+        self,
+        *,
+        max_workers: int = 1,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> Iterator[Product]:
+        """
+        Crawl every product of a search, including result sets beyond 50,000 items.
+
+        The search is split with `plan_product_shards` and every shard is walked with
+        `iter_products`. Products that show up in more than one shard are yielded
+        only once, keyed by `content_id`.
+
+        Args:
+            max_workers: Number of shards crawled in parallel threads. With the
+                         default of 1, shards are crawled lazily one after another;
+                         otherwise up to `max_workers` shards are buffered in memory.
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters (typed as ProductSearchParams).
+
+        Yields:
+            Product: Each distinct product of the search.
+
+        Raises:
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> for product in client.crawl_products(
+            ...     site="FANZA", service="digital", floor="videoa", max_workers=4
+            ... ):
+            ...     print(product.content_id)
+        """
+
+        for item in self.crawl_products_raw(
+            max_workers=max_workers, max_shard_size=max_shard_size, **kwargs
+        ):
+            yield self._parse_product(item, bulk=True)
+
+    def crawl_products_raw(
+        self,
+        *,
+        max_workers: int = 1,
+        max_shard_size: int = ITEM_LIST_MAX_OFFSET,
+        **kwargs: Unpack[ProductSearchParams],
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Crawl the decoded items of every product of a search.
+
+        The raw counterpart of `crawl_products`: shards are planned and walked the
+        same way, and duplicates are dropped by `content_id`, but items are yielded
+        as decoded. Items may be shared with the response cache and must be treated
+        as read-only.
+
+        Args:
+            max_workers: Number of shards crawled in parallel threads.
+            max_shard_size: Maximum number of products per shard. Default is 50,000.
+            **kwargs: Product search parameters (typed as ProductSearchParams).
+
+        Yields:
+            Dict[str, Any]: Each distinct product item of the search.
+
+        Raises:
+            DMMAPIError: If an API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
+        shards = self.plan_product_shards(max_shard_size=max_shard_size, **kwargs)
+        seen: Set[str] = set()
+
+        if max_workers <= 1:
+            items: Iterator[Dict[str, Any]] = chain.from_iterable(
+                self.iter_products_raw(**shard) for shard in shards
+            )
+        else:
+            items = self._crawl_shards_in_threads(shards, max_workers)
+
+        for item in items:
+            content_id = item.get("content_id", "")
+
+            if content_id in seen:
+                continue
+
+            seen.add(content_id)
+
+            yield item
+
+    @overload
+    def map_products(
+        self,
+        params_list: Iterable[ProductSearchParams],
+        *,
+        max_workers: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[List[Product]]: ...
+
+    @overload
+    def map_products(
+        self,
+        params_list: Iterable[ProductSearchParams],
+        *,
+        max_workers: int = ...,
+        return_exceptions: bool,
+    ) -> List[Union[List[Product], DMMError]]: ...
+
+    def map_products(
+        self,
+        params_list: Iterable[ProductSearchParams],
+        *,
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> Union[List[List[Product]], List[Union[List[Product], DMMError]]]:
+        """
+        Run several product searches in parallel threads.
+
+        Each parameter set is passed to `get_products`. The searches share the
+        client's connection pool, cache, rate limiter and retries, so keep
+        `max_workers` within the size of the connection pool (see `pool`).
+
+        Args:
+            params_list: Product search parameters of each search.
+            max_workers: Maximum number of searches running at once. Default is 8.
+            return_exceptions: Whether a failed search returns its DMMError in
+                               place of its products instead of raising it.
+
+        Returns:
+            The products of each search, in the order of `params_list`.
+
+        Raises:
+            DMMAPIError: If a search fails and `return_exceptions` is False.
+            DMMAuthError: If authentication fails and `return_exceptions` is False.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> results = client.map_products(
+            ...     [{"site": "FANZA", "cid": cid} for cid in cids],
+            ...     return_exceptions=True,
+            ... )
+        """
+
+        return self.map_requests(
+            self.get_products,
+            params_list,
+            max_workers=max_workers,
+            return_exceptions=return_exceptions,
+        )
+
+    @overload
+    def map_requests(
+        self,
+        method: Callable[..., T],
+        params_list: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = ...,
+        return_exceptions: Literal[False] = ...,
+    ) -> List[T]: ...
+
+    @overload
+    def map_requests(
+        self,
+        method: Callable[..., T],
+        params_list: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = ...,
+        return_exceptions: bool,
+    ) -> List[Union[T, DMMError]]: ...
+
+    def map_requests(
+        self,
+        method: Callable[..., T],
+        params_list: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = 8,
+        return_exceptions: bool = False,
+    ) -> Union[List[T], List[Union[T, DMMError]]]:
+        """
+        Call a client method with several parameter sets in parallel threads.
+
+        The parallel counterpart of any search method, e.g., `get_actresses`,
+        `get_genres`, `get_makers`, `get_series` or `get_authors`. Calls share the
+        client's connection pool, cache, rate limiter and retries. When a call
+        fails and `return_exceptions` is False, the calls that have not started
+        yet are cancelled.
+
+        Args:
+            method: Client method to call (e.g., `client.get_actresses`).
+            params_list: Keyword arguments of each call.
+            max_workers: Maximum number of calls running at once. Default is 8.
+            return_exceptions: Whether a failed call returns its DMMError in place
+                               of its result instead of raising it.
+
+        Returns:
+            The result of each call, in the order of `params_list`.
+
+        Raises:
+            ValueError: If `max_workers` is less than 1.
+            DMMAPIError: If a call fails and `return_exceptions` is False.
+            DMMAuthError: If authentication fails and `return_exceptions` is False.
+
+        Example:
+            >>> client = DMMClient(api_key="your_key", affiliate_id="your_id")
+            >>> actresses = client.map_requests(
+            ...     client.get_actresses,
+            ...     [{"initial": initial} for initial in "あかさたな"],
+            ... )
+        """
+
+        return map_in_threads(method, params_list, max_workers, return_exceptions)
+
+    def _crawl_shards_in_threads(
+        self, shards: List[ProductSearchParams], max_workers: int
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Crawl shards on a thread pool, keeping at most `max_workers` shards in flight.
+
+        Workers hand each page over through a queue per shard as soon as it is
+        fetched. When the caller stops iterating, the workers stop before their next
+        page and the shards that have not started are cancelled, without waiting
+        for the requests in flight.
+
+        Args:
+            shards: Search parameters of each shard.
+            max_workers: Number of worker threads.
+
+        Yields:
+            Dict[str, Any]: Product items of each shard, in shard order.
+        """
+
+        remaining = iter(shards)
+        pending: Deque[Tuple["Future[None]", "queue.Queue[ShardPage]"]] = deque()
+        stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def crawl(shard: ProductSearchParams, pages: "queue.Queue[ShardPage]") -> None:
+            try:
+                for items in self._iter_item_pages(shard):
+                    pages.put(items)
+
+                    if stop.is_set():
+                        break
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                pages.put(e)
+            finally:
+                pages.put(None)
+
+        def submit() -> None:
+            shard = next(remaining, None)
+
+            if shard is not None and not stop.is_set():
+                pages: "queue.Queue[ShardPage]" = queue.Queue()
+                pending.append((executor.submit(crawl, shard, pages), pages))
+
+        try:
+            for _ in range(max_workers):
+                submit()
+
+            while pending:
+                _, pages = pending.popleft()
+
+                page = pages.get()
+
+                while page is not None:
+                    if isinstance(page, Exception):
+                        raise page
+
+                    yield from page
+                    page = pages.get()
+
+                submit()
+
+        finally:
+            stop.set()
+
+            for future, _ in pending:
+                future.cancel()
+
+            executor.shutdown(wait=False)
+
+    def _get_item_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Request a single ItemList page and return its result section.
+
+        Args:
+            params: Product search parameters for the page.
+
+        Returns:
+            The `result` section of the API response.
+
+        Raises:
+            DMMAPIError: If the API request fails or returns an error.
+            DMMAuthError: If authentication fails or API key is invalid.
+        """
+
         try:
             response_data = self._make_request("/ItemList", params)
 
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            result = response_data["result"]
-            items = result.get("items", [])
-            products = [Product.from_dict(item) for item in items]
-
-            return products
+            return cast(Dict[str, Any], response_data["result"])
 
         except Exception as e:
             if isinstance(e, (DMMError, DMMAPIError, DMMAuthError)):
@@ -369,7 +1089,7 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            floor_response = FloorListResponse.from_dict(response_data)
+            floor_response = FloorListResponse.from_dict(response_data, keep_raw=False)
             sites = floor_response.result.sites
 
             return sites
@@ -441,7 +1161,9 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            actress_response = ActressSearchResponse.from_dict(response_data)
+            actress_response = ActressSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return actress_response.actresses
 
@@ -498,7 +1220,9 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            genre_response = GenreSearchResponse.from_dict(response_data)
+            genre_response = GenreSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
             return genre_response.genres
 
         except Exception as e:
@@ -554,7 +1278,9 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            maker_response = MakerSearchResponse.from_dict(response_data)
+            maker_response = MakerSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return maker_response.makers
 
@@ -611,7 +1337,9 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            series_response = SeriesSearchResponse.from_dict(response_data)
+            series_response = SeriesSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return series_response.series
 
@@ -668,7 +1396,9 @@ class DMMClient:
             if "result" not in response_data:
                 raise DMMAPIError("Invalid API response: missing 'result' field")
 
-            author_response = AuthorSearchResponse.from_dict(response_data)
+            author_response = AuthorSearchResponse.from_dict(
+                response_data, keep_raw=False
+            )
 
             return author_response.authors
 
@@ -680,17 +1410,18 @@ class DMMClient:
 
     def close(self) -> None:
         """
-        Explicitly close the HTTP session.
+        Explicitly close the transport and its HTTP session, unless the session
+        was passed in as `session`.
         """
 
-        self._session.close()
+        self._transport.close()
 
     def __del__(self) -> None:
         """
         Destructor to ensure the session is closed.
         """
 
-        if hasattr(self, "_session"):
+        if hasattr(self, "_transport"):
             self.close()
 
     def __enter__(self) -> "DMMClient":
@@ -5,6 +5,9 @@ Common data models shared across different DMM API endpoints.
 from dataclasses import dataclass, field
 from typing import Any, Dict
 
+DMM_API_BASE_URL = "https://api.dmm.com/affiliate/v3"
+"Base URL of the DMM affiliate API (version 3)"
+
 
 @dataclass
 class RequestParameters:
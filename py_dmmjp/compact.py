@@ -0,0 +1,183 @@
+"""
+Compact, `__slots__`-based variants of the response models.
+
+Every model is a plain dataclass whose instances carry a per-instance `__dict__`.
+The classes built here have the same fields, properties and methods but store
+their fields in slots instead of a `__dict__`, which saves memory on every
+instance. They are meant for services keeping many products in memory; run
+`python -m benchmarks.bench_memory` to see the saving on your Python version.
+
+Compact classes are copies, not subclasses, of the models: instances have the
+same attributes and compare equal to each other, but `isinstance(p, Product)` is
+False for a `CompactProduct`. Their `from_dict` builds compact objects all the way
+down, and `to_compact` converts models that have already been parsed.
+"""
+
+import dataclasses
+from typing import Any, Dict, Type, TypeVar, cast
+
+from .actress import (
+    Actress,
+    ActressImageURL,
+    ActressListURL,
+    ActressSearchResponse,
+    ActressSearchResult,
+)
+from .author import Author, AuthorSearchResponse, AuthorSearchResult
+from .commons import ApiRequest, RequestParameters
+from .floor import Floor, FloorListResponse, FloorListResult, Service, Site
+from .genre import Genre, GenreSearchResponse, GenreSearchResult
+from .maker import Maker, MakerSearchResponse, MakerSearchResult
+from .product import (
+    Campaign,
+    CDInfo,
+    Delivery,
+    Directory,
+    ImageURL,
+    ItemDetails,
+    ItemInfo,
+    Prices,
+    Product,
+    ProductApiResponse,
+    ProductApiResult,
+    Review,
+    SampleImage,
+    SampleImages,
+    SampleMovieURL,
+    TachiyomiInfo,
+)
+from .series import Series, SeriesSearchResponse, SeriesSearchResult
+
+T = TypeVar("T")
+
+_compact_models: Dict[type, type] = {}
+
+
+def to_compact(value: T) -> T:
+    """
+    Convert a parsed model, or a list of models, to its compact variant.
+
+    Nested models are converted as well. Values that are not models, and models
+    that are already compact, are returned unchanged. A `LazyProduct` is fully
+    parsed by the conversion.
+
+    Args:
+        value: Model instance or list of model instances.
+
+    Returns:
+        The compact equivalent of `value`.
+
+    Example:
+        >>> products = [to_compact(p) for p in client.iter_products(site="FANZA")]
+    """
+
+    if isinstance(value, list):
+        return cast(T, [to_compact(item) for item in value])
+
+    compact = next(
+        (_compact_models[c] for c in type(value).__mro__ if c in _compact_models),
+        None,
+    )
+
+    if compact is None:
+        return value
+
+    return cast(
+        T,
+        compact(
+            **{
+                f.name: to_compact(getattr(value, f.name))
+                for f in dataclasses.fields(compact)
+            }
+        ),
+    )
+
+
+def compact_model(model: Type[T]) -> Type[T]:
+    """
+    Build the slotted variant of a dataclass model.
+
+    The class namespace is copied without the per-field defaults (the generated
+    `__init__` already holds them) and with `__slots__` listing every field. The
+    `from_dict` classmethod is wrapped so nested models come out compact too.
+
+    Args:
+        model: Dataclass model with a `from_dict` classmethod.
+
+    Returns:
+        The compact class, also registered for `to_compact`.
+    """
+
+    name = f"Compact{model.__name__}"
+    field_names = tuple(f.name for f in dataclasses.fields(cast(Any, model)))
+    namespace = {
+        key: value
+        for key, value in model.__dict__.items()
+        if key not in field_names and key not in ("__dict__", "__weakref__")
+    }
+
+    def from_dict(_cls: type, *args: Any, **kwargs: Any) -> Any:
+        return to_compact(model.from_dict(*args, **kwargs))  # type: ignore[attr-defined]
+
+    from_dict.__doc__ = f"Create {name} from dictionary."
+    namespace.update(
+        __slots__=field_names,
+        __module__=__name__,
+        __qualname__=name,
+        __doc__=f"Compact, slotted variant of `{model.__name__}`.",
+        from_dict=classmethod(from_dict),
+    )
+
+    compact = cast(Type[T], type(name, (), namespace))
+    _compact_models[model] = compact
+
+    return compact
+
+
+CompactReview = compact_model(Review)
+CompactImageURL = compact_model(ImageURL)
+CompactSampleImage = compact_model(SampleImage)
+CompactSampleImages = compact_model(SampleImages)
+CompactSampleMovieURL = compact_model(SampleMovieURL)
+CompactTachiyomiInfo = compact_model(TachiyomiInfo)
+CompactDelivery = compact_model(Delivery)
+CompactPrices = compact_model(Prices)
+CompactItemInfo = compact_model(ItemInfo)
+CompactItemDetails = compact_model(ItemDetails)
+CompactCDInfo = compact_model(CDInfo)
+CompactDirectory = compact_model(Directory)
+CompactCampaign = compact_model(Campaign)
+CompactProduct = compact_model(Product)
+CompactProductApiResult = compact_model(ProductApiResult)
+CompactProductApiResponse = compact_model(ProductApiResponse)
+
+CompactRequestParameters = compact_model(RequestParameters)
+CompactApiRequest = compact_model(ApiRequest)
+
+CompactActressImageURL = compact_model(ActressImageURL)
+CompactActressListURL = compact_model(ActressListURL)
+CompactActress = compact_model(Actress)
+CompactActressSearchResult = compact_model(ActressSearchResult)
+CompactActressSearchResponse = compact_model(ActressSearchResponse)
+
+CompactFloor = compact_model(Floor)
+CompactService = compact_model(Service)
+CompactSite = compact_model(Site)
+CompactFloorListResult = compact_model(FloorListResult)
+CompactFloorListResponse = compact_model(FloorListResponse)
+
+CompactGenre = compact_model(Genre)
+CompactGenreSearchResult = compact_model(GenreSearchResult)
+CompactGenreSearchResponse = compact_model(GenreSearchResponse)
+
+CompactMaker = compact_model(Maker)
+CompactMakerSearchResult = compact_model(MakerSearchResult)
+CompactMakerSearchResponse = compact_model(MakerSearchResponse)
+
+CompactSeries = compact_model(Series)
+CompactSeriesSearchResult = compact_model(SeriesSearchResult)
+CompactSeriesSearchResponse = compact_model(SeriesSearchResponse)
+
+CompactAuthor = compact_model(Author)
+CompactAuthorSearchResult = compact_model(AuthorSearchResult)
+CompactAuthorSearchResponse = compact_model(AuthorSearchResponse)
@@ -47,6 +47,14 @@ class DMMAPIError(DMMError):
         self.response_data = response_data
 
 
+class DMMTimeoutError(DMMAPIError):
+    """Exception raised when a request to the API times out."""
+
+
+class DMMConnectionError(DMMAPIError):
+    """Exception raised when the API cannot be reached."""
+
+
 class DMMAuthError(DMMError):
     """Exception raised for authentication-related errors."""
 
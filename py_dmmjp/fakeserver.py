@@ -0,0 +1,416 @@
+"""
+Local stand-in for the DMM API, for offline load tests and benchmarks.
+
+The server runs on the standard library (`http.server`) in a background thread
+and answers the same endpoints as the API from response templates.
+"""
+
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .product import ITEM_LIST_MAX_HITS, ITEM_LIST_MAX_OFFSET
+
+PAGINATED_ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "ItemList": ("items", "content_id"),
+    "ActressSearch": ("actress", "id"),
+    "GenreSearch": ("genre", "genre_id"),
+    "MakerSearch": ("maker", "maker_id"),
+    "SeriesSearch": ("series", "series_id"),
+    "AuthorSearch": ("author", "author_id"),
+}
+"Item list key and item ID field of each paginated endpoint"
+
+PAGE_SIZES: Dict[str, Tuple[int, int]] = {
+    "ItemList": (ITEM_LIST_MAX_HITS, 20),
+    "ActressSearch": (100, 20),
+    "GenreSearch": (500, 100),
+    "MakerSearch": (500, 100),
+    "SeriesSearch": (500, 100),
+    "AuthorSearch": (500, 100),
+}
+"Maximum and default `hits` of each paginated endpoint"
+
+MAX_OFFSETS: Dict[str, Optional[int]] = {
+    "ItemList": ITEM_LIST_MAX_OFFSET,
+    "ActressSearch": None,
+    "GenreSearch": None,
+    "MakerSearch": None,
+    "SeriesSearch": None,
+    "AuthorSearch": None,
+}
+"Maximum `offset` of each paginated endpoint, None where the API sets no limit"
+
+DEFAULT_RESPONSES: Dict[str, Dict[str, Any]] = {
+    "ItemList": {
+        "result": {
+            "items": [
+                {
+                    "service_code": "digital",
+                    "service_name": "動画",
+                    "floor_code": "videoa",
+                    "floor_name": "ビデオ",
+                    "category_name": "ビデオ (動画)",
+                    "content_id": "fake00001",
+                    "product_id": "fake00001",
+                    "title": "テスト作品",
+                    "volume": "120",
+                    "review": {"count": 12, "average": "4.25"},
+                    "URL": "https://video.dmm.co.jp/av/content/?id=fake00001",
+                    "affiliateURL": "https://al.fanza.co.jp/?lurl=fake00001",
+                    "imageURL": {
+                        "list": "https://pics.dmm.co.jp/digital/video/fake00001pt.jpg",
+                        "small": "https://pics.dmm.co.jp/digital/video/fake00001ps.jpg",
+                        "large": "https://pics.dmm.co.jp/digital/video/fake00001pl.jpg",
+                    },
+                    "prices": {
+                        "price": "1980~",
+                        "list_price": "2980~",
+                        "deliveries": {
+                            "delivery": [
+                                {"type": "download", "price": "1980"},
+                                {"type": "hd", "price": "2480"},
+                            ]
+                        },
+                    },
+                    "date": "2025-01-24 10:00:04",
+                    "iteminfo": {
+                        "genre": [
+                            {"id": 6533, "name": "ハイビジョン"},
+                            {"id": 4025, "name": "単体作品"},
+                        ],
+                        "maker": [{"id": 1, "name": "テストメーカー"}],
+                        "actress": [{"id": 1, "name": "テスト女優", "ruby": "てすと"}],
+                    },
+                }
+            ]
+        }
+    },
+    "FloorList": {
+        "result": {
+            "site": [
+                {
+                    "name": "FANZA（アダルト）",
+                    "code": "FANZA",
+                    "service": [
+                        {
+                            "name": "動画",
+                            "code": "digital",
+                            "floor": [
+                                {"id": "43", "name": "ビデオ", "code": "videoa"},
+                                {"id": "44", "name": "素人", "code": "videoc"},
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+    },
+    "ActressSearch": {
+        "result": {
+            "actress": [
+                {
+                    "id": "1",
+                    "name": "テスト女優",
+                    "ruby": "てすと",
+                    "bust": "86",
+                    "cup": "F",
+                    "waist": "57",
+                    "hip": "87",
+                    "height": "158",
+                    "birthday": "1991-12-03",
+                    "imageURL": {
+                        "small": "http://pics.dmm.co.jp/mono/actjpgs/thumbnail/fake.jpg",
+                        "large": "http://pics.dmm.co.jp/mono/actjpgs/fake.jpg",
+                    },
+                }
+            ]
+        }
+    },
+    "GenreSearch": {
+        "result": {
+            "floor_id": "43",
+            "floor_code": "videoa",
+            "genre": [{"genre_id": "1", "name": "ジャンル", "ruby": "じゃんる"}],
+        }
+    },
+    "MakerSearch": {
+        "result": {
+            "floor_id": "43",
+            "floor_code": "videoa",
+            "maker": [{"maker_id": "1", "name": "メーカー", "ruby": "めーかー"}],
+        }
+    },
+    "SeriesSearch": {
+        "result": {
+            "floor_id": "43",
+            "floor_code": "videoa",
+            "series": [{"series_id": "1", "name": "シリーズ", "ruby": "しりーず"}],
+        }
+    },
+    "AuthorSearch": {
+        "result": {
+            "floor_id": "72",
+            "floor_code": "comic",
+            "author": [{"author_id": "1", "name": "作家", "ruby": "さっか"}],
+        }
+    },
+}
+"Minimal response template of every endpoint, used unless one is given"
+
+
+class FakeDMMServer:
+    """
+    Serves the DMM API endpoints from response templates on a local port.
+
+    Paginated endpoints (ItemList and the *Search endpoints) serve a catalog of
+    `total_count` items built by cycling through the items of their template,
+    each with a unique ID, and honor `hits` and `offset` like the API. Other
+    query parameters, such as keywords or filters, are ignored. FloorList
+    returns its template as-is.
+
+    Example:
+        >>> with FakeDMMServer(total_count=5000, latency=0.01) as server:
+        ...     client = DMMClient("key", "affiliate-990", base_url=server.base_url)
+        ...     products = list(client.iter_products(site="FANZA"))
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, Dict[str, Any]]] = None,
+        *,
+        total_count: int = 1000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the server. It starts listening on `start` or when entered.
+
+        Args:
+            responses: Response templates keyed by endpoint name (e.g., 'ItemList'),
+                       such as recorded API responses. Endpoints without one use
+                       `DEFAULT_RESPONSES`.
+            total_count: Number of items each paginated endpoint serves.
+            latency: Delay in seconds before every response is sent.
+            error_rate: Fraction of requests, chosen at random, answered with
+                        `error_status` instead of data.
+            error_status: HTTP status of the injected errors.
+            seed: Seed of the random error injection, for reproducible runs.
+            host: Interface to listen on.
+            port: Port to listen on; 0 picks a free port.
+        """
+
+        self.responses = {**DEFAULT_RESPONSES, **(responses or {})}
+        self.total_count = total_count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._failures: Deque[int] = deque()
+        self._lock = threading.Lock()
+        self._address = (host, port)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """
+        Get the base URL to pass to the clients as `base_url`.
+
+        Raises:
+            RuntimeError: If the server is not running.
+        """
+
+        if self._server is None:
+            raise RuntimeError("FakeDMMServer is not running")
+
+        return f"http://{self._address[0]}:{self._server.server_port}/affiliate/v3"
+
+    def start(self) -> "FakeDMMServer":
+        """
+        Start serving in a background thread.
+
+        Returns:
+            The server itself.
+        """
+
+        if self._server is None:
+            self._server = ThreadingHTTPServer(self._address, _make_handler(self))
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="FakeDMMServer", daemon=True
+            )
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeDMMServer":
+        """Start the server when entering a `with` block."""
+
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the server when leaving a `with` block."""
+
+        self.stop()
+
+    def fail_next(self, count: int = 1, status: int = 500) -> None:
+        """
+        Answer the next `count` requests with an error status.
+
+        Args:
+            count: Number of requests to fail.
+            status: HTTP status of the errors (e.g., 429 or 503).
+        """
+
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def handle(self, path: str, query: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Build the response to a request.
+
+        Args:
+            path: Request path (e.g., '/affiliate/v3/ItemList').
+            query: Query parameters.
+
+        Returns:
+            HTTP status and decoded response body.
+        """
+
+        with self._lock:
+            self.request_count += 1
+            failure = self._failures.popleft() if self._failures else None
+
+            if failure is None and self._random.random() < self.error_rate:
+                failure = self.error_status
+
+        if failure is not None:
+            return failure, _error_body(query, failure, "injected error")
+
+        return self._respond(path.rstrip("/").rsplit("/", 1)[-1], query)
+
+    def _respond(
+        self, endpoint: str, query: Dict[str, str]
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Build the response to a request for an endpoint."""
+
+        if endpoint not in self.responses:
+            return 404, _error_body(query, 404, f"unknown endpoint {endpoint!r}")
+
+        if not query.get("api_id") or not query.get("affiliate_id"):
+            return 401, _error_body(query, 401, "api_id and affiliate_id are required")
+
+        if endpoint not in PAGINATED_ENDPOINTS:
+            result = self.responses[endpoint]["result"]
+
+            return 200, {"request": {"parameters": query}, "result": result}
+
+        return self._page(endpoint, query)
+
+    def _page(self, endpoint: str, query: Dict[str, str]) -> Tuple[int, Dict[str, Any]]:
+        """Build the response holding one page of a paginated endpoint."""
+
+        max_hits, default_hits = PAGE_SIZES[endpoint]
+        max_offset = MAX_OFFSETS[endpoint]
+
+        try:
+            hits = int(query.get("hits", default_hits))
+            offset = int(query.get("offset", 1))
+        except ValueError:
+            return 400, _error_body(query, 400, "hits and offset must be integers")
+
+        offset_in_range = offset >= 1 and (max_offset is None or offset <= max_offset)
+
+        if not 1 <= hits <= max_hits or not offset_in_range:
+            return 400, _error_body(query, 400, "hits or offset is out of range")
+
+        items_key, id_key = PAGINATED_ENDPOINTS[endpoint]
+        result = dict(self.responses[endpoint]["result"])
+        templates = result[items_key]
+        items = []
+
+        for position in range(offset, min(offset + hits, self.total_count + 1)):
+            item = dict(templates[(position - 1) % len(templates)])
+
+            if endpoint == "ItemList":
+                item["content_id"] = item["product_id"] = f"fake{position:08d}"
+            else:
+                item[id_key] = str(position)
+
+            items.append(item)
+
+        result.update(
+            {
+                "status": 200,
+                "result_count": len(items),
+                "total_count": self.total_count,
+                "first_position": offset,
+                items_key: items,
+            }
+        )
+
+        return 200, {"request": {"parameters": query}, "result": result}
+
+
+def _error_body(query: Dict[str, str], status: int, message: str) -> Dict[str, Any]:
+    """Build an error response body in the shape of the API's."""
+
+    return {
+        "request": {"parameters": query},
+        "result": {"status": status, "message": message},
+    }
+
+
+def _make_handler(server: FakeDMMServer) -> type:
+    """Build the request handler class serving `server`."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Answers GET requests with the server's responses."""
+
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # pylint: disable=invalid-name
+            """Handle a GET request."""
+
+            url = urlsplit(self.path)
+            status, data = server.handle(url.path, dict(parse_qsl(url.query)))
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+            if server.latency:
+                time.sleep(server.latency)
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(
+            self, format: str, *args: Any
+        ) -> None:  # pylint: disable=redefined-builtin
+            """Keep request logs out of benchmark and test output."""
+
+    return Handler
@@ -0,0 +1,408 @@
+"""
+Columnar, NumPy-backed representation of many products.
+
+Requires the optional `numpy` dependency (`pip install py-dmmjp[numpy]`).
+"""
+
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from .dates import parse_datetime
+from .pricing import parse_prices
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without numpy installed
+    np = None  # type: ignore[assignment]
+
+PRODUCT_FRAME_COLUMNS = (
+    "content_id",
+    "product_id",
+    "title",
+    "date",
+    "current_price",
+    "original_price",
+    "review_count",
+    "review_average",
+    "service_code",
+    "floor_code",
+)
+"Columns of a ProductFrame, named after the matching Product attributes"
+
+
+def _require_numpy() -> None:
+    """Raise a helpful ImportError when NumPy is not installed."""
+
+    if np is None:
+        raise ImportError(
+            "ProductFrame requires numpy; install it with 'pip install py-dmmjp[numpy]'"
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class EncodedColumn:
+    """
+    Dictionary-encoded string column.
+
+    Each distinct value is stored once in `categories`, and `codes` holds the
+    position of every row's value in it, so a column of 100k floor codes is an
+    int32 array plus a handful of strings.
+    """
+
+    categories: Tuple[str, ...]
+    "Distinct values, in order of first appearance"
+
+    codes: "np.ndarray"
+    "Index into `categories` of each row's value"
+
+    @classmethod
+    def encode(cls, values: Iterable[str]) -> "EncodedColumn":
+        """
+        Encode a sequence of strings.
+
+        Args:
+            values: Row values.
+
+        Returns:
+            EncodedColumn instance.
+        """
+
+        _require_numpy()
+
+        positions: Dict[str, int] = {}
+        codes = [positions.setdefault(value, len(positions)) for value in values]
+
+        return cls(tuple(positions), np.array(codes, dtype=np.int32))
+
+    def __len__(self) -> int:
+        """Get the number of rows."""
+
+        return len(self.codes)
+
+    def isin(self, *values: str) -> "np.ndarray":
+        """
+        Get a boolean mask of the rows holding one of `values`.
+
+        Args:
+            *values: Values to look for.
+
+        Returns:
+            Boolean array with one entry per row.
+
+        Example:
+            >>> videos = frame[frame.floor_code.isin("videoa", "videoc")]
+        """
+
+        wanted = [i for i, category in enumerate(self.categories) if category in values]
+
+        return np.isin(self.codes, wanted)
+
+    def decode(self) -> "np.ndarray":
+        """Get the row values as an object array of strings."""
+
+        return cast("np.ndarray", np.array(self.categories, dtype=object)[self.codes])
+
+    def value_counts(self) -> Dict[str, int]:
+        """Count the rows holding each value, in order of first appearance."""
+
+        counts = np.bincount(self.codes, minlength=len(self.categories))
+
+        return dict(zip(self.categories, counts.tolist()))
+
+    def take(self, indices: "np.ndarray") -> "EncodedColumn":
+        """
+        Select rows, keeping the same categories.
+
+        Args:
+            indices: Row positions (or a boolean mask) to keep.
+
+        Returns:
+            EncodedColumn holding the selected rows.
+        """
+
+        return EncodedColumn(self.categories, self.codes[indices])
+
+
+Column = Union["np.ndarray", EncodedColumn]
+
+
+class ProductFrame:
+    """
+    Products stored column by column in NumPy arrays.
+
+    Values follow the `Product` attributes of the same name:
+
+    - `content_id`, `product_id` and `title` are object arrays of strings.
+    - `date` is a `datetime64[s]` array, NaT where the date is missing.
+    - `current_price` and `original_price` are masked int64 arrays, masked where
+      `Product.current_price`/`original_price` is None.
+    - `review_count` is an int64 array and `review_average` a float64 array, NaN
+      where `Product.review_average` is None.
+    - `service_code` and `floor_code` are dictionary-encoded (`EncodedColumn`).
+
+    Filtering, sorting and aggregating then run as vectorized NumPy operations
+    instead of Python loops over Product properties.
+
+    Example:
+        >>> frame = ProductFrame.from_items(client.iter_products_raw(site="FANZA"))
+        >>> cheap = frame[frame.current_price < 1000]
+        >>> cheap.sort_by("review_average", descending=True).title[:10]
+        >>> frame.current_price.mean(), frame.floor_code.value_counts()
+    """
+
+    content_id: "np.ndarray"
+    product_id: "np.ndarray"
+    title: "np.ndarray"
+    date: "np.ndarray"
+    current_price: "np.ma.MaskedArray"
+    original_price: "np.ma.MaskedArray"
+    review_count: "np.ndarray"
+    review_average: "np.ndarray"
+    service_code: EncodedColumn
+    floor_code: EncodedColumn
+
+    def __init__(self, **columns: Column) -> None:
+        """
+        Initialize a frame from its columns.
+
+        Use `from_items` or `from_pages` to build a frame from API data.
+
+        Args:
+            **columns: One value per name in `PRODUCT_FRAME_COLUMNS`, all of the
+                       same length.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+            ValueError: If a column is missing, unknown or of a different length.
+        """
+
+        _require_numpy()
+
+        if set(columns) != set(PRODUCT_FRAME_COLUMNS):
+            raise ValueError(
+                f"ProductFrame columns must be {', '.join(PRODUCT_FRAME_COLUMNS)}"
+            )
+
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("ProductFrame columns must all have the same length")
+
+        for name in PRODUCT_FRAME_COLUMNS:
+            setattr(self, name, columns[name])
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "ProductFrame":
+        """
+        Build a frame from ItemList product items.
+
+        Args:
+            items: Product items as decoded from the API (e.g., from
+                   `get_products_raw` or `iter_products_raw`).
+
+        Returns:
+            ProductFrame instance.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+
+        _require_numpy()
+
+        values: Dict[str, List[Any]] = {name: [] for name in PRODUCT_FRAME_COLUMNS}
+        price_strings: List[Optional[str]] = []
+        list_price_strings: List[Optional[str]] = []
+
+        for item in items:
+            prices = item.get("prices") or {}
+            review = item.get("review") or {}
+            average = float(review.get("average", "0")) if review else 0.0
+
+            values["content_id"].append(item.get("content_id", ""))
+            values["product_id"].append(item.get("product_id", ""))
+            values["title"].append(item.get("title", ""))
+            values["date"].append(parse_datetime(item.get("date")))
+            price_strings.append(prices.get("price"))
+            list_price_strings.append(prices.get("list_price"))
+            values["review_count"].append(int(review.get("count", 0)))
+            values["review_average"].append(average or np.nan)
+            values["service_code"].append(item.get("service_code", ""))
+            values["floor_code"].append(item.get("floor_code", ""))
+
+        current_prices, _ = parse_prices(price_strings)
+        original_prices, _ = parse_prices(list_price_strings)
+
+        return cls(
+            content_id=np.array(values["content_id"], dtype=object),
+            product_id=np.array(values["product_id"], dtype=object),
+            title=np.array(values["title"], dtype=object),
+            date=np.array(values["date"], dtype="datetime64[s]"),
+            current_price=_masked_int_array(current_prices),
+            original_price=_masked_int_array(original_prices),
+            review_count=np.array(values["review_count"], dtype=np.int64),
+            review_average=np.array(values["review_average"], dtype=np.float64),
+            service_code=EncodedColumn.encode(values["service_code"]),
+            floor_code=EncodedColumn.encode(values["floor_code"]),
+        )
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[Dict[str, Any]]) -> "ProductFrame":
+        """
+        Build a frame from ItemList responses.
+
+        Args:
+            pages: Decoded ItemList responses, each with a `result` section.
+
+        Returns:
+            ProductFrame holding the items of every page, in order.
+
+        Raises:
+            ImportError: If NumPy is not installed.
+        """
+
+        return cls.from_items(
+            item for page in pages for item in page.get("result", {}).get("items", [])
+        )
+
+    def __len__(self) -> int:
+        """Get the number of products."""
+
+        return len(self.content_id)
+
+    def __getitem__(self, key: Any) -> "ProductFrame":
+        """
+        Select rows with a boolean mask, an array of positions or a slice.
+
+        A masked boolean mask (e.g., `frame.current_price > 1000`) selects only
+        the rows where it is True and not masked.
+
+        Args:
+            key: Row selector.
+
+        Returns:
+            ProductFrame holding the selected rows.
+        """
+
+        if isinstance(key, np.ma.MaskedArray):
+            key = key.filled(False)
+
+        return ProductFrame(
+            **{
+                name: (
+                    column.take(key)
+                    if isinstance(column, EncodedColumn)
+                    else column[key]
+                )
+                for name, column in self.columns().items()
+            }
+        )
+
+    def columns(self) -> Dict[str, Column]:
+        """Get every column, keyed by name."""
+
+        return {name: getattr(self, name) for name in PRODUCT_FRAME_COLUMNS}
+
+    def sort_by(self, name: str, descending: bool = False) -> "ProductFrame":
+        """
+        Sort the products by a column.
+
+        The sort is stable, and rows with a missing value (masked, NaN or NaT)
+        always come last.
+
+        Args:
+            name: Column to sort by.
+            descending: Whether to put the largest values first.
+
+        Returns:
+            Sorted ProductFrame.
+
+        Raises:
+            ValueError: If the column is unknown.
+        """
+
+        if name not in PRODUCT_FRAME_COLUMNS:
+            raise ValueError(f"Unknown ProductFrame column {name!r}")
+
+        column = getattr(self, name)
+        keys = column.decode() if isinstance(column, EncodedColumn) else column
+        missing = _missing(keys)
+        present = np.flatnonzero(~missing)
+        present_keys = np.asarray(keys)[present]
+
+        if descending:
+            # Sorting the reversed keys and reversing the result keeps equal keys
+            # in their original order.
+            order = np.argsort(present_keys[::-1], kind="stable")[::-1]
+            order = present[len(present) - 1 - order]
+        else:
+            order = present[np.argsort(present_keys, kind="stable")]
+
+        return self[np.concatenate([order, np.flatnonzero(missing)])]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Convert the frame back to one dictionary per product.
+
+        Missing values become None, dates `datetime` objects and encoded columns
+        plain strings.
+
+        Returns:
+            List of dictionaries keyed by column name.
+        """
+
+        values: Dict[str, Sequence[Any]] = {}
+
+        for name, column in self.columns().items():
+            if isinstance(column, EncodedColumn):
+                values[name] = column.decode().tolist()
+            elif isinstance(column, np.ma.MaskedArray):
+                values[name] = [
+                    None if masked else value
+                    for value, masked in zip(
+                        column.data.tolist(), np.ma.getmaskarray(column).tolist()
+                    )
+                ]
+            elif column.dtype.kind == "M":
+                values[name] = [None if np.isnat(d) else d.item() for d in column]
+            elif column.dtype.kind == "f":
+                values[name] = [None if np.isnan(v) else v for v in column.tolist()]
+            else:
+                values[name] = column.tolist()
+
+        return [
+            {name: values[name][i] for name in PRODUCT_FRAME_COLUMNS}
+            for i in range(len(self))
+        ]
+
+
+def _masked_int_array(values: List[Optional[int]]) -> "np.ma.MaskedArray":
+    """Build an int64 array masked where the value is None."""
+
+    return np.ma.masked_array(
+        [0 if value is None else value for value in values],
+        mask=[value is None for value in values],
+        dtype=np.int64,
+    )
+
+
+def _missing(values: "np.ndarray") -> "np.ndarray":
+    """Get a boolean mask of the missing values of a column."""
+
+    if isinstance(values, np.ma.MaskedArray):
+        return np.ma.getmaskarray(values)
+
+    if values.dtype.kind == "M":
+        return cast("np.ndarray", np.isnat(values))
+
+    if values.dtype.kind == "f":
+        return cast("np.ndarray", np.isnan(values))
+
+    return np.zeros(len(values), dtype=bool)
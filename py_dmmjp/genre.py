@@ -121,13 +121,21 @@ class GenreSearchResponse:
     "Complete raw API response data (internal use, not displayed)"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "GenreSearchResponse":
-        """Create GenreSearchResponse from the full API response dictionary."""
+    def from_dict(
+        cls, data: Dict[str, Any], keep_raw: bool = True
+    ) -> "GenreSearchResponse":
+        """
+        Create GenreSearchResponse from the full API response dictionary.
+
+        Args:
+            data: Complete API response dictionary.
+            keep_raw: Whether to keep a copy of `data`, available as `raw_response`.
+        """
 
         return cls(
             request=ApiRequest.from_dict(data.get("request", {})),
             result=GenreSearchResult.from_dict(data.get("result", {})),
-            _raw_response=data.copy(),
+            _raw_response=data.copy() if keep_raw else None,
         )
 
     @property
@@ -0,0 +1,116 @@
+"""
+Flyweight interning of values repeated across products.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .product import PRODUCT_LAZY_FIELDS, ItemDetails, ItemInfo
+
+INTERNED_PRODUCT_FIELDS = (
+    "service_code",
+    "service_name",
+    "floor_code",
+    "floor_name",
+    "category_name",
+    "stock",
+)
+"Product string fields that are identical for every product of a floor"
+
+
+class Interner:
+    """
+    Table sharing equal `ItemInfo` records and repeated strings between products.
+
+    The same genre, maker, label or actress appears in thousands of products, and
+    every product of a floor repeats its service and floor names. Products parsed
+    with an interner reuse the first equal `ItemInfo` and string instead of
+    keeping a fresh copy each, which cuts the memory of large in-memory catalogs.
+
+    Entries live as long as the interner, so scope it to a client or a crawl and
+    `clear` it (or drop it) when done. Shared `ItemInfo` objects must not be
+    mutated, since the change would show in every product using them.
+
+    Example:
+        >>> interner = Interner()
+        >>> client = DMMClient(api_key, affiliate_id, interner=interner)
+        >>> products = list(client.iter_products(site="FANZA", service="digital"))
+        >>> len(interner)
+        1834
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty interning table."""
+
+        self._strings: Dict[str, str] = {}
+        self._item_infos: Dict[Tuple[int, str, Optional[str]], ItemInfo] = {}
+        self.product_parsers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            **PRODUCT_LAZY_FIELDS,
+            "item_info": self._parse_item_details,
+        }
+        "Nested product field parsers, like `PRODUCT_LAZY_FIELDS`, using the table"
+
+    def __len__(self) -> int:
+        """Get the number of interned strings and ItemInfo records."""
+
+        return len(self._strings) + len(self._item_infos)
+
+    def string(self, value: str) -> str:
+        """
+        Get the shared instance of a string.
+
+        Args:
+            value: String to intern.
+
+        Returns:
+            The first interned string equal to `value`.
+        """
+
+        return self._strings.setdefault(value, value)
+
+    def item_info(self, data: Dict[str, Any]) -> ItemInfo:
+        """
+        Get the shared ItemInfo for an `iteminfo` entry.
+
+        Args:
+            data: Entry with `id`, `name` and optional `ruby`.
+
+        Returns:
+            The first ItemInfo parsed with the same id, name and ruby.
+        """
+
+        key = (int(data.get("id", 0)), data.get("name", ""), data.get("ruby"))
+        info = self._item_infos.get(key)
+
+        if info is None:
+            info = ItemInfo(id=key[0], name=self.string(key[1]), ruby=key[2])
+            self._item_infos[key] = info
+
+        return info
+
+    def intern_fields(self, values: Dict[str, Any]) -> None:
+        """
+        Intern the `INTERNED_PRODUCT_FIELDS` of parsed product fields in place.
+
+        Args:
+            values: Product field values keyed by field name.
+        """
+
+        for name in INTERNED_PRODUCT_FIELDS:
+            value = values.get(name)
+
+            if isinstance(value, str):
+                values[name] = self.string(value)
+
+    def clear(self) -> None:
+        """Drop every interned value."""
+
+        self._strings.clear()
+        self._item_infos.clear()
+
+    def _parse_item_details(self, data: Dict[str, Any]) -> Optional[ItemDetails]:
+        """Parse the `iteminfo` of a product item with shared ItemInfo records."""
+
+        if not data.get("iteminfo"):
+            return None
+
+        return ItemDetails.from_dict(data["iteminfo"], interner=self)
@@ -0,0 +1,62 @@
+"""
+JSON decoding backends for the DMM API clients.
+"""
+
+import importlib
+from typing import Any, Callable, Optional, Union, cast
+
+JSONLoads = Callable[[Union[bytes, str]], Any]
+"Function decoding a JSON document from raw bytes or text"
+
+JSON_BACKENDS = ("orjson", "ujson", "json")
+"Supported JSON backends, named after the module providing them"
+
+PREFERRED_JSON_BACKENDS = ("orjson", "json")
+"Backends tried in order when none is requested explicitly"
+
+
+def get_json_loads(backend: Optional[str] = None) -> JSONLoads:
+    """
+    Get the `loads` function of a JSON backend.
+
+    Every backend accepts raw response bytes, so bodies can be decoded without
+    building an intermediate str, and raises a ValueError subclass on invalid
+    input.
+
+    Args:
+        backend: 'orjson', 'ujson' or 'json'. Defaults to orjson when it is
+                 installed and to the standard library otherwise.
+
+    Returns:
+        The decoding function.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the requested backend is not installed.
+
+    Example:
+        >>> loads = get_json_loads()
+        >>> loads(b'{"result": {"status": 200}}')
+        {'result': {'status': 200}}
+    """
+
+    if backend is None:
+        for name in PREFERRED_JSON_BACKENDS:
+            try:
+                return get_json_loads(name)
+            except ImportError:
+                continue
+
+    if backend not in JSON_BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend {backend!r}; expected one of "
+            f"{', '.join(JSON_BACKENDS)}"
+        )
+
+    module = importlib.import_module(backend)
+
+    return cast(JSONLoads, module.loads)
+
+
+default_json_loads: JSONLoads = get_json_loads()
+"Decoder used by the clients unless another one is given"
@@ -0,0 +1,68 @@
+"""
+Thread-pool helpers running several DMM API calls in parallel.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, List, Mapping, TypeVar, Union
+
+from .exceptions import DMMError
+
+T = TypeVar("T")
+
+
+def map_in_threads(
+    fn: Callable[..., T],
+    params_list: Iterable[Mapping[str, Any]],
+    max_workers: int,
+    return_exceptions: bool = False,
+) -> List[Union[T, DMMError]]:
+    """
+    Call `fn(**params)` for each parameter set on a thread pool.
+
+    The pool lives for the duration of the call. When a call fails and
+    `return_exceptions` is False, the calls that have not started yet are
+    cancelled and the error is raised once the running ones finish.
+
+    Args:
+        fn: Function to call, typically a client method.
+        params_list: Keyword arguments of each call.
+        max_workers: Maximum number of calls running at once.
+        return_exceptions: Whether a DMMError raised by a call is returned in
+                           its place instead of being raised.
+
+    Returns:
+        The result of each call, in the order of `params_list`.
+
+    Raises:
+        ValueError: If `max_workers` is less than 1.
+        DMMError: The first error, in input order, if `return_exceptions` is False.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+
+    calls = [partial(fn, **params) for params in params_list]
+
+    if not calls:
+        return []
+
+    results: List[Union[T, DMMError]] = []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [executor.submit(call) for call in calls]
+
+        try:
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except DMMError as e:
+                    if not return_exceptions:
+                        raise
+
+                    results.append(e)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    return results
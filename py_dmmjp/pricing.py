@@ -0,0 +1,74 @@
+"""
+Parsing of the price strings returned by the DMM API.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+PriceRange = Tuple[Optional[int], Optional[int]]
+"Minimum and maximum amount of a price; the maximum is None for open ranges"
+
+_AMOUNT = re.compile(r"\d[\d,]*")
+_RANGE_MARKS = ("~", "～", "〜")
+
+
+@lru_cache(maxsize=4096)
+def parse_price(price: str) -> PriceRange:
+    """
+    Parse a price string into its minimum and maximum amount.
+
+    Currency symbols and thousands separators are ignored, and a trailing '~'
+    marks a price that starts at the amount. Results are memoized, since a
+    catalog repeats the same few hundred price strings.
+
+    Args:
+        price: Price as returned by the API (e.g., '¥1,980', '300~', '500~1,000').
+
+    Returns:
+        `(minimum, maximum)`. Both are None if the string holds no amount, and the
+        maximum is None for an open range such as '300~'.
+
+    Example:
+        >>> parse_price("¥1,980")
+        (1980, 1980)
+        >>> parse_price("300~")
+        (300, None)
+    """
+
+    amounts = [int(amount.replace(",", "")) for amount in _AMOUNT.findall(price)]
+
+    if not amounts:
+        return None, None
+
+    if len(amounts) == 1 and any(mark in price for mark in _RANGE_MARKS):
+        return amounts[0], None
+
+    return amounts[0], amounts[-1]
+
+
+def parse_prices(
+    prices: Iterable[Optional[str]],
+) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+    """
+    Parse a batch of price strings into minimum and maximum columns.
+
+    Each distinct string is parsed once, so a page or a whole crawl can be
+    normalized in a single pass (e.g., for `ProductFrame` or exports).
+
+    Args:
+        prices: Price strings; None or empty entries have no amount.
+
+    Returns:
+        `(minimums, maximums)`, one entry per input price.
+    """
+
+    minimums: List[Optional[int]] = []
+    maximums: List[Optional[int]] = []
+
+    for price in prices:
+        low, high = parse_price(price) if price else (None, None)
+        minimums.append(low)
+        maximums.append(high)
+
+    return minimums, maximums
@@ -3,12 +3,34 @@
 Data models for the py-dmm library.
 """
 
-import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, TypedDict, Union
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+    Union,
+    cast,
+)
 
 from .commons import ApiRequest
+from .dates import parse_datetime
+from .pricing import PriceRange, parse_price
+
+if TYPE_CHECKING:
+    from .interning import Interner
+
+ITEM_LIST_MAX_HITS = 100
+"Maximum number of items the ItemList API returns in a single page"
+
+ITEM_LIST_MAX_OFFSET = 50000
+"Highest search start position (offset) accepted by the ItemList API"
 
 
 class ProductSearchParams(TypedDict, total=False):
@@ -180,6 +202,18 @@ class Delivery:
             list_price=data.get("list_price", ""),
         )
 
+    @property
+    def price_int(self) -> Optional[int]:
+        """Get price as integer (the lowest amount of a range)."""
+
+        return parse_price(self.price)[0] if self.price else None
+
+    @property
+    def list_price_int(self) -> Optional[int]:
+        """Get list price as integer (the lowest amount of a range)."""
+
+        return parse_price(self.list_price)[0] if self.list_price else None
+
 
 @dataclass
 class Prices:
@@ -211,25 +245,27 @@ class Prices:
 
     @property
     def price_int(self) -> Optional[int]:
-        """Get price as integer."""
+        """Get price as integer (the lowest amount of a range such as '300~')."""
 
-        if self.price:
-            match = re.search(r"\d+", self.price)
+        return self.price_range[0]
 
-            return int(match.group()) if match else None
+    @property
+    def list_price_int(self) -> Optional[int]:
+        """Get list price as integer (the lowest amount of a range)."""
 
-        return None
+        return self.list_price_range[0]
 
     @property
-    def list_price_int(self) -> Optional[int]:
-        """Get list price as integer."""
+    def price_range(self) -> PriceRange:
+        """Get the minimum and maximum price; the maximum is None for '300~'."""
 
-        if self.list_price:
-            match = re.search(r"\d+", self.list_price)
+        return parse_price(self.price) if self.price else (None, None)
 
-            return int(match.group()) if match else None
+    @property
+    def list_price_range(self) -> PriceRange:
+        """Get the minimum and maximum list price."""
 
-        return None
+        return parse_price(self.list_price) if self.list_price else (None, None)
 
 
 @dataclass
@@ -298,18 +334,32 @@ class ItemDetails:
     "Artist/composer (e.g., 'とうけんだんしふぉーめーしょんおぶみちのおくひとつはちす')"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ItemDetails":
-        """Create ItemDetails from dictionary."""
+    def from_dict(
+        cls, data: Dict[str, Any], interner: Optional["Interner"] = None
+    ) -> "ItemDetails":
+        """
+
+        Create ItemDetails from dictionary.
+
+        Args:
+            data: The `iteminfo` section of a product item.
+            interner: Optional table sharing equal ItemInfo records.
+
+        Returns:
+            ItemDetails instance.
+        """
+
+        parse_item = interner.item_info if interner is not None else ItemInfo.from_dict
 
         def parse_items(key: str) -> List[ItemInfo]:
             items = data.get(key, [])
 
-            return [ItemInfo.from_dict(item) for item in items]
+            return [parse_item(item) for item in items]
 
         def parse_manufacture() -> List[ItemInfo]:
             items = data.get("manufacturer", data.get("manufacture", []))
 
-            return [ItemInfo.from_dict(item) for item in items]
+            return [parse_item(item) for item in items]
 
         return cls(
             genre=parse_items("genre"),
@@ -383,6 +433,100 @@ class Campaign:
         )
 
 
+def _parse_date(data: Dict[str, Any]) -> Optional[datetime]:
+    """Parse the release date of a product item."""
+
+    if "date" in data and data["date"]:
+        return parse_datetime(data["date"])
+
+    return None
+
+
+def _parse_count(value: Any) -> Optional[Union[int, str]]:
+    """Parse a volume or number field, keeping non-numeric values as-is."""
+
+    if not value:
+        return None
+
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return cast(str, value)
+
+
+def _parse_optional_model(model: Any, key: str, data: Dict[str, Any]) -> Any:
+    """Parse an optional nested model stored under `key` of a product item."""
+
+    return model.from_dict(data[key]) if data.get(key) else None
+
+
+def _parse_model(model: Any, key: str) -> Callable[[Dict[str, Any]], Any]:
+    """Build a picklable parser for an optional nested model stored under `key`."""
+
+    return partial(_parse_optional_model, model, key)
+
+
+def _parse_campaign(data: Dict[str, Any]) -> Optional[List[Campaign]]:
+    """Parse the campaigns of a product item."""
+
+    if "campaign" in data and data["campaign"]:
+        return [Campaign.from_dict(c) for c in data["campaign"]]
+
+    return None
+
+
+def _parse_directory(data: Dict[str, Any]) -> List[Directory]:
+    """Parse the directory entries of a product item."""
+
+    return [Directory.from_dict(d) for d in data.get("directory", [])]
+
+
+def _parse_product_scalars(
+    data: Dict[str, Any], interner: Optional["Interner"] = None
+) -> Dict[str, Any]:
+    """Extract the plain (non-nested) fields of a product item."""
+
+    scalars = {
+        "service_code": data.get("service_code", ""),
+        "service_name": data.get("service_name", ""),
+        "floor_code": data.get("floor_code", ""),
+        "floor_name": data.get("floor_name", ""),
+        "category_name": data.get("category_name", ""),
+        "content_id": data.get("content_id", ""),
+        "product_id": data.get("product_id", ""),
+        "title": data.get("title", ""),
+        "volume": _parse_count(data.get("volume")),
+        "number": _parse_count(data.get("number")),
+        "url": data.get("URL"),
+        "affiliate_url": data.get("affiliateURL"),
+        "jancode": data.get("jancode"),
+        "maker_product": data.get("maker_product"),
+        "isbn": data.get("isbn"),
+        "stock": data.get("stock"),
+    }
+
+    if interner is not None:
+        interner.intern_fields(scalars)
+
+    return scalars
+
+
+PRODUCT_LAZY_FIELDS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "date": _parse_date,
+    "image_url": _parse_model(ImageURL, "imageURL"),
+    "sample_image_url": _parse_model(SampleImages, "sampleImageURL"),
+    "sample_movie_url": _parse_model(SampleMovieURL, "sampleMovieURL"),
+    "tachiyomi": _parse_model(TachiyomiInfo, "tachiyomi"),
+    "prices": _parse_model(Prices, "prices"),
+    "review": _parse_model(Review, "review"),
+    "item_info": _parse_model(ItemDetails, "iteminfo"),
+    "cdinfo": _parse_model(CDInfo, "cdinfo"),
+    "campaign": _parse_campaign,
+    "directory": _parse_directory,
+}
+"Product fields that `LazyProduct` parses on first access, with their parsers"
+
+
 @dataclass
 class Product:
     """Represents a complete product from the DMM API with all available metadata."""
@@ -472,126 +616,43 @@ class Product:
     "Original API response data (internal use, not displayed)"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Product":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        lazy: bool = False,
+        keep_raw: bool = True,
+        interner: Optional["Interner"] = None,
+    ) -> "Product":
         """
 
         Create a Product instance from a dictionary.
 
         Args:
             data: Dictionary containing product data from DMM API.
+            lazy: Whether to defer parsing of the date and nested models (images,
+                  prices, item info, campaigns, ...) until they are first accessed.
+                  See `LazyProduct`.
+            keep_raw: Whether to keep a copy of `data`, available as `raw_data`.
+                      Disable it to save memory when parsing many products.
+            interner: Optional table sharing ItemInfo records and repeated strings
+                      (service and floor names, ...) with other products.
 
         Returns:
             Product instance.
         """
 
-        date = None
-        if "date" in data and data["date"]:
-            try:
-                date_str = data["date"]
-                date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        if lazy:
+            return LazyProduct.from_dict(data, keep_raw=keep_raw, interner=interner)
 
-            except (ValueError, TypeError):
-                date = None
-
-        image_url = (
-            ImageURL.from_dict(data.get("imageURL", {}))
-            if data.get("imageURL")
-            else None
-        )
-
-        sample_image_url = (
-            SampleImages.from_dict(data.get("sampleImageURL", {}))
-            if data.get("sampleImageURL")
-            else None
-        )
-
-        sample_movie_url = (
-            SampleMovieURL.from_dict(data.get("sampleMovieURL", {}))
-            if data.get("sampleMovieURL")
-            else None
-        )
-
-        tachiyomi = (
-            TachiyomiInfo.from_dict(data.get("tachiyomi", {}))
-            if data.get("tachiyomi")
-            else None
+        parsers = (
+            interner.product_parsers if interner is not None else PRODUCT_LAZY_FIELDS
         )
-
-        prices = (
-            Prices.from_dict(data.get("prices", {})) if data.get("prices") else None
-        )
-
-        review = (
-            Review.from_dict(data.get("review", {})) if data.get("review") else None
-        )
-
-        item_info = (
-            ItemDetails.from_dict(data.get("iteminfo", {}))
-            if data.get("iteminfo")
-            else None
-        )
-
-        cdinfo = (
-            CDInfo.from_dict(data.get("cdinfo", {})) if data.get("cdinfo") else None
-        )
-
-        campaign = None
-        if "campaign" in data and data["campaign"]:
-            campaign_data = data.get("campaign", [])
-            campaign = [Campaign.from_dict(c) for c in campaign_data]
-
-        volume = None
-        if "volume" in data and data["volume"]:
-            volume_data = data["volume"]
-
-            try:
-                volume = int(volume_data)
-            except (ValueError, TypeError):
-                volume = volume_data
-
-        number = None
-        if "number" in data and data["number"]:
-            number_data = data["number"]
-
-            try:
-                number = int(number_data)
-            except (ValueError, TypeError):
-                number = number_data
-
-        directory = []
-        if "directory" in data:
-            dir_data = data.get("directory", [])
-            directory = [Directory.from_dict(d) for d in dir_data]
+        nested = {name: parse(data) for name, parse in parsers.items()}
 
         return cls(
-            service_code=data.get("service_code", ""),
-            service_name=data.get("service_name", ""),
-            floor_code=data.get("floor_code", ""),
-            floor_name=data.get("floor_name", ""),
-            category_name=data.get("category_name", ""),
-            content_id=data.get("content_id", ""),
-            product_id=data.get("product_id", ""),
-            title=data.get("title", ""),
-            volume=volume,
-            number=number,
-            url=data.get("URL"),
-            affiliate_url=data.get("affiliateURL"),
-            image_url=image_url,
-            sample_image_url=sample_image_url,
-            sample_movie_url=sample_movie_url,
-            tachiyomi=tachiyomi,
-            prices=prices,
-            review=review,
-            date=date,
-            jancode=data.get("jancode"),
-            maker_product=data.get("maker_product"),
-            isbn=data.get("isbn"),
-            stock=data.get("stock"),
-            item_info=item_info,
-            directory=directory,
-            cdinfo=cdinfo,
-            campaign=campaign,
-            _raw_data=data.copy(),
+            **_parse_product_scalars(data, interner),
+            **nested,
+            _raw_data=data.copy() if keep_raw else None,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -756,6 +817,85 @@ class Product:
         return None
 
 
+class _LazyField:
+    """Non-data descriptor that parses a product field on first access."""
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+
+        # pylint: disable=protected-access
+        value = instance._lazy_parsers[self._name](instance._lazy_source)
+        instance.__dict__[self._name] = value
+
+        return value
+
+
+class LazyProduct(Product):
+    """
+    Product whose date and nested models are parsed on first access.
+
+    `from_dict` only copies plain fields such as `title` and `affiliate_url`. The
+    fields listed in `PRODUCT_LAZY_FIELDS` are parsed from the source item when
+    first read and then memoized on the instance, so list pages only pay for the
+    fields they render. Assigning a field works as on `Product`.
+
+    A lazy product keeps a reference to its source item until garbage collected,
+    so the item must not be mutated after parsing.
+    """
+
+    _lazy_source: Dict[str, Any]
+
+    _lazy_parsers: Dict[str, Callable[[Dict[str, Any]], Any]] = PRODUCT_LAZY_FIELDS
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        lazy: bool = True,
+        keep_raw: bool = True,
+        interner: Optional["Interner"] = None,
+    ) -> "LazyProduct":
+        """
+
+        Create a LazyProduct instance from a dictionary.
+
+        Args:
+            data: Dictionary containing product data from DMM API.
+            lazy: Ignored; a LazyProduct is always lazy.
+            keep_raw: Whether to keep a copy of `data`, available as `raw_data`.
+            interner: Optional table sharing ItemInfo records and repeated strings
+                      with other products, also used by the deferred parsing.
+
+        Returns:
+            LazyProduct instance.
+        """
+
+        product = cls.__new__(cls)
+        product.__dict__.update(_parse_product_scalars(data, interner))
+        product._lazy_source = data
+
+        if interner is not None:
+            product._lazy_parsers = interner.product_parsers
+
+        product._raw_data = data.copy() if keep_raw else None
+
+        return product
+
+    @property
+    def parsed_fields(self) -> List[str]:
+        """Get the names of the lazy fields parsed (or assigned) so far."""
+
+        return [name for name in PRODUCT_LAZY_FIELDS if name in self.__dict__]
+
+
+for _name in PRODUCT_LAZY_FIELDS:
+    setattr(LazyProduct, _name, _LazyField(_name))
+
+
 @dataclass
 class ProductApiResult:
     """Represents the result section of the API response."""
@@ -776,10 +916,18 @@ class ProductApiResult:
     "List of product items returned by the API"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ProductApiResult":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        keep_raw: bool = True,
+        interner: Optional["Interner"] = None,
+    ) -> "ProductApiResult":
         """Create ProductApiResult from dictionary."""
 
-        items = [Product.from_dict(item) for item in data.get("items", [])]
+        items = [
+            Product.from_dict(item, keep_raw=keep_raw, interner=interner)
+            for item in data.get("items", [])
+        ]
 
         return cls(
             status=data.get("status", 200),
@@ -804,13 +952,22 @@ class ProductApiResponse:
     "Complete raw API response data (internal use, not displayed)"
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "ProductApiResponse":
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        keep_raw: bool = True,
+        interner: Optional["Interner"] = None,
+    ) -> "ProductApiResponse":
         """
 
         Create ProductApiResponse from the full API response dictionary.
 
         Args:
             data: Complete API response dictionary.
+            keep_raw: Whether the response and its products keep a copy of their
+                      raw data, available as `raw_response` and `raw_data`.
+            interner: Optional table sharing ItemInfo records and repeated strings
+                      between the products.
 
         Returns:
             ApiResponse instance.
@@ -818,8 +975,10 @@ class ProductApiResponse:
 
         return cls(
             request=ApiRequest.from_dict(data.get("request", {})),
-            result=ProductApiResult.from_dict(data.get("result", {})),
-            _raw_response=data.copy(),
+            result=ProductApiResult.from_dict(
+                data.get("result", {}), keep_raw, interner
+            ),
+            _raw_response=data.copy() if keep_raw else None,
         )
 
     @property
@@ -0,0 +1,154 @@
+"""
+Client-side rate limiting for the DMM API clients.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Request rate allowed for one API key."""
+
+    per_second: float
+    "Sustained number of requests allowed per second"
+
+    burst: int = 1
+    "Number of requests that may be sent back to back after an idle period"
+
+    def __post_init__(self) -> None:
+        if self.per_second <= 0:
+            raise ValueError("per_second must be positive")
+
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket enforcing a `RateLimit`.
+
+    Each request takes one token, and tokens refill at `per_second` up to `burst`.
+    When the bucket is empty, a caller reserves the next token and sleeps until it
+    is due, so concurrent callers are spaced out instead of woken all at once. The
+    bucket only keeps timestamps, so a single instance can be shared by threads and
+    by several event loops.
+    """
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        """
+        Initialize a full token bucket.
+
+        Args:
+            rate_limit: Rate enforced by the bucket.
+        """
+
+        self.rate_limit = rate_limit
+        self._tokens = float(rate_limit.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquisitions = 0
+        self.waits = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self) -> float:
+        """
+        Take a token, borrowing against future refills if the bucket is empty.
+
+        Returns:
+            Seconds the caller must wait before sending its request.
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate_limit.burst),
+                self._tokens + (now - self._updated) * self.rate_limit.per_second,
+            )
+            self._updated = now
+            self._tokens -= 1
+            delay = max(0.0, -self._tokens / self.rate_limit.per_second)
+
+            self.acquisitions += 1
+
+            if delay > 0:
+                self.waits += 1
+                self.total_wait += delay
+                self.max_wait = max(self.max_wait, delay)
+
+            return delay
+
+    def acquire(self) -> float:
+        """
+        Block the current thread until a request may be sent.
+
+        Returns:
+            Seconds spent waiting.
+        """
+
+        delay = self.reserve()
+
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Suspend the current task until a request may be sent.
+
+        Returns:
+            Seconds spent waiting.
+        """
+
+        delay = self.reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    @property
+    def average_wait(self) -> float:
+        """Get the average wait per acquisition, in seconds."""
+
+        return self.total_wait / self.acquisitions if self.acquisitions else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset the wait-time metrics."""
+
+        with self._lock:
+            self.acquisitions = 0
+            self.waits = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+
+_buckets: Dict[Tuple[str, RateLimit], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(api_id: str, rate_limit: RateLimit) -> TokenBucket:
+    """
+    Get the token bucket shared by every client using an API key and rate.
+
+    Args:
+        api_id: DMM API key the limit applies to.
+        rate_limit: Rate enforced for the key.
+
+    Returns:
+        The shared token bucket.
+    """
+
+    with _buckets_lock:
+        bucket = _buckets.get((api_id, rate_limit))
+
+        if bucket is None:
+            bucket = TokenBucket(rate_limit)
+            _buckets[(api_id, rate_limit)] = bucket
+
+        return bucket
@@ -0,0 +1,191 @@
+"""
+Retry policy for transient DMM API failures.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, FrozenSet, Iterable, Optional, TypeVar
+
+from .exceptions import DMMAPIError, DMMConnectionError, DMMTimeoutError
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+"HTTP statuses retried by default: rate limiting and transient server errors"
+
+
+class RetryPolicy:
+    """
+    Retries transient failures with capped exponential backoff and full jitter.
+
+    Timeouts, connection errors and responses whose HTTP status is in
+    `retry_statuses` are retried; any other error is raised immediately. The delay
+    before retry `n` is drawn uniformly from `[0, min(max_backoff,
+    backoff_factor * 2 ** (n - 1))]`, or is exactly that bound when jitter is off.
+    A policy only keeps counters, so it can be shared by several clients.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        *,
+        jitter: bool = True,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES,
+        deadline: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first one.
+            backoff_factor: Base delay in seconds, doubled after every retry.
+            max_backoff: Upper bound of a single delay in seconds.
+            jitter: Whether to randomize delays so clients do not retry in lockstep.
+            retry_statuses: HTTP status codes that are retried.
+            deadline: Optional total time budget in seconds across all attempts. No
+                      retry is started if its delay would exceed the budget.
+
+        Raises:
+            ValueError: If `max_attempts` is less than 1 or a delay is negative.
+        """
+
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        if backoff_factor < 0 or max_backoff < 0:
+            raise ValueError("backoff_factor and max_backoff must not be negative")
+
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.deadline = deadline
+        self.retry_count = 0
+        self.exhausted_count = 0
+        self._stats_lock = threading.Lock()
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Check whether an error is transient and worth retrying.
+
+        Args:
+            error: Error raised by an attempt.
+
+        Returns:
+            True if the request should be retried.
+        """
+
+        if isinstance(error, (DMMTimeoutError, DMMConnectionError)):
+            return True
+
+        return (
+            isinstance(error, DMMAPIError) and error.status_code in self.retry_statuses
+        )
+
+    def backoff(self, retry: int) -> float:
+        """
+        Compute the delay before a retry.
+
+        Args:
+            retry: Number of the retry, starting at 1.
+
+        Returns:
+            Delay in seconds.
+        """
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (retry - 1))
+
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def _next_delay(
+        self, error: BaseException, attempt: int, started: float
+    ) -> Optional[float]:
+        """Get the delay before the next attempt, or None to give up."""
+
+        if not self.is_retryable(error):
+            return None
+
+        delay = self.backoff(attempt)
+        out_of_time = (
+            self.deadline is not None
+            and time.monotonic() - started + delay > self.deadline
+        )
+
+        with self._stats_lock:
+            if attempt >= self.max_attempts or out_of_time:
+                self.exhausted_count += 1
+                return None
+
+            self.retry_count += 1
+
+        return delay
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Call `fn`, retrying transient failures.
+
+        Args:
+            fn: Function performing one attempt.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            DMMAPIError: The error of the last attempt if every attempt failed.
+        """
+
+        started = time.monotonic()
+        attempt = 1
+
+        while True:
+            try:
+                return fn()
+            except DMMAPIError as e:
+                delay = self._next_delay(e, attempt, started)
+
+                if delay is None:
+                    raise
+
+            time.sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `fn()`, retrying transient failures.
+
+        Args:
+            fn: Coroutine function performing one attempt.
+
+        Returns:
+            The result of the first successful attempt.
+
+        Raises:
+            DMMAPIError: The error of the last attempt if every attempt failed.
+        """
+
+        started = time.monotonic()
+        attempt = 1
+
+        while True:
+            try:
+                return await fn()
+            except DMMAPIError as e:
+                delay = self._next_delay(e, attempt, started)
+
+                if delay is None:
+                    raise
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def reset_stats(self) -> None:
+        """Reset the retry counters."""
+
+        with self._stats_lock:
+            self.retry_count = 0
+            self.exhausted_count = 0
@@ -0,0 +1,83 @@
+"""
+Date-window sharding helpers used to crawl ItemList searches past the offset ceiling.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Mapping, Tuple
+
+ITEM_LIST_DATE_FORMAT = "%Y-%m-%dT%H:%M:%S"
+"Date format accepted by the `gte_date` and `lte_date` ItemList parameters"
+
+EARLIEST_RELEASE_DATE = datetime(1900, 1, 1)
+"Lower bound used when a search does not specify `gte_date`"
+
+RELEASE_DATE_LOOKAHEAD = timedelta(days=730)
+"How far past today an open-ended search reaches, so pre-orders are included"
+
+
+@dataclass(frozen=True)
+class DateWindow:
+    """Represents an inclusive release date range used as a single crawl shard."""
+
+    start: datetime
+    "Earliest release date included in the window"
+
+    end: datetime
+    "Latest release date included in the window"
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, Any]) -> "DateWindow":
+        """
+        Create the window covered by a product search.
+
+        Missing bounds default to `EARLIEST_RELEASE_DATE` and to today plus
+        `RELEASE_DATE_LOOKAHEAD`.
+
+        Args:
+            params: Product search parameters, optionally with `gte_date`/`lte_date`.
+
+        Returns:
+            DateWindow instance.
+        """
+
+        gte_date = params.get("gte_date")
+        lte_date = params.get("lte_date")
+
+        start = datetime.fromisoformat(gte_date) if gte_date else EARLIEST_RELEASE_DATE
+        end = (
+            datetime.fromisoformat(lte_date)
+            if lte_date
+            else datetime.now().replace(microsecond=0) + RELEASE_DATE_LOOKAHEAD
+        )
+
+        return cls(start=start, end=end)
+
+    def to_params(self) -> Dict[str, str]:
+        """Convert the window to ItemList `gte_date`/`lte_date` parameters."""
+
+        return {
+            "gte_date": self.start.strftime(ITEM_LIST_DATE_FORMAT),
+            "lte_date": self.end.strftime(ITEM_LIST_DATE_FORMAT),
+        }
+
+    def can_split(self) -> bool:
+        """Check whether the window spans more than one second."""
+
+        return self.end - self.start >= timedelta(seconds=1)
+
+    def split(self) -> Tuple["DateWindow", "DateWindow"]:
+        """
+        Split the window into two adjacent, non-overlapping halves.
+
+        Returns:
+            The earlier and the later half of the window.
+        """
+
+        middle = self.start + (self.end - self.start) // 2
+        middle = middle.replace(microsecond=0)
+
+        return (
+            DateWindow(start=self.start, end=middle),
+            DateWindow(start=middle + timedelta(seconds=1), end=self.end),
+        )
@@ -0,0 +1,149 @@
+"""
+Request coalescing (single-flight) helpers for the DMM API clients.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Generic, Optional, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """Represents a call in progress that other threads can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(Generic[T]):
+    """
+    Coalesces identical concurrent calls made from several threads.
+
+    While a call for a key is in flight, every other thread calling `do` with the
+    same key waits for that call and receives its result (or its exception)
+    instead of starting a call of its own.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, _Flight[T]] = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run `fn`, or join the call already in flight for `key`.
+
+        Args:
+            key: Identity of the call (e.g., a request cache key).
+            fn: Function performing the call.
+
+        Returns:
+            The result shared by every caller of the flight.
+        """
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+
+            if flight is None:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+
+            if flight.error is not None:
+                raise flight.error
+
+            return cast(T, flight.result)
+
+        try:
+            flight.result = fn()
+
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+            flight.done.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of distinct calls currently in flight."""
+
+        return len(self._flights)
+
+
+class AsyncSingleFlight(Generic[T]):
+    """
+    Coalesces identical concurrent calls made from coroutines of one event loop.
+
+    Every caller awaits the same shielded task, so cancelling one caller never
+    cancels the call shared by the others. The task itself is cancelled when its
+    last caller is, so abandoned calls do not keep running.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, "asyncio.Future[T]"] = {}
+        self._waiters: Dict["asyncio.Future[T]", int] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await `fn()`, or join the call already in flight for `key`.
+
+        Args:
+            key: Identity of the call (e.g., a request cache key).
+            fn: Coroutine function performing the call.
+
+        Returns:
+            The result shared by every caller of the flight.
+        """
+
+        flight = self._flights.get(key)
+
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[key] = flight
+            flight.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        self._waiters[flight] = self._waiters.get(flight, 0) + 1
+
+        try:
+            return await asyncio.shield(flight)
+        except asyncio.CancelledError:
+            if self._waiters[flight] == 1:
+                self._forget(key, flight)
+                flight.cancel()
+
+            raise
+        finally:
+            self._waiters[flight] -= 1
+
+            if not self._waiters[flight]:
+                del self._waiters[flight]
+
+    def _forget(self, key: str, flight: "asyncio.Future[Any]") -> None:
+        """Remove a flight and, once it finished, mark its exception as retrieved."""
+
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+        if flight.done() and not flight.cancelled():
+            flight.exception()
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of distinct calls currently in flight."""
+
+        return len(self._flights)
@@ -0,0 +1,301 @@
+"""
+HTTP transports used by the DMM API clients.
+
+A transport only sends GET requests and returns the raw status and body. Turning
+transport failures and HTTP error statuses into DMM exceptions happens here, in
+`translate_errors` and `check_response`, for every transport alike.
+"""
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple, Type, Union
+
+import requests
+import requests.exceptions
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+
+from .exceptions import (
+    DMMAPIError,
+    DMMAuthError,
+    DMMConnectionError,
+    DMMError,
+    DMMTimeoutError,
+)
+
+ErrorTypes = Tuple[Type[BaseException], ...]
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    """Raw response to a request sent by a transport."""
+
+    status: int
+    "HTTP status code (e.g., 200, 401, 503)"
+
+    body: bytes
+    "Raw response body"
+
+    @property
+    def text(self) -> str:
+        """Get the body decoded as UTF-8, for error messages."""
+
+        return self.body.decode("utf-8", errors="replace")
+
+
+@dataclass(frozen=True)
+class ConnectionPool:
+    """
+    Connection pool of the default DMMClient transport.
+
+    The defaults are those of `requests`. When a client is shared by more
+    threads than `maxsize`, the extra connections are opened for one request
+    and discarded, so size the pool to the number of threads, or set `block`.
+    """
+
+    connections: int = DEFAULT_POOLSIZE
+    "Number of hosts (e.g., api.dmm.com) to keep a connection pool for"
+
+    maxsize: int = DEFAULT_POOLSIZE
+    "Maximum number of connections kept open to one host"
+
+    block: bool = DEFAULT_POOLBLOCK
+    "Whether a request waits for a free connection when `maxsize` are in use"
+
+    keep_alive: bool = True
+    "Whether connections are reused; if False, each request opens a new one"
+
+    def __post_init__(self) -> None:
+        if self.connections < 1:
+            raise ValueError("connections must be at least 1")
+
+        if self.maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+
+@dataclass(frozen=True)
+class AsyncConnectionPool:
+    """
+    Connection pool (`aiohttp.TCPConnector`) of the default AsyncDMMClient transport.
+
+    The defaults are those of aiohttp. Concurrent requests beyond `limit` wait for
+    a free connection, so raise it along with the crawl concurrency.
+    """
+
+    limit: int = 100
+    "Maximum number of open connections, 0 for no limit"
+
+    limit_per_host: int = 0
+    "Maximum number of open connections to one host, 0 for no limit"
+
+    ttl_dns_cache: Optional[int] = 10
+    "Seconds DNS lookups are cached for, None to cache them forever"
+
+    use_dns_cache: bool = True
+    "Whether DNS lookups are cached"
+
+    keepalive_timeout: float = 15.0
+    "Seconds an idle connection is kept open for reuse"
+
+    keep_alive: bool = True
+    "Whether connections are reused; if False, each request opens a new one"
+
+    def __post_init__(self) -> None:
+        if self.limit < 0 or self.limit_per_host < 0:
+            raise ValueError("Connection limits cannot be negative")
+
+        if self.keepalive_timeout < 0:
+            raise ValueError("keepalive_timeout cannot be negative")
+
+
+class Transport(ABC):
+    """
+    Sends the HTTP requests of a DMMClient.
+
+    Implement `get` to plug in another HTTP stack (e.g., httpx or a urllib3 pool),
+    an in-process fake or a cached transport, and pass it as
+    `DMMClient(transport=...)`. The exception types a transport raises are
+    declared in `timeout_errors`, `connection_errors` and `request_errors`, so
+    the client reports them as DMMTimeoutError, DMMConnectionError and
+    DMMAPIError respectively, whatever the HTTP library.
+    """
+
+    timeout_errors: ErrorTypes = (TimeoutError,)
+    "Exceptions raised when a request timed out"
+
+    connection_errors: ErrorTypes = (ConnectionError,)
+    "Exceptions raised when the server could not be reached"
+
+    request_errors: ErrorTypes = (OSError,)
+    "Other exceptions raised when a request failed"
+
+    @abstractmethod
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        """
+        Send a GET request.
+
+        Args:
+            url: Full URL of the endpoint.
+            params: Query parameters, including authentication details.
+
+        Returns:
+            The response, whatever its status.
+        """
+
+    def close(self) -> None:
+        """Release the resources (e.g., connections) held by the transport."""
+
+
+class AsyncTransport(ABC):
+    """
+    Sends the HTTP requests of an AsyncDMMClient.
+
+    The asynchronous counterpart of `Transport`, passed as
+    `AsyncDMMClient(transport=...)`.
+    """
+
+    timeout_errors: ErrorTypes = (TimeoutError,)
+    "Exceptions raised when a request timed out"
+
+    connection_errors: ErrorTypes = (ConnectionError,)
+    "Exceptions raised when the server could not be reached"
+
+    request_errors: ErrorTypes = (OSError,)
+    "Other exceptions raised when a request failed"
+
+    @abstractmethod
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        """
+        Send a GET request.
+
+        Args:
+            url: Full URL of the endpoint.
+            params: Query parameters, including authentication details.
+
+        Returns:
+            The response, whatever its status.
+        """
+
+    async def close(self) -> None:
+        """Release the resources (e.g., connections) held by the transport."""
+
+
+class RequestsTransport(Transport):
+    """Default DMMClient transport, sending requests over a `requests.Session`."""
+
+    timeout_errors = (requests.exceptions.Timeout,)
+    connection_errors = (requests.exceptions.ConnectionError,)
+    request_errors = (requests.exceptions.RequestException,)
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        timeout: Optional[float] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        pool: Optional[ConnectionPool] = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            session: Session to send requests over. It is used as-is and is not
+                     closed by the transport. By default, the transport creates
+                     (and closes) its own.
+            timeout: Request timeout in seconds.
+            headers: Headers set on the session the transport creates.
+            pool: Connection pool of the session the transport creates.
+
+        Raises:
+            ValueError: If both a session and a pool are given.
+        """
+
+        if session is not None and pool is not None:
+            raise ValueError("A connection pool cannot be set on a given session")
+
+        self.owns_session = session is None
+        self.session = session if session is not None else requests.Session()
+        self.timeout = timeout
+
+        if self.owns_session and headers:
+            self.session.headers.update(headers)
+
+        if pool is not None:
+            adapter = HTTPAdapter(
+                pool_connections=pool.connections,
+                pool_maxsize=pool.maxsize,
+                pool_block=pool.block,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+
+            if not pool.keep_alive:
+                self.session.headers["Connection"] = "close"
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        """Send a GET request over the session."""
+
+        response = self.session.get(url, params=params, timeout=self.timeout)
+
+        if response.status_code >= 400:
+            # Error bodies are decoded with the encoding the server declared.
+            return TransportResponse(response.status_code, response.text.encode())
+
+        return TransportResponse(response.status_code, response.content)
+
+    def close(self) -> None:
+        """Close the session, if the transport created it."""
+
+        if self.owns_session:
+            self.session.close()
+
+
+@contextmanager
+def translate_errors(transport: Union[Transport, AsyncTransport]) -> Iterator[None]:
+    """
+    Report the exceptions of a transport as DMM exceptions.
+
+    Args:
+        transport: Transport sending the request in the `with` block.
+
+    Raises:
+        DMMTimeoutError: If the request timed out.
+        DMMConnectionError: If the server could not be reached.
+        DMMAPIError: If the request failed otherwise.
+    """
+
+    try:
+        yield
+    except DMMError:
+        raise
+    except transport.timeout_errors as e:
+        raise DMMTimeoutError("Request timed out") from e
+    except transport.connection_errors as e:
+        raise DMMConnectionError("Connection error occurred") from e
+    except transport.request_errors as e:
+        raise DMMAPIError(f"Request failed: {str(e)}") from e
+
+
+def check_response(response: TransportResponse) -> None:
+    """
+    Raise the DMM exception matching an HTTP error status.
+
+    Args:
+        response: Response returned by a transport.
+
+    Raises:
+        DMMAuthError: If the status is 401 or 403.
+        DMMAPIError: If the status is another error status.
+    """
+
+    if response.status == 401:
+        raise DMMAuthError("Invalid API key or authentication failed")
+
+    if response.status == 403:
+        raise DMMAuthError("Access forbidden - check your API key permissions")
+
+    if response.status >= 400:
+        raise DMMAPIError(
+            f"HTTP {response.status}: {response.text}",
+            status_code=response.status,
+            response_data=response.text,
+        )
@@ -3,11 +3,56 @@
 # pylint: disable=redefined-outer-name
 
 import os
+from typing import AsyncIterator, Optional, Sequence
+from unittest.mock import AsyncMock, Mock
 
 import pytest
+import requests
 
 from py_dmmjp import DMMClient
 
+FLOOR_RESPONSE = b'{"request": {}, "result": {"site": [{"name": "FANZA", "code": "FANZA", "service": []}]}}'
+
+GENRE_RESPONSE = b'{"request": {}, "result": {"status": 200, "genre": []}}'
+
+
+def make_response(status_code: int = 200, body: bytes = FLOOR_RESPONSE) -> Mock:
+    """Build a mock requests.Response with the given status and body."""
+
+    response = Mock()
+    response.status_code = status_code
+    response.text = body.decode("utf-8")
+    response.content = body
+
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    else:
+        response.raise_for_status.return_value = None
+
+    return response
+
+
+def make_async_response(
+    body: bytes, chunks: Sequence[bytes] = (), content_length: Optional[int] = None
+) -> AsyncMock:
+    """Build a mock aiohttp response whose body can be read or streamed."""
+
+    async def iter_chunked(_size: int) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+
+    response = AsyncMock()
+    response.status = 200
+    response.content_length = content_length
+    response.read = AsyncMock(return_value=body)
+    response.text = AsyncMock(side_effect=AssertionError("body decoded as text"))
+    response.content = Mock()
+    response.content.iter_chunked = iter_chunked
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+
+    return response
+
 
 @pytest.fixture
 def mock_api_key() -> str:
@@ -0,0 +1,211 @@
+"""
+Tests for the response cache layer.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.cache import MemoryCache, is_cacheable_response, make_cache_key
+from py_dmmjp.client import DMMClient
+
+from .conftest import make_response
+
+
+class TestCacheKey:
+    """Test cache key normalization."""
+
+    def test_excludes_api_id(self) -> None:
+        """Test that the API key never appears in cache keys."""
+
+        key = make_cache_key("/ItemList", {"api_id": "secret", "site": "FANZA"})
+
+        assert "secret" not in key
+        assert key == make_cache_key("/ItemList", {"api_id": "other", "site": "FANZA"})
+
+    def test_order_and_type_insensitive(self) -> None:
+        """Test that parameter order and int/str values do not change the key."""
+
+        first = make_cache_key("/ItemList", {"site": "FANZA", "hits": 10})
+        second = make_cache_key("/ItemList", {"hits": "10", "site": "FANZA"})
+
+        assert first == second
+
+    def test_endpoint_and_lists(self) -> None:
+        """Test that endpoints and list parameters are part of the key."""
+
+        params: Dict[str, Any] = {"article": ["actress", "genre"]}
+
+        assert make_cache_key("/ItemList", params) != make_cache_key(
+            "/GenreSearch", params
+        )
+        assert "article=actress&article=genre" in make_cache_key("/ItemList", params)
+
+    def test_is_cacheable_response(self) -> None:
+        """Test which responses may be cached."""
+
+        assert is_cacheable_response({"result": {"status": 200}})
+        assert is_cacheable_response({"result": {"status": "200"}})
+        assert is_cacheable_response({"result": {"site": []}})
+        assert not is_cacheable_response({"result": {"status": 400}})
+        assert not is_cacheable_response({})
+
+
+class TestMemoryCache:
+    """Test the in-memory LRU cache."""
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Test that lookups update hit and miss counters."""
+
+        cache = MemoryCache()
+
+        assert cache.get("/FloorList", {}) is None
+
+        cache.set("/FloorList", {}, {"result": {}})
+
+        assert cache.get("/FloorList", {}) == {"result": {}}
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.5
+
+        cache.reset_stats()
+
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted first."""
+
+        cache = MemoryCache(maxsize=2)
+
+        cache.set("/ItemList", {"cid": "a"}, {"result": "a"})
+        cache.set("/ItemList", {"cid": "b"}, {"result": "b"})
+        cache.get("/ItemList", {"cid": "a"})
+        cache.set("/ItemList", {"cid": "c"}, {"result": "c"})
+
+        assert len(cache) == 2
+        assert cache.get("/ItemList", {"cid": "a"}) is not None
+        assert cache.get("/ItemList", {"cid": "b"}) is None
+        assert cache.get("/ItemList", {"cid": "c"}) is not None
+
+    def test_ttl_expiry(self) -> None:
+        """Test that entries expire after their TTL."""
+
+        cache = MemoryCache(ttl=10)
+
+        with patch("py_dmmjp.cache.time.time", return_value=1000.0):
+            cache.set("/ItemList", {}, {"result": {}})
+
+        with patch("py_dmmjp.cache.time.time", return_value=1009.0):
+            assert cache.get("/ItemList", {}) is not None
+
+        with patch("py_dmmjp.cache.time.time", return_value=1010.0):
+            assert cache.get("/ItemList", {}) is None
+
+        assert len(cache) == 0
+
+    def test_per_endpoint_ttl(self) -> None:
+        """Test per-endpoint TTL overrides, including disabled endpoints."""
+
+        cache = MemoryCache(ttl=10, endpoint_ttls={"/FloorList": None, "/ItemList": 0})
+
+        assert cache.ttl_for("/GenreSearch") == 10
+        assert cache.ttl_for("/FloorList") is None
+
+        cache.set("/ItemList", {}, {"result": {}})
+        cache.set("/FloorList", {}, {"result": {}})
+
+        assert len(cache) == 1
+        assert cache.get("/ItemList", {}) is None
+        assert cache.misses == 0
+
+        with patch("py_dmmjp.cache.time.time", return_value=1e12):
+            assert cache.get("/FloorList", {}) is not None
+
+    def test_delete_and_clear(self) -> None:
+        """Test explicit invalidation."""
+
+        cache = MemoryCache()
+        cache.set("/ItemList", {"cid": "a"}, {"result": "a"})
+        cache.set("/ItemList", {"cid": "b"}, {"result": "b"})
+
+        cache.delete("/ItemList", {"cid": "a"})
+
+        assert cache.get("/ItemList", {"cid": "a"}) is None
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_invalid_maxsize(self) -> None:
+        """Test that the cache must hold at least one entry."""
+
+        with pytest.raises(ValueError):
+            MemoryCache(maxsize=0)
+
+
+class TestDMMClientCache:
+    """Test caching in DMMClient._make_request."""
+
+    def test_cache_disabled_by_default(self) -> None:
+        """Test that the client does not cache unless asked to."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id")
+
+        assert client.cache is None
+
+        with patch.object(
+            client._session, "get", return_value=make_response()
+        ) as mock_get:
+            client.get_floors()
+            client.get_floors()
+
+        assert mock_get.call_count == 2
+
+    def test_repeated_calls_served_from_cache(self) -> None:
+        """Test that identical requests only hit the network once."""
+
+        cache = MemoryCache()
+        client = DMMClient(api_key="test_key", affiliate_id="test_id", cache=cache)
+
+        with patch.object(
+            client._session, "get", return_value=make_response()
+        ) as mock_get:
+            client.get_floors()
+            client.get_floors()
+
+        assert mock_get.call_count == 1
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_cache_shared_across_api_keys(self) -> None:
+        """Test that clients with different API keys share cache entries."""
+
+        cache = MemoryCache()
+        first = DMMClient(api_key="key_one", affiliate_id="test_id", cache=cache)
+        second = DMMClient(api_key="key_two", affiliate_id="test_id", cache=cache)
+
+        with patch.object(first._session, "get", return_value=make_response()):
+            first.get_floors()
+
+        with patch.object(second._session, "get") as mock_get:
+            second.get_floors()
+
+        mock_get.assert_not_called()
+
+    def test_error_responses_not_cached(self) -> None:
+        """Test that API-level error responses are not stored."""
+
+        cache = MemoryCache()
+        client = DMMClient(api_key="test_key", affiliate_id="test_id", cache=cache)
+        body = b'{"result": {"status": 400, "message": "bad request"}}'
+
+        with patch.object(
+            client._session, "get", return_value=make_response(body=body)
+        ):
+            client.get_products(site="FANZA")
+
+        assert len(cache) == 0
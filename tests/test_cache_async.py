@@ -0,0 +1,46 @@
+"""
+Tests for the response cache layer with AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+from unittest.mock import Mock, patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.cache import MemoryCache
+
+from .conftest import GENRE_RESPONSE, make_async_response
+
+
+class TestAsyncDMMClientCache:
+    """Test caching in AsyncDMMClient._make_request."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_served_from_cache(self) -> None:
+        """Test that identical requests only hit the network once."""
+
+        cache = MemoryCache(endpoint_ttls={"/GenreSearch": 3600})
+
+        async with AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", cache=cache
+        ) as client:
+            session = await client._ensure_session()
+
+            with patch.object(
+                session, "get", Mock(return_value=make_async_response(GENRE_RESPONSE))
+            ) as mock_get:
+                await client.get_genres(25)
+                await client.get_genres(25)
+                await client.get_genres(40)
+
+        assert mock_get.call_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert client.cache is cache
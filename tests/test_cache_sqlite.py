@@ -0,0 +1,177 @@
+"""
+Tests for the persistent SQLite cache backend.
+"""
+
+# pylint: disable=protected-access
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.cache import SQLiteCache
+
+
+def make_item_list(count: int) -> Dict[str, Any]:
+    """Build a fake ItemList response with the given number of items."""
+
+    return {
+        "result": {
+            "status": 200,
+            "items": [
+                {"content_id": f"cid{i:05d}", "title": f"商品タイトル {i}" * 5}
+                for i in range(count)
+            ],
+        }
+    }
+
+
+class TestSQLiteCache:
+    """Test SQLiteCache storage, sharing and eviction."""
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> str:
+        """Path of a fresh cache database."""
+
+        return str(tmp_path / "dmm-cache.sqlite3")
+
+    def test_round_trip(self, path: str) -> None:
+        """Test that responses are stored and decoded unchanged."""
+
+        cache = SQLiteCache(path)
+        response = make_item_list(3)
+
+        cache.set("/ItemList", {"site": "FANZA"}, response)
+
+        assert cache.get("/ItemList", {"site": "FANZA"}) == response
+        assert cache.get("/ItemList", {"site": "DMM.com"}) is None
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert len(cache) == 1
+
+    def test_wal_mode_and_compression(self, path: str) -> None:
+        """Test that the database runs in WAL mode and stores compressed bodies."""
+
+        cache = SQLiteCache(path)
+        response = make_item_list(50)
+        cache.set("/ItemList", {}, response)
+
+        conn = sqlite3.connect(path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        stored = conn.execute("SELECT value FROM responses").fetchone()[0]
+        conn.close()
+
+        assert journal_mode == "wal"
+        assert len(stored) < len(str(response).encode("utf-8"))
+
+    def test_shared_between_instances(self, path: str) -> None:
+        """Test that separate instances (e.g., worker processes) share entries."""
+
+        writer = SQLiteCache(path)
+        reader = SQLiteCache(path)
+
+        writer.set("/FloorList", {}, {"result": {"site": []}})
+
+        assert reader.get("/FloorList", {}) == {"result": {"site": []}}
+
+    def test_thread_safety(self, path: str) -> None:
+        """Test concurrent use from several threads."""
+
+        cache = SQLiteCache(path)
+        errors: List[BaseException] = []
+
+        def worker(index: int) -> None:
+            try:
+                for i in range(20):
+                    cache.set("/ItemList", {"cid": f"{index}-{i}"}, {"result": {}})
+                    assert cache.get("/ItemList", {"cid": f"{index}-{i}"}) is not None
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(cache) == 80
+
+    def test_expiry(self, path: str) -> None:
+        """Test that expired entries are not returned and are purged."""
+
+        cache = SQLiteCache(path, ttl=60, endpoint_ttls={"/FloorList": None})
+
+        with patch("py_dmmjp.cache.time.time", return_value=1000.0):
+            cache.set("/ItemList", {}, {"result": {}})
+            cache.set("/FloorList", {}, {"result": {}})
+
+        with patch("py_dmmjp.cache.time.time", return_value=1061.0):
+            assert cache.get("/ItemList", {}) is None
+            assert cache.get("/FloorList", {}) is not None
+
+    def test_vacuum_removes_expired(self, path: str) -> None:
+        """Test that vacuum purges expired entries."""
+
+        cache = SQLiteCache(path, ttl=60)
+
+        with patch("py_dmmjp.cache.time.time", return_value=1000.0):
+            for i in range(5):
+                cache.set("/ItemList", {"cid": i}, {"result": {}})
+
+        assert cache.vacuum() == 5
+        assert len(cache) == 0
+
+    def test_vacuum_enforces_size_budget(self, path: str) -> None:
+        """Test that vacuum evicts least recently used entries over budget."""
+
+        cache = SQLiteCache(path, ttl=None, max_size_bytes=64 * 1024)
+
+        for i in range(200):
+            cache.set("/ItemList", {"offset": i}, make_item_list(100))
+
+        cache.get("/ItemList", {"offset": 0})
+
+        assert cache.size_bytes > cache.max_size_bytes  # type: ignore[operator]
+
+        removed = cache.vacuum()
+
+        assert removed > 0
+        assert cache.size_bytes <= 64 * 1024
+        assert cache.get("/ItemList", {"offset": 0}) is not None
+        assert cache.get("/ItemList", {"offset": 1}) is None
+
+    def test_vacuum_converts_file_without_auto_vacuum(self, path: str) -> None:
+        """Test that a file created without incremental auto-vacuum still shrinks."""
+
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE other (value TEXT)")
+
+        conn.close()
+        cache = SQLiteCache(path, ttl=None, max_size_bytes=64 * 1024)
+
+        for i in range(200):
+            cache.set("/ItemList", {"offset": i}, make_item_list(100))
+
+        assert cache._connect().execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+        cache.vacuum()
+
+        assert cache._connect().execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert cache.size_bytes <= 64 * 1024
+        assert 0 < len(cache) < 200
+
+    def test_clear(self, path: str) -> None:
+        """Test that clear removes every entry."""
+
+        cache = SQLiteCache(path)
+        cache.set("/ItemList", {}, {"result": {}})
+        cache.clear()
+        cache.close()
+
+        assert len(SQLiteCache(path)) == 0
@@ -0,0 +1,229 @@
+"""
+Tests for recording and replaying API responses with a Cassette.
+"""
+
+# pylint: disable=protected-access
+
+import gzip
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from py_dmmjp.cassette import Cassette, cassette_key
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.fakeserver import FakeDMMServer
+from py_dmmjp.retry import RetryPolicy
+
+
+@pytest.fixture
+def server() -> Iterator[FakeDMMServer]:
+    """Running server standing in for the API."""
+
+    with FakeDMMServer(total_count=250) as running:
+        yield running
+
+
+def content_ids(client: DMMClient) -> List[str]:
+    """Iterate over every product and get their content IDs."""
+
+    return [p.content_id for p in client.iter_products(site="FANZA", hits=100)]
+
+
+class TestCassetteKey:
+    """Test the keys requests are recorded under."""
+
+    def test_ignores_credentials_and_base_url(self) -> None:
+        """Test credentials, parameter order and base URL do not matter."""
+
+        assert cassette_key(
+            "https://api.dmm.com/affiliate/v3/ItemList?api_id=a&hits=10",
+            {"affiliate_id": "b", "site": "FANZA"},
+        ) == cassette_key(
+            "http://127.0.0.1:8000/affiliate/v3/ItemList",
+            {"site": "FANZA", "hits": 10, "api_id": "c"},
+        )
+
+    def test_repeated_parameters(self) -> None:
+        """Test every value of a repeated parameter is part of the key."""
+
+        url = "https://api.dmm.com/affiliate/v3/ItemList"
+        key = cassette_key(
+            f"{url}?site=FANZA&article=actress&article=genre&article_id=1&article_id=2",
+            {},
+        )
+
+        assert key == cassette_key(
+            url,
+            {"site": "FANZA", "article": ["actress", "genre"], "article_id": [1, 2]},
+        )
+        assert key != cassette_key(
+            f"{url}?site=FANZA&article=maker&article=genre&article_id=9&article_id=2",
+            {},
+        )
+
+
+class TestCassette:
+    """Test recording and replaying with DMMClient."""
+
+    def test_record_and_replay(self, server: FakeDMMServer, tmp_path: Path) -> None:
+        """Test a replayed crawl gives the recorded products without the server."""
+
+        path = tmp_path / "products.jsonl.gz"
+        recorder = Cassette(path, mode="record")
+
+        with DMMClient(
+            "secret_key",
+            "test-990",
+            base_url=server.base_url,
+            session=recorder.session(),
+        ) as client:
+            recorded = content_ids(client)
+
+        recorder.save()
+        requests_sent = server.request_count
+        replay = Cassette(path)
+
+        with DMMClient(
+            "other_key", "test-990", base_url="http://unused", session=replay.session()
+        ) as client:
+            assert content_ids(client) == recorded
+
+        assert len(recorded) == 250
+        assert len(replay) == len(recorder) == 3
+        assert server.request_count == requests_sent
+
+    def test_api_key_redacted(self, server: FakeDMMServer, tmp_path: Path) -> None:
+        """Test the API key echoed by the API is not written to disk."""
+
+        path = tmp_path / "floors.jsonl.gz"
+        cassette = Cassette(path, mode="record")
+        client = DMMClient(
+            "secret_key",
+            "test-990",
+            base_url=server.base_url,
+            session=cassette.session(),
+        )
+
+        client.get_floors()
+        cassette.save()
+
+        assert b"secret_key" not in gzip.decompress(path.read_bytes())
+
+    def test_replays_in_recorded_order(self, server: FakeDMMServer) -> None:
+        """Test responses to the same request replay in order, then start over."""
+
+        cassette = Cassette(mode="record")
+        client = DMMClient(
+            "test_key",
+            "test-990",
+            base_url=server.base_url,
+            session=cassette.session(),
+            retry=RetryPolicy(max_attempts=2, backoff_factor=0),
+        )
+        server.fail_next(status=503)
+        client.get_products(site="FANZA", hits=5)
+        cassette.mode = "replay"
+        session = cassette.session()
+
+        url = f"{server.base_url}/ItemList?site=FANZA&hits=5&output=json"
+
+        for _ in range(2):
+            assert session.get(url).status_code == 503
+            assert session.get(url).status_code == 200
+
+    def test_repeated_parameters_replayed(self, server: FakeDMMServer) -> None:
+        """Test searches differing only in repeated parameters are told apart."""
+
+        cassette = Cassette(mode="record")
+        client = DMMClient(
+            "test_key", "test-990", base_url=server.base_url, session=cassette.session()
+        )
+        client.get_products(
+            site="FANZA", article=["actress", "genre"], article_id=[1, 2]
+        )
+        cassette.mode = "replay"
+
+        assert client.get_products(
+            site="FANZA", article=["actress", "genre"], article_id=[1, 2]
+        )
+
+        with pytest.raises(DMMAPIError, match="No recorded response"):
+            client.get_products(
+                site="FANZA", article=["maker", "genre"], article_id=[9, 2]
+            )
+
+    def test_missing_response(self) -> None:
+        """Test a request that was not recorded fails."""
+
+        client = DMMClient("test_key", "test-990", session=Cassette().session())
+
+        with pytest.raises(DMMAPIError, match="No recorded response"):
+            client.get_floors()
+
+    def test_concurrent_replays(self, server: FakeDMMServer) -> None:
+        """Test one cassette serves several clients in parallel threads."""
+
+        cassette = Cassette(mode="record")
+        client = DMMClient(
+            "test_key", "test-990", base_url=server.base_url, session=cassette.session()
+        )
+        expected = content_ids(client)
+        cassette.mode = "replay"
+
+        def replay() -> List[str]:
+            with DMMClient("test_key", "test-990", session=cassette.session()) as c:
+                return content_ids(c)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: replay(), range(16)))
+
+        assert all(result == expected for result in results)
+
+    def test_non_utf8_body(self, tmp_path: Path) -> None:
+        """Test bodies that are not UTF-8 are saved and loaded unchanged."""
+
+        path = tmp_path / "errors.jsonl.gz"
+        body = "<html>サーバーエラー</html>".encode("shift_jis") + b"\xff\x00"
+        cassette = Cassette(path, mode="record")
+        cassette.record("/ItemList?site=FANZA", 502, body)
+        cassette.record("/FloorList", 200, '{"result": "フロア"}'.encode("utf-8"))
+
+        cassette.save()
+        replay = Cassette(path)
+
+        assert replay.play("/ItemList?site=FANZA") == (502, body)
+        assert replay.play("/FloorList") == (200, '{"result": "フロア"}'.encode())
+
+    def test_unknown_mode(self) -> None:
+        """Test an unknown mode is rejected."""
+
+        with pytest.raises(ValueError):
+            Cassette(mode="rewind")  # type: ignore[arg-type]
+
+
+class TestInjectedSession:
+    """Test the DMMClient session option."""
+
+    def test_session_not_closed(self) -> None:
+        """Test the client does not close a session it was given."""
+
+        session = requests.Session()
+
+        with patch.object(session, "close") as close:
+            with DMMClient("test_key", "test-990", session=session) as client:
+                assert client._session is session
+
+        close.assert_not_called()
+
+    def test_own_session(self) -> None:
+        """Test the client creates a session sending its headers by default."""
+
+        client = DMMClient("test_key", "test-990")
+
+        assert client._owns_session
+        assert client._session.headers["Accept"] == "application/json"
@@ -0,0 +1,158 @@
+"""
+Tests for recording and replaying API responses with AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+import aiohttp
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.cassette import Cassette
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.fakeserver import FakeDMMServer
+
+
+async def content_ids(client: AsyncDMMClient) -> List[str]:
+    """Iterate over every product and get their content IDs."""
+
+    return [
+        p.content_id
+        async for p in client.iter_products(site="FANZA", hits=100, concurrency=3)
+    ]
+
+
+class TestAsyncCassette:
+    """Test recording and replaying with AsyncDMMClient."""
+
+    @pytest.mark.asyncio
+    async def test_record_and_replay(self, tmp_path: Path) -> None:
+        """Test replayed crawls, also concurrent ones, give the recorded products."""
+
+        path = tmp_path / "products.jsonl.gz"
+        recorder = Cassette(path, mode="record")
+
+        with FakeDMMServer(total_count=450) as server:
+            async with AsyncDMMClient(
+                "secret_key",
+                "test-990",
+                base_url=server.base_url,
+                session=recorder.client_session(aiohttp.ClientSession()),
+            ) as client:
+                recorded = await content_ids(client)
+
+        recorder.save()
+        replay = Cassette(path)
+
+        async def replay_crawl() -> List[str]:
+            async with AsyncDMMClient(
+                "test_key", "test-990", session=replay.client_session()
+            ) as client:
+                return await content_ids(client)
+
+        results = await asyncio.gather(*(replay_crawl() for _ in range(4)))
+
+        assert len(recorded) == 450
+        assert all(result == recorded for result in results)
+
+    @pytest.mark.asyncio
+    async def test_max_response_size(self) -> None:
+        """Test replayed bodies are checked against max_response_size."""
+
+        cassette = Cassette(mode="record")
+
+        with FakeDMMServer() as server:
+            async with AsyncDMMClient(
+                "test_key",
+                "test-990",
+                base_url=server.base_url,
+                session=cassette.client_session(aiohttp.ClientSession()),
+            ) as client:
+                await client.get_floors()
+
+        cassette.mode = "replay"
+
+        async with AsyncDMMClient(
+            "test_key",
+            "test-990",
+            session=cassette.client_session(),
+            max_response_size=10,
+        ) as client:
+            with pytest.raises(DMMAPIError, match="max_response_size"):
+                await client.get_floors()
+
+    @pytest.mark.asyncio
+    async def test_repeated_parameters_replayed(self) -> None:
+        """Test searches differing only in repeated parameters are told apart."""
+
+        cassette = Cassette(mode="record")
+
+        with FakeDMMServer(total_count=50) as server:
+            async with aiohttp.ClientSession() as session:
+                client = AsyncDMMClient(
+                    "test_key",
+                    "test-990",
+                    base_url=server.base_url,
+                    session=cassette.client_session(session),
+                )
+                await client.get_products(
+                    site="FANZA", article=["actress", "genre"], article_id=[1, 2]
+                )
+
+        cassette.mode = "replay"
+        client = AsyncDMMClient(
+            "test_key", "test-990", session=cassette.client_session()
+        )
+
+        assert await client.get_products(
+            site="FANZA", article=["actress", "genre"], article_id=[1, 2]
+        )
+
+        with pytest.raises(DMMAPIError, match="No recorded response"):
+            await client.get_products(
+                site="FANZA", article=["maker", "genre"], article_id=[9, 2]
+            )
+
+    @pytest.mark.asyncio
+    async def test_missing_response(self) -> None:
+        """Test a request that was not recorded fails."""
+
+        client = AsyncDMMClient(
+            "test_key", "test-990", session=Cassette().client_session()
+        )
+
+        with pytest.raises(DMMAPIError, match="No recorded response"):
+            await client.get_floors()
+
+    def test_record_requires_session(self) -> None:
+        """Test recording needs an aiohttp session to send requests over."""
+
+        with pytest.raises(ValueError):
+            Cassette(mode="record").client_session()
+
+
+class TestAsyncInjectedSession:
+    """Test the AsyncDMMClient session option."""
+
+    @pytest.mark.asyncio
+    async def test_session_not_closed(self) -> None:
+        """Test the client uses, but does not close, a session it was given."""
+
+        session = aiohttp.ClientSession()
+
+        async with AsyncDMMClient("test_key", "test-990", session=session) as client:
+            assert await client._ensure_session() is session
+
+        assert not session.closed
+
+        await session.close()
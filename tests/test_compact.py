@@ -0,0 +1,179 @@
+"""
+Tests for the compact, slotted model variants.
+"""
+
+# pylint: disable=protected-access
+
+import pickle
+import sys
+from dataclasses import asdict, fields
+from typing import Any, Dict
+
+import pytest
+
+from py_dmmjp.compact import (
+    CompactActress,
+    CompactItemDetails,
+    CompactItemInfo,
+    CompactPrices,
+    CompactProduct,
+    CompactProductApiResponse,
+    to_compact,
+)
+from py_dmmjp.product import ItemInfo, Product, ProductApiResponse
+
+
+@pytest.fixture
+def item() -> Dict[str, Any]:
+    """ItemList item with nested models."""
+
+    return {
+        "service_code": "digital",
+        "service_name": "動画",
+        "floor_code": "videoa",
+        "floor_name": "ビデオ",
+        "category_name": "ビデオ (動画)",
+        "content_id": "abc00123",
+        "product_id": "abc00123",
+        "title": "テストタイトル",
+        "volume": "120",
+        "imageURL": {"list": "https://pics.dmm.co.jp/abc00123pt.jpg"},
+        "prices": {
+            "price": "980~",
+            "list_price": "1980",
+            "deliveries": {"delivery": [{"type": "hd", "price": "980"}]},
+        },
+        "review": {"count": 3, "average": "4.33"},
+        "date": "2025-01-10 10:00:00",
+        "iteminfo": {
+            "genre": [{"id": 1, "name": "ジャンル"}],
+            "actress": [{"id": 2, "name": "女優", "ruby": "じょゆう"}],
+        },
+        "campaign": [{"date_begin": "2025-01-01", "title": "セール"}],
+        "directory": [{"id": 10, "name": "ディレクトリ"}],
+    }
+
+
+class TestCompactModels:
+    """Test the slotted model variants."""
+
+    def test_instances_have_no_dict(self, item: Dict[str, Any]) -> None:
+        """Test compact instances store their fields in slots only."""
+
+        product = CompactProduct.from_dict(item)
+
+        assert not hasattr(product, "__dict__")
+        assert not hasattr(product.item_info, "__dict__")
+        assert not hasattr(product.genres[0], "__dict__")
+
+        with pytest.raises(AttributeError):
+            product.extra = 1  # type: ignore[attr-defined]
+
+    def test_nested_models_are_compact(self, item: Dict[str, Any]) -> None:
+        """Test from_dict builds compact objects all the way down."""
+
+        product = CompactProduct.from_dict(item)
+
+        assert isinstance(product.item_info, CompactItemDetails)
+        assert isinstance(product.prices, CompactPrices)
+        assert all(isinstance(info, CompactItemInfo) for info in product.actresses)
+
+    def test_same_fields_and_properties(self, item: Dict[str, Any]) -> None:
+        """Test a compact product exposes the same data as a regular one."""
+
+        regular = Product.from_dict(item)
+        product = CompactProduct.from_dict(item)
+
+        assert [f.name for f in fields(product)] == [f.name for f in fields(regular)]
+        assert asdict(product) == asdict(regular)
+        assert product.to_dict() == regular.to_dict()
+        assert product.raw_data == regular.raw_data
+        assert product.current_price == regular.current_price == 980
+        assert product.original_price == 1980
+        assert product.review_average == pytest.approx(4.33)
+        assert [a.name for a in product.actresses] == ["女優"]
+
+    def test_keep_raw(self, item: Dict[str, Any]) -> None:
+        """Test from_dict arguments are passed on to the regular model."""
+
+        assert CompactProduct.from_dict(item, keep_raw=False).raw_data is None
+
+    def test_construct_and_compare(self) -> None:
+        """Test compact models keep the dataclass __init__, __eq__ and __repr__."""
+
+        info = CompactItemInfo(id=1, name="名前")
+
+        assert info.ruby is None
+        assert info == CompactItemInfo(1, "名前")
+        assert info != CompactItemInfo(2, "名前")
+        assert repr(info) == "CompactItemInfo(id=1, name='名前', ruby=None)"
+
+    def test_not_a_subclass(self) -> None:
+        """Test compact models are copies rather than subclasses."""
+
+        info = CompactItemInfo(id=1, name="名前")
+
+        assert not isinstance(info, ItemInfo)
+        assert info != ItemInfo(id=1, name="名前")
+
+    def test_pickle(self, item: Dict[str, Any]) -> None:
+        """Test compact products survive a pickle round trip."""
+
+        product = CompactProduct.from_dict(item)
+
+        assert pickle.loads(pickle.dumps(product)) == product
+
+    def test_smaller_than_regular(self) -> None:
+        """Test a compact instance is smaller than a regular one."""
+
+        regular = ItemInfo(id=1, name="名前")
+        compact = CompactItemInfo(id=1, name="名前")
+        regular_size = sys.getsizeof(regular) + sys.getsizeof(regular.__dict__)
+
+        assert sys.getsizeof(compact) < regular_size
+
+
+class TestToCompact:
+    """Test converting parsed models."""
+
+    def test_converts_product(self, item: Dict[str, Any]) -> None:
+        """Test to_compact matches CompactProduct.from_dict."""
+
+        assert to_compact(Product.from_dict(item)) == CompactProduct.from_dict(item)
+
+    def test_converts_lazy_product(self, item: Dict[str, Any]) -> None:
+        """Test lazy products are parsed in full by the conversion."""
+
+        product = to_compact(Product.from_dict(item, lazy=True))
+
+        assert product == CompactProduct.from_dict(item)
+
+    def test_converts_lists(self, item: Dict[str, Any]) -> None:
+        """Test lists of models are converted item by item."""
+
+        products = to_compact([Product.from_dict(item), Product.from_dict(item)])
+
+        assert all(isinstance(p, CompactProduct) for p in products)
+
+    def test_converts_response(self, item: Dict[str, Any]) -> None:
+        """Test a full API response is converted recursively."""
+
+        data = {
+            "request": {"parameters": {"api_id": "id", "affiliate_id": "aff-990"}},
+            "result": {"status": 200, "result_count": 1, "items": [item]},
+        }
+
+        response = to_compact(ProductApiResponse.from_dict(data))
+
+        assert isinstance(response, CompactProductApiResponse)
+        assert isinstance(response.products[0], CompactProduct)
+        assert response.request.parameters["affiliate_id"] == "aff-990"
+
+    def test_leaves_other_values(self) -> None:
+        """Test non-models and compact models are returned unchanged."""
+
+        actress = CompactActress(id=1, name="名前")
+
+        assert to_compact(actress) is actress
+        assert to_compact("title") == "title"
+        assert to_compact(None) is None
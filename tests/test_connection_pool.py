@@ -0,0 +1,93 @@
+"""
+Tests for the connection pool of DMMClient and sharing a client across threads.
+"""
+
+# pylint: disable=protected-access
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+import requests
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.fakeserver import FakeDMMServer
+from py_dmmjp.transport import ConnectionPool
+
+THREADS = 32
+
+
+def fetch_pages(client: DMMClient) -> List[List[str]]:
+    """Fetch one page per thread from a shared client."""
+
+    def fetch(offset: int) -> List[str]:
+        products = client.get_products(site="FANZA", hits=5, offset=offset)
+        return [p.content_id for p in products]
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        return list(executor.map(fetch, range(1, THREADS * 5, 5)))
+
+
+class TestConnectionPool:
+    """Test the ConnectionPool option."""
+
+    def test_adapter_settings(self) -> None:
+        """Test the pool settings are applied to the client's session."""
+
+        client = DMMClient(
+            "test_key",
+            "test-990",
+            pool=ConnectionPool(connections=2, maxsize=64, block=True),
+        )
+        adapter = client._session.get_adapter("https://api.dmm.com")
+
+        assert adapter._pool_connections == 2  # type: ignore[attr-defined]
+        assert adapter._pool_maxsize == 64  # type: ignore[attr-defined]
+        assert adapter._pool_block is True  # type: ignore[attr-defined]
+        assert client._session.headers["Connection"] == "keep-alive"
+
+    def test_keep_alive_disabled(self) -> None:
+        """Test connections are not reused when keep-alive is off."""
+
+        client = DMMClient(
+            "test_key", "test-990", pool=ConnectionPool(keep_alive=False)
+        )
+
+        assert client._session.headers["Connection"] == "close"
+
+    def test_invalid_size(self) -> None:
+        """Test pool sizes must be positive."""
+
+        with pytest.raises(ValueError):
+            ConnectionPool(maxsize=0)
+
+    def test_not_combined_with_session(self) -> None:
+        """Test a pool cannot be set on a session the client was given."""
+
+        with pytest.raises(ValueError):
+            DMMClient(
+                "test_key",
+                "test-990",
+                session=requests.Session(),
+                pool=ConnectionPool(),
+            )
+
+    def test_shared_across_threads(self, caplog: pytest.LogCaptureFixture) -> None:
+        """Test a client shared by threads reuses its pooled connections."""
+
+        with FakeDMMServer(total_count=THREADS * 5, latency=0.05) as server:
+            client = DMMClient(
+                "test_key",
+                "test-990",
+                base_url=server.base_url,
+                pool=ConnectionPool(maxsize=THREADS),
+            )
+
+            with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+                pages = fetch_pages(client)
+
+        assert [cid for page in pages for cid in page] == [
+            f"fake{i:08d}" for i in range(1, THREADS * 5 + 1)
+        ]
+        assert "Connection pool is full" not in caplog.text
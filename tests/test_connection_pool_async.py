@@ -0,0 +1,105 @@
+"""
+Tests for the connection pool of AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import aiohttp
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.fakeserver import FakeDMMServer
+from py_dmmjp.transport import AsyncConnectionPool
+
+
+class TestAsyncConnectionPool:
+    """Test the AsyncConnectionPool option."""
+
+    @pytest.mark.asyncio
+    async def test_connector_settings(self) -> None:
+        """Test the pool settings are applied to the session's connector."""
+
+        pool = AsyncConnectionPool(
+            limit=200, limit_per_host=50, ttl_dns_cache=300, keepalive_timeout=60
+        )
+
+        async with AsyncDMMClient("test_key", "test-990", pool=pool) as client:
+            connector = (await client._ensure_session()).connector
+
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 200
+            assert connector.limit_per_host == 50
+            assert connector.use_dns_cache
+            assert connector._keepalive_timeout == 60
+            assert not connector.force_close
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_disabled(self) -> None:
+        """Test connections are not reused when keep-alive is off."""
+
+        pool = AsyncConnectionPool(keep_alive=False)
+
+        async with AsyncDMMClient("test_key", "test-990", pool=pool) as client:
+            connector = (await client._ensure_session()).connector
+
+            assert connector is not None and connector.force_close
+
+    @pytest.mark.asyncio
+    async def test_recreated_session_keeps_settings(self) -> None:
+        """Test a session replacing a closed one uses the pool too."""
+
+        client = AsyncDMMClient(
+            "test_key", "test-990", pool=AsyncConnectionPool(limit=7)
+        )
+        await client._ensure_session()
+        await client.close()
+
+        session = await client._ensure_session()
+
+        assert session.connector is not None and session.connector.limit == 7
+
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_limited_crawl(self) -> None:
+        """Test a crawl more concurrent than the pool limit completes in order."""
+
+        with FakeDMMServer(total_count=400, latency=0.01) as server:
+            async with AsyncDMMClient(
+                "test_key",
+                "test-990",
+                base_url=server.base_url,
+                pool=AsyncConnectionPool(limit=2, limit_per_host=2),
+            ) as client:
+                products = [
+                    p async for p in client.iter_products(site="FANZA", concurrency=8)
+                ]
+
+        assert [p.content_id for p in products] == [
+            f"fake{i:08d}" for i in range(1, 401)
+        ]
+
+    def test_invalid_limit(self) -> None:
+        """Test connection limits cannot be negative."""
+
+        with pytest.raises(ValueError):
+            AsyncConnectionPool(limit=-1)
+
+    @pytest.mark.asyncio
+    async def test_not_combined_with_session(self) -> None:
+        """Test a pool cannot be set on a session the client was given."""
+
+        async with aiohttp.ClientSession() as session:
+            with pytest.raises(ValueError):
+                AsyncDMMClient(
+                    "test_key",
+                    "test-990",
+                    session=session,
+                    pool=AsyncConnectionPool(),
+                )
@@ -0,0 +1,80 @@
+"""
+Tests for date string parsing.
+"""
+
+# pylint: disable=protected-access
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from py_dmmjp.dates import JST, parse_datetime
+from py_dmmjp.product import Product
+
+
+class TestParseDatetime:
+    """Test parse_datetime."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("2025-01-24 10:00:04", datetime(2025, 1, 24, 10, 0, 4)),
+            ("2005-03-18 09:59:34", datetime(2005, 3, 18, 9, 59, 34)),
+            ("2025/10/09 00:00:05", datetime(2025, 10, 9, 0, 0, 5)),
+            ("2025/10/09 12:30", datetime(2025, 10, 9, 12, 30)),
+            ("2025/10/09", datetime(2025, 10, 9)),
+            ("2025-10-09", datetime(2025, 10, 9)),
+            ("2025-1-5 1:02:03", datetime(2025, 1, 5, 1, 2, 3)),
+        ],
+    )
+    def test_formats(self, value: str, expected: datetime) -> None:
+        """Test the API format and the fallback formats."""
+
+        assert parse_datetime(value) == expected
+
+    @pytest.mark.parametrize(
+        "value", ["not a date", "2025-13-01 00:00:00", "", 20250101]
+    )
+    def test_invalid(self, value: object) -> None:
+        """Test values that are not dates give None."""
+
+        assert parse_datetime(value) is None
+
+    def test_matches_strptime(self) -> None:
+        """Test the fast path gives the same value as strptime."""
+
+        value = "2024-02-29 23:59:59"
+
+        assert parse_datetime(value) == datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+    def test_naive_by_default(self) -> None:
+        """Test dates are naive unless a time zone is given."""
+
+        assert parse_datetime("2025-01-24 10:00:04").tzinfo is None  # type: ignore[union-attr]
+
+    def test_jst(self) -> None:
+        """Test attaching Japan Standard Time."""
+
+        parsed = parse_datetime("2025/10/09 00:00:05", tz=JST)
+
+        assert parsed is not None
+        assert parsed.utcoffset() == timedelta(hours=9)
+        assert parsed.isoformat() == "2025-10-09T00:00:05+09:00"
+
+
+class TestProductDate:
+    """Test Product.date uses the fast parser."""
+
+    def test_slash_format(self) -> None:
+        """Test release dates written with slashes are parsed."""
+
+        product = Product.from_dict({"date": "2025/10/09 00:00:05"})
+
+        assert product.date == datetime(2025, 10, 9, 0, 0, 5)
+
+    def test_lazy(self) -> None:
+        """Test lazily parsed products give the same date."""
+
+        product = Product.from_dict({"date": "2025-01-24 10:00:04"}, lazy=True)
+
+        assert product.date == datetime(2025, 1, 24, 10, 0, 4)
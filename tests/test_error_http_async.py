@@ -37,7 +37,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 401
-        mock_response.text = AsyncMock(return_value="Unauthorized")
+        mock_response.read = AsyncMock(return_value=b"Unauthorized")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -54,7 +54,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 403
-        mock_response.text = AsyncMock(return_value="Forbidden")
+        mock_response.read = AsyncMock(return_value=b"Forbidden")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -73,7 +73,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 404
-        mock_response.text = AsyncMock(return_value="Not Found")
+        mock_response.read = AsyncMock(return_value=b"Not Found")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -90,7 +90,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 500
-        mock_response.text = AsyncMock(return_value="Internal Server Error")
+        mock_response.read = AsyncMock(return_value=b"Internal Server Error")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -107,7 +107,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 502
-        mock_response.text = AsyncMock(return_value="Bad Gateway")
+        mock_response.read = AsyncMock(return_value=b"Bad Gateway")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -124,7 +124,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 503
-        mock_response.text = AsyncMock(return_value="Service Unavailable")
+        mock_response.read = AsyncMock(return_value=b"Service Unavailable")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -141,7 +141,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 400
-        mock_response.text = AsyncMock(return_value="Bad Request")
+        mock_response.read = AsyncMock(return_value=b"Bad Request")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -158,7 +158,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 429
-        mock_response.text = AsyncMock(return_value="Too Many Requests")
+        mock_response.read = AsyncMock(return_value=b"Too Many Requests")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -217,7 +217,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 401
-        mock_response.text = AsyncMock(return_value="Unauthorized")
+        mock_response.read = AsyncMock(return_value=b"Unauthorized")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -234,7 +234,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 403
-        mock_response.text = AsyncMock(return_value="Forbidden")
+        mock_response.read = AsyncMock(return_value=b"Forbidden")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -253,7 +253,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 418
-        mock_response.text = AsyncMock(return_value="I'm a teapot")
+        mock_response.read = AsyncMock(return_value=b"I'm a teapot")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -271,7 +271,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 400
-        mock_response.text = AsyncMock(return_value='{"error": "Invalid parameter"}')
+        mock_response.read = AsyncMock(return_value=b'{"error": "Invalid parameter"}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -288,7 +288,7 @@ class TestAsyncDMMClientHTTPErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 401
-        mock_response.text = AsyncMock(return_value="Unauthorized")
+        mock_response.read = AsyncMock(return_value=b"Unauthorized")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -29,7 +29,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "Not valid JSON {{{{"
+        mock_response.content = b"Not valid JSON {{{{"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -48,7 +48,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "Invalid JSON syntax"
+        mock_response.content = b"Invalid JSON syntax"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -67,7 +67,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "{'invalid': 'json with single quotes'}"
+        mock_response.content = b"{'invalid': 'json with single quotes'}"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -86,7 +86,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "[incomplete array"
+        mock_response.content = b"[incomplete array"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -105,7 +105,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"unclosed": "object"'
+        mock_response.content = b'{"unclosed": "object"'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -124,7 +124,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "null,null,null"
+        mock_response.content = b"null,null,null"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -143,7 +143,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "undefined"
+        mock_response.content = b"undefined"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -162,7 +162,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = ""
+        mock_response.content = b""
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -181,7 +181,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"name": "\\uXXXX"}'
+        mock_response.content = b'{"name": "\\uXXXX"}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -200,7 +200,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200,}}'
+        mock_response.content = b'{"result": {"status": 200,}}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -219,7 +219,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": /* comment */ {"status": 200}}'
+        mock_response.content = b'{"result": /* comment */ {"status": 200}}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -238,7 +238,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "Invalid JSON"
+        mock_response.content = b"Invalid JSON"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(self.client._session, "get", return_value=mock_response):
@@ -253,7 +253,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": "value\x00with null"}'
+        mock_response.content = b'{"result": "value\x00with null"}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -272,7 +272,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": "first"}{"result": "second"}'
+        mock_response.content = b'{"result": "first"}{"result": "second"}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -291,7 +291,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": "line1\nline2"}'  # Unescaped newline
+        mock_response.content = b'{"result": "line1\nline2"}'  # Unescaped newline
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(
@@ -310,7 +310,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "Not JSON"
+        mock_response.content = b"Not JSON"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(self.client._session, "get", return_value=mock_response):
@@ -326,7 +326,7 @@ class TestDMMClientJSONErrors(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = "{invalid}"
+        mock_response.content = b"{invalid}"
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(self.client._session, "get", return_value=mock_response):
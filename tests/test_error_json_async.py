@@ -38,7 +38,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="Not valid JSON {{{{")
+        mock_response.read = AsyncMock(return_value=b"Not valid JSON {{{{")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -55,7 +55,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="Invalid JSON syntax")
+        mock_response.read = AsyncMock(return_value=b"Invalid JSON syntax")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -72,8 +72,8 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value="{'invalid': 'json with single quotes'}"
+        mock_response.read = AsyncMock(
+            return_value=b"{'invalid': 'json with single quotes'}"
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -91,7 +91,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="[incomplete array")
+        mock_response.read = AsyncMock(return_value=b"[incomplete array")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -108,7 +108,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"unclosed": "object"')
+        mock_response.read = AsyncMock(return_value=b'{"unclosed": "object"')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -125,7 +125,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="null,null,null")
+        mock_response.read = AsyncMock(return_value=b"null,null,null")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -142,7 +142,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="undefined")
+        mock_response.read = AsyncMock(return_value=b"undefined")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -159,7 +159,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="")
+        mock_response.read = AsyncMock(return_value=b"")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -176,7 +176,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"name": "\\uXXXX"}')
+        mock_response.read = AsyncMock(return_value=b'{"name": "\\uXXXX"}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -193,7 +193,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"result": {"status": 200,}}')
+        mock_response.read = AsyncMock(return_value=b'{"result": {"status": 200,}}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -210,8 +210,8 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value='{"result": /* comment */ {"status": 200}}'
+        mock_response.read = AsyncMock(
+            return_value=b'{"result": /* comment */ {"status": 200}}'
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -229,7 +229,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="Invalid JSON")
+        mock_response.read = AsyncMock(return_value=b"Invalid JSON")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -246,7 +246,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"result": "value\x00with null"}')
+        mock_response.read = AsyncMock(return_value=b'{"result": "value\x00with null"}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -263,8 +263,8 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value='{"result": "first"}{"result": "second"}'
+        mock_response.read = AsyncMock(
+            return_value=b'{"result": "first"}{"result": "second"}'
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -284,7 +284,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"result": "line1\nline2"}')
+        mock_response.read = AsyncMock(return_value=b'{"result": "line1\nline2"}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -301,7 +301,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="Not JSON")
+        mock_response.read = AsyncMock(return_value=b"Not JSON")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -320,7 +320,7 @@ class TestDMMClientJSONErrors:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value="{invalid}")
+        mock_response.read = AsyncMock(return_value=b"{invalid}")
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
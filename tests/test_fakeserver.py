@@ -0,0 +1,195 @@
+"""
+Tests for the local DMM API stand-in server.
+"""
+
+# pylint: disable=protected-access
+
+import time
+from typing import Iterator
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.commons import DMM_API_BASE_URL
+from py_dmmjp.exceptions import DMMAPIError, DMMAuthError
+from py_dmmjp.fakeserver import FakeDMMServer
+from py_dmmjp.retry import RetryPolicy
+
+
+@pytest.fixture
+def server() -> Iterator[FakeDMMServer]:
+    """Running server with a small catalog."""
+
+    with FakeDMMServer(total_count=250, seed=0) as running:
+        yield running
+
+
+def make_client(server: FakeDMMServer, **kwargs: object) -> DMMClient:
+    """Create a client talking to the fake server."""
+
+    return DMMClient(
+        api_key="test_key",
+        affiliate_id="test-990",
+        base_url=server.base_url,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+class TestBaseUrl:
+    """Test the client base_url option."""
+
+    def test_default(self) -> None:
+        """Test the client talks to the DMM API by default."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test-990")
+
+        assert client._base_url == DMM_API_BASE_URL
+
+    def test_trailing_slash(self) -> None:
+        """Test a trailing slash does not double the endpoint separator."""
+
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test-990", base_url="http://x/v3/"
+        )
+
+        assert client._base_url == "http://x/v3"
+
+
+class TestFakeDMMServer:
+    """Test the endpoints served by FakeDMMServer."""
+
+    def test_pagination(self, server: FakeDMMServer) -> None:
+        """Test hits and offset select a page of the catalog."""
+
+        client = make_client(server)
+
+        first = client.get_products(site="FANZA", hits=100)
+        last = client.get_products(site="FANZA", hits=100, offset=201)
+
+        assert len(first) == 100
+        assert first[0].content_id == "fake00000001"
+        assert [p.content_id for p in last][-1] == "fake00000250"
+        assert len(last) == 50
+        assert client.get_products(site="FANZA", offset=251) == []
+
+    def test_iter_products(self, server: FakeDMMServer) -> None:
+        """Test iterating walks the whole catalog once."""
+
+        products = list(make_client(server).iter_products(site="FANZA"))
+
+        assert len({p.content_id for p in products}) == 250
+
+    def test_search_endpoints(self, server: FakeDMMServer) -> None:
+        """Test every endpoint is served and parsed by the client."""
+
+        client = make_client(server)
+
+        assert client.get_floors()[0].code == "FANZA"
+        assert [a.id for a in client.get_actresses(hits=3)] == [1, 2, 3]
+        assert len(client.get_genres(floor_id=43, hits=5)) == 5
+        assert len(client.get_makers(floor_id=43)) == 100
+        assert client.get_series(floor_id=43, hits=2, offset=250)[0].series_id == "250"
+        assert len(client.get_authors(floor_id=72, hits=100)) == 100
+
+    def test_templates(self) -> None:
+        """Test given templates replace the default ones."""
+
+        template = {"result": {"genre": [{"genre_id": "9", "name": "A"}]}}
+
+        with FakeDMMServer(responses={"GenreSearch": template}) as server:
+            genres = make_client(server).get_genres(floor_id=43, hits=2)
+
+        assert [(g.genre_id, g.name) for g in genres] == [("1", "A"), ("2", "A")]
+
+    def test_search_page_sizes(self) -> None:
+        """Test each endpoint has the page size limits of the API."""
+
+        with FakeDMMServer(total_count=600) as server:
+            client = make_client(server)
+
+            assert len(client.get_genres(floor_id=43, hits=500)) == 500
+            assert len(client.get_series(floor_id=43, hits=500, offset=101)) == 500
+            assert len(client.get_authors(floor_id=72)) == 100
+            assert len(client.get_actresses()) == 20
+
+            for search in (
+                lambda: client.get_makers(floor_id=43, hits=501),
+                lambda: client.get_actresses(hits=101),
+            ):
+                with pytest.raises(DMMAPIError) as error:
+                    search()
+
+                assert error.value.status_code == 400
+
+    def test_search_offset_limits(self) -> None:
+        """Test only ItemList limits the offset, like the API."""
+
+        with FakeDMMServer(total_count=600) as server:
+            client = make_client(server)
+
+            assert client.get_genres(floor_id=43, offset=50001) == []
+            assert client.get_actresses(offset=60000) == []
+
+            with pytest.raises(DMMAPIError) as error:
+                client.get_products(site="FANZA", offset=50001)
+
+            assert error.value.status_code == 400
+
+    def test_out_of_range(self, server: FakeDMMServer) -> None:
+        """Test out of range parameters are rejected like the API."""
+
+        with pytest.raises(DMMAPIError) as error:
+            make_client(server).get_products(site="FANZA", hits=101)
+
+        assert error.value.status_code == 400
+
+    def test_missing_credentials(self, server: FakeDMMServer) -> None:
+        """Test requests without credentials are rejected."""
+
+        client = make_client(server)
+        client._affiliate_id = ""
+
+        with pytest.raises(DMMAuthError):
+            client.get_products(site="FANZA")
+
+    def test_fail_next(self, server: FakeDMMServer) -> None:
+        """Test injected failures are retried by a retry policy."""
+
+        client = make_client(
+            server, retry=RetryPolicy(max_attempts=3, backoff_factor=0)
+        )
+        server.fail_next(2, status=503)
+
+        assert len(client.get_products(site="FANZA", hits=5)) == 5
+        assert server.request_count == 3
+
+    def test_error_rate(self) -> None:
+        """Test every request fails at an error rate of 1."""
+
+        with FakeDMMServer(error_rate=1.0, error_status=502) as server:
+            with pytest.raises(DMMAPIError) as error:
+                make_client(server).get_products(site="FANZA")
+
+        assert error.value.status_code == 502
+
+    def test_latency(self) -> None:
+        """Test responses are delayed by the configured latency."""
+
+        with FakeDMMServer(latency=0.05) as server:
+            client = make_client(server)
+            start = time.perf_counter()
+            client.get_products(site="FANZA", hits=1)
+
+        assert time.perf_counter() - start >= 0.05
+
+    def test_base_url_requires_running_server(self) -> None:
+        """Test the base URL is only known once the server listens."""
+
+        server = FakeDMMServer()
+
+        with pytest.raises(RuntimeError):
+            _ = server.base_url
+
+        server.start()
+        server.stop()
+        server.stop()
@@ -0,0 +1,73 @@
+"""
+Tests for AsyncDMMClient against the local DMM API stand-in server.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.commons import DMM_API_BASE_URL
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.fakeserver import FakeDMMServer
+
+
+class TestAsyncFakeDMMServer:
+    """Test the async client against FakeDMMServer."""
+
+    def test_default_base_url(self) -> None:
+        """Test the client talks to the DMM API by default."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test-990")
+
+        assert client._base_url == DMM_API_BASE_URL
+
+    @pytest.mark.asyncio
+    async def test_iter_products(self) -> None:
+        """Test concurrent iteration walks the whole catalog in order."""
+
+        with FakeDMMServer(total_count=350) as server:
+            async with AsyncDMMClient(
+                api_key="test_key", affiliate_id="test-990", base_url=server.base_url
+            ) as client:
+                products = [
+                    p async for p in client.iter_products(site="FANZA", concurrency=4)
+                ]
+
+        assert [p.content_id for p in products] == [
+            f"fake{i:08d}" for i in range(1, 351)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_endpoints(self) -> None:
+        """Test the search endpoints are served and parsed by the client."""
+
+        with FakeDMMServer(total_count=30) as server:
+            async with AsyncDMMClient(
+                api_key="test_key", affiliate_id="test-990", base_url=server.base_url
+            ) as client:
+                floors = await client.get_floors()
+                genres = await client.get_genres(floor_id=43, hits=100)
+
+        assert floors[0].code == "FANZA"
+        assert len(genres) == 30
+
+    @pytest.mark.asyncio
+    async def test_injected_error(self) -> None:
+        """Test injected failures reach the client as DMMAPIError."""
+
+        with FakeDMMServer() as server:
+            server.fail_next(status=500)
+
+            async with AsyncDMMClient(
+                api_key="test_key", affiliate_id="test-990", base_url=server.base_url
+            ) as client:
+                with pytest.raises(DMMAPIError) as error:
+                    await client.get_products(site="FANZA")
+
+        assert error.value.status_code == 500
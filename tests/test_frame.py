@@ -0,0 +1,204 @@
+"""
+Tests for the columnar ProductFrame.
+"""
+
+# pylint: disable=protected-access
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+import pytest
+
+from py_dmmjp.frame import EncodedColumn, ProductFrame
+from py_dmmjp.product import Product
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def items() -> List[Dict[str, Any]]:
+    """ItemList items covering present and missing values."""
+
+    return [
+        {
+            "service_code": "digital",
+            "floor_code": "videoa",
+            "content_id": "a001",
+            "product_id": "a001dl",
+            "title": "A",
+            "date": "2024-05-01 10:00:00",
+            "prices": {"price": "1980", "list_price": "2980"},
+            "review": {"count": 4, "average": "4.50"},
+        },
+        {
+            "service_code": "mono",
+            "floor_code": "dvd",
+            "content_id": "b002",
+            "title": "B",
+            "date": "2023-01-15 00:00:00",
+            "prices": {"price": "500~"},
+        },
+        {
+            "service_code": "digital",
+            "floor_code": "videoa",
+            "content_id": "c003",
+            "title": "C",
+            "prices": {"price": "980", "list_price": "980"},
+            "review": {"count": 1, "average": "3.00"},
+        },
+        {
+            "service_code": "digital",
+            "floor_code": "videoc",
+            "content_id": "d004",
+            "title": "D",
+            "date": "not a date",
+            "review": {"count": 2, "average": "4.50"},
+        },
+    ]
+
+
+class TestProductFrame:
+    """Test building, filtering and sorting a ProductFrame."""
+
+    def test_columns(self, items: List[Dict[str, Any]]) -> None:
+        """Test column dtypes and values."""
+
+        frame = ProductFrame.from_items(items)
+
+        assert len(frame) == 4
+        assert frame.content_id.tolist() == ["a001", "b002", "c003", "d004"]
+        assert frame.date.dtype == np.dtype("datetime64[s]")
+        assert np.isnat(frame.date).tolist() == [False, False, True, True]
+        assert frame.current_price.dtype == np.int64
+        assert frame.current_price.tolist() == [1980, 500, 980, None]
+        assert frame.original_price.tolist() == [2980, None, 980, None]
+        assert frame.review_count.tolist() == [4, 0, 1, 2]
+        assert np.isnan(frame.review_average[1])
+        assert frame.floor_code.categories == ("videoa", "dvd", "videoc")
+        assert frame.floor_code.codes.tolist() == [0, 1, 0, 2]
+
+    def test_matches_product(self, items: List[Dict[str, Any]]) -> None:
+        """Test every value matches the Product attribute of the same name."""
+
+        rows = ProductFrame.from_items(items).to_dicts()
+
+        for row, item in zip(rows, items):
+            product = Product.from_dict(item)
+
+            for name, value in row.items():
+                assert value == getattr(product, name), name
+
+    def test_from_pages(self, items: List[Dict[str, Any]]) -> None:
+        """Test the items of every page are concatenated in order."""
+
+        pages = [{"result": {"items": items[:2]}}, {"result": {"items": items[2:]}}]
+
+        frame = ProductFrame.from_pages(pages)
+
+        assert frame.content_id.tolist() == ["a001", "b002", "c003", "d004"]
+
+    def test_filter(self, items: List[Dict[str, Any]]) -> None:
+        """Test masks, including masked comparisons, select rows."""
+
+        frame = ProductFrame.from_items(items)
+
+        assert frame[frame.current_price > 900].content_id.tolist() == [
+            "a001",
+            "c003",
+        ]
+        assert frame[frame.floor_code.isin("videoa", "dvd")].title.tolist() == [
+            "A",
+            "B",
+            "C",
+        ]
+        assert frame[frame.date >= np.datetime64("2024-01-01")].title.tolist() == ["A"]
+
+    def test_filtered_encoded_column(self, items: List[Dict[str, Any]]) -> None:
+        """Test filtered encoded columns keep their categories."""
+
+        videos = ProductFrame.from_items(items)[np.array([0, 2])]
+
+        assert videos.floor_code.decode().tolist() == ["videoa", "videoa"]
+        assert videos.floor_code.value_counts() == {
+            "videoa": 2,
+            "dvd": 0,
+            "videoc": 0,
+        }
+
+    def test_sort(self, items: List[Dict[str, Any]]) -> None:
+        """Test sorting puts missing values last and keeps ties stable."""
+
+        frame = ProductFrame.from_items(items)
+
+        assert frame.sort_by("current_price").title.tolist() == ["B", "C", "A", "D"]
+        assert frame.sort_by("current_price", descending=True).title.tolist() == [
+            "A",
+            "C",
+            "B",
+            "D",
+        ]
+        assert frame.sort_by("review_average", descending=True).title.tolist() == [
+            "A",
+            "D",
+            "C",
+            "B",
+        ]
+        assert frame.sort_by("date").title.tolist() == ["B", "A", "C", "D"]
+        assert frame.sort_by("floor_code").title.tolist() == ["B", "A", "C", "D"]
+
+    def test_sort_unknown_column(self, items: List[Dict[str, Any]]) -> None:
+        """Test sorting by an unknown column is rejected."""
+
+        with pytest.raises(ValueError, match="Unknown ProductFrame column"):
+            ProductFrame.from_items(items).sort_by("price")
+
+    def test_aggregate(self, items: List[Dict[str, Any]]) -> None:
+        """Test vectorized aggregates skip missing values."""
+
+        frame = ProductFrame.from_items(items)
+
+        assert frame.current_price.mean() == pytest.approx((1980 + 500 + 980) / 3)
+        assert np.nanmean(frame.review_average) == pytest.approx(4.0)
+        assert frame.service_code.value_counts() == {"digital": 3, "mono": 1}
+
+    def test_to_dicts(self, items: List[Dict[str, Any]]) -> None:
+        """Test rows convert back to plain Python values."""
+
+        row = ProductFrame.from_items(items).to_dicts()[0]
+
+        assert row["date"] == datetime(2024, 5, 1, 10, 0, 0)
+        assert row["current_price"] == 1980
+        assert row["floor_code"] == "videoa"
+
+    def test_empty(self) -> None:
+        """Test an empty frame."""
+
+        frame = ProductFrame.from_items([])
+
+        assert len(frame) == 0
+        assert frame.to_dicts() == []
+        assert len(frame.sort_by("date")) == 0
+
+    def test_column_lengths_must_match(self) -> None:
+        """Test columns of different lengths are rejected."""
+
+        frame = ProductFrame.from_items([])
+        columns = frame.columns()
+        columns["title"] = np.array(["x"], dtype=object)
+
+        with pytest.raises(ValueError, match="same length"):
+            ProductFrame(**columns)
+
+
+class TestEncodedColumn:
+    """Test dictionary encoding."""
+
+    def test_round_trip(self) -> None:
+        """Test values decode back to the input."""
+
+        column = EncodedColumn.encode(["b", "a", "b", "c"])
+
+        assert column.categories == ("b", "a", "c")
+        assert column.decode().tolist() == ["b", "a", "b", "c"]
+        assert column.isin("b").tolist() == [True, False, True, False]
+        assert column.isin("missing").tolist() == [False] * 4
@@ -492,7 +492,7 @@ class TestDMMClientWithActressIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"status": 200, "data": []}'
+        mock_response.content = b'{"status": 200, "data": []}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -507,7 +507,7 @@ class TestDMMClientWithActressIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "actresses": []}}'
+        mock_response.content = b'{"result": {"status": 200, "actresses": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
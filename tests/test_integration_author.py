@@ -264,7 +264,7 @@ class TestDMMClientWithAuthorIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"authors": [], "total": 0}'
+        mock_response.content = b'{"authors": [], "total": 0}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -279,7 +279,7 @@ class TestDMMClientWithAuthorIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "author": []}}'
+        mock_response.content = b'{"result": {"status": 200, "author": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
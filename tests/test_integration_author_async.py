@@ -395,7 +395,7 @@ class TestAsyncDMMClientWithAuthorIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"status": 200, "data": []}')
+        mock_response.read = AsyncMock(return_value=b'{"status": 200, "data": []}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -414,8 +414,8 @@ class TestAsyncDMMClientWithAuthorIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value='{"result": {"status": 200, "items": []}}'
+        mock_response.read = AsyncMock(
+            return_value=b'{"result": {"status": 200, "items": []}}'
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -259,7 +259,7 @@ class TestDMMClientWithFloorIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"sites": [], "services": []}'
+        mock_response.content = b'{"sites": [], "services": []}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -274,7 +274,7 @@ class TestDMMClientWithFloorIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"site": []}}'
+        mock_response.content = b'{"result": {"site": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
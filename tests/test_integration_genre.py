@@ -264,7 +264,7 @@ class TestDMMClientWithGenreIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"genres": [], "count": 0}'
+        mock_response.content = b'{"genres": [], "count": 0}'
         mock_response.raise_for_status = MagicMock()
 
         with patch.object(dmm_client._session, "get", return_value=mock_response):
@@ -278,7 +278,7 @@ class TestDMMClientWithGenreIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "genre": []}}'
+        mock_response.content = b'{"result": {"status": 200, "genre": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
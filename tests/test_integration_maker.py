@@ -259,7 +259,7 @@ class TestDMMClientWithMakerIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"makers": [], "total": 0}'
+        mock_response.content = b'{"makers": [], "total": 0}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -274,7 +274,7 @@ class TestDMMClientWithMakerIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "maker": []}}'
+        mock_response.content = b'{"result": {"status": 200, "maker": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
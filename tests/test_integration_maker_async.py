@@ -451,7 +451,7 @@ class TestAsyncDMMClientWithMakerIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"status": 200, "data": []}')
+        mock_response.read = AsyncMock(return_value=b'{"status": 200, "data": []}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -470,8 +470,8 @@ class TestAsyncDMMClientWithMakerIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value='{"result": {"status": 200, "items": []}}'
+        mock_response.read = AsyncMock(
+            return_value=b'{"result": {"status": 200, "items": []}}'
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
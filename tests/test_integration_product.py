@@ -746,7 +746,7 @@ class TestDMMClientWithProductIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        mock_response.content = """
 {
   "request": {
     "parameters": {
@@ -796,7 +796,7 @@ class TestDMMClientWithProductIntegration:
     ]
   }
 }
-        """
+        """.encode()
 
         # pylint: disable=W0212
         with patch.object(dmm_client._session, "get", return_value=mock_response):
@@ -812,7 +812,7 @@ class TestDMMClientWithProductIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        mock_response.content = """
 {
   "request": {
     "parameters": {
@@ -857,7 +857,7 @@ class TestDMMClientWithProductIntegration:
     ]
   }
 }
-"""
+""".encode()
 
         # pylint: disable=W0212
         with patch.object(dmm_client._session, "get", return_value=mock_response):
@@ -875,7 +875,7 @@ class TestDMMClientWithProductIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = """
+        mock_response.content = """
 {
   "request": {
     "parameters": {
@@ -920,7 +920,7 @@ class TestDMMClientWithProductIntegration:
     ]
   }
 }
-"""
+""".encode()
 
         # pylint: disable=W0212
         with patch.object(dmm_client._session, "get", return_value=mock_response):
@@ -1046,7 +1046,7 @@ class TestDMMClientWithProductIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"status": 200, "data": []}'
+        mock_response.content = b'{"status": 200, "data": []}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -1061,7 +1061,7 @@ class TestDMMClientWithProductIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "items": []}}'
+        mock_response.content = b'{"result": {"status": 200, "items": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -525,7 +525,7 @@ class TestAsyncDMMClientWithProductIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
+        mock_response.read = AsyncMock(
             return_value="""
 {
   "request": {
@@ -576,7 +576,7 @@ class TestAsyncDMMClientWithProductIntegration:
     ]
   }
 }
-        """
+        """.encode()
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -598,7 +598,7 @@ class TestAsyncDMMClientWithProductIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
+        mock_response.read = AsyncMock(
             return_value="""
 {
   "request": {
@@ -644,7 +644,7 @@ class TestAsyncDMMClientWithProductIntegration:
     ]
   }
 }
-"""
+""".encode()
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -668,7 +668,7 @@ class TestAsyncDMMClientWithProductIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
+        mock_response.read = AsyncMock(
             return_value="""
 {
   "request": {
@@ -714,7 +714,7 @@ class TestAsyncDMMClientWithProductIntegration:
     ]
   }
 }
-"""
+""".encode()
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
@@ -872,7 +872,7 @@ class TestAsyncDMMClientWithProductIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(return_value='{"status": 200, "data": []}')
+        mock_response.read = AsyncMock(return_value=b'{"status": 200, "data": []}')
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
 
@@ -893,8 +893,8 @@ class TestAsyncDMMClientWithProductIntegration:
 
         mock_response = AsyncMock()
         mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value='{"result": {"status": 200, "items": []}}'
+        mock_response.read = AsyncMock(
+            return_value=b'{"result": {"status": 200, "items": []}}'
         )
         mock_response.__aenter__ = AsyncMock(return_value=mock_response)
         mock_response.__aexit__ = AsyncMock(return_value=None)
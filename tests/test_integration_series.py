@@ -263,7 +263,7 @@ class TestDMMClientWithSeriesIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"series": [], "count": 0}'
+        mock_response.content = b'{"series": [], "count": 0}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -278,7 +278,7 @@ class TestDMMClientWithSeriesIntegration:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.text = '{"result": {"status": 200, "series": []}}'
+        mock_response.content = b'{"result": {"status": 200, "series": []}}'
         mock_response.raise_for_status = MagicMock()
 
         # pylint: disable=W0212
@@ -0,0 +1,175 @@
+"""
+Tests for interning ItemInfo records and repeated product strings.
+"""
+
+# pylint: disable=protected-access
+
+import json
+import pickle
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.interning import INTERNED_PRODUCT_FIELDS, Interner
+from py_dmmjp.product import Product, ProductApiResponse
+
+
+@pytest.fixture
+def body() -> str:
+    """JSON body of an ItemList item, decoded into fresh objects per product."""
+
+    return json.dumps(
+        {
+            "service_code": "digital",
+            "service_name": "動画",
+            "floor_code": "videoa",
+            "floor_name": "ビデオ",
+            "category_name": "ビデオ (動画)",
+            "content_id": "abc00123",
+            "product_id": "abc00123",
+            "title": "テストタイトル",
+            "date": "2025-01-10 10:00:00",
+            "iteminfo": {
+                "genre": [{"id": 1, "name": "ジャンル"}, {"id": 2, "name": "単体作品"}],
+                "actress": [{"id": "3", "name": "女優", "ruby": "じょゆう"}],
+                "maker": [{"id": 4, "name": "メーカー"}],
+            },
+        }
+    )
+
+
+class TestInterner:
+    """Test the interning table."""
+
+    def test_string(self) -> None:
+        """Test equal strings share the first interned instance."""
+
+        interner = Interner()
+        first = "".join(["ビ", "デオ"])
+        second = "".join(["ビデ", "オ"])
+
+        assert first is not second
+        assert interner.string(first) is first
+        assert interner.string(second) is first
+
+    def test_item_info(self) -> None:
+        """Test equal records share one ItemInfo, distinct ones do not."""
+
+        interner = Interner()
+
+        info = interner.item_info({"id": "1", "name": "ジャンル"})
+
+        assert info.id == 1 and info.name == "ジャンル" and info.ruby is None
+        assert interner.item_info({"id": 1, "name": "ジャンル"}) is info
+        assert interner.item_info({"id": 1, "name": "ジャンル", "ruby": "x"}) != info
+        assert interner.item_info({"id": 2, "name": "ジャンル"}) is not info
+
+    def test_len_and_clear(self) -> None:
+        """Test the table size and clearing it."""
+
+        interner = Interner()
+        interner.item_info({"id": 1, "name": "a"})
+        interner.string("b")
+
+        assert len(interner) == 3
+
+        interner.clear()
+
+        assert len(interner) == 0
+
+
+class TestInternedProducts:
+    """Test products parsed with an interner."""
+
+    def test_shares_item_info_and_strings(self, body: str) -> None:
+        """Test two products decoded separately share records and strings."""
+
+        interner = Interner()
+        first = Product.from_dict(json.loads(body), interner=interner)
+        second = Product.from_dict(json.loads(body), interner=interner)
+
+        assert first.genres[0] is second.genres[0]
+        assert first.actresses[0] is second.actresses[0]
+        assert first.makers[0] is second.makers[0]
+
+        for name in INTERNED_PRODUCT_FIELDS[:-1]:
+            assert getattr(first, name) is getattr(second, name)
+
+        assert first.title is not second.title
+
+    def test_same_values_as_without_interner(self, body: str) -> None:
+        """Test interning does not change the parsed values."""
+
+        plain = Product.from_dict(json.loads(body))
+        interned = Product.from_dict(json.loads(body), interner=Interner())
+
+        assert interned == plain
+
+    def test_lazy_product(self, body: str) -> None:
+        """Test lazily parsed products use the interner on first access."""
+
+        interner = Interner()
+        first = Product.from_dict(json.loads(body), lazy=True, interner=interner)
+        second = Product.from_dict(json.loads(body), lazy=True, interner=interner)
+
+        assert first.floor_name is second.floor_name
+        assert first.genres[0] is second.genres[0]
+        assert Product.from_dict(json.loads(body), lazy=True).genres[0] is not (
+            first.genres[0]
+        )
+
+    def test_pickled_lazy_product(self, body: str) -> None:
+        """Test lazy products parsed with an interner can be pickled."""
+
+        product = Product.from_dict(json.loads(body), lazy=True, interner=Interner())
+
+        restored = pickle.loads(pickle.dumps(product))
+
+        assert restored.date == product.date
+        assert restored.genres == product.genres
+        assert restored.prices is None
+
+    def test_api_response(self, body: str) -> None:
+        """Test ProductApiResponse passes the interner to its products."""
+
+        data = {"result": {"items": [json.loads(body), json.loads(body)]}}
+
+        products = ProductApiResponse.from_dict(data, interner=Interner()).products
+
+        assert products[0].genres[0] is products[1].genres[0]
+
+
+class TestClientInterner:
+    """Test the client interner option."""
+
+    def test_products_share_records(self, body: str) -> None:
+        """Test every product parsed by the client uses its interner."""
+
+        interner = Interner()
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test-990", interner=interner
+        )
+        response = {
+            "result": {
+                "status": 200,
+                "result_count": 2,
+                "total_count": 2,
+                "first_position": 1,
+                "items": [json.loads(body), json.loads(body)],
+            }
+        }
+
+        with patch.object(client, "_make_request", return_value=response):
+            products = client.get_products(site="FANZA")
+
+        assert products[0].genres[0] is products[1].genres[0]
+        assert len(interner) > 0
+
+    def test_no_interner_by_default(self) -> None:
+        """Test the client does not intern unless asked to."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test-990")
+
+        assert client._interner is None
@@ -0,0 +1,143 @@
+"""
+Tests for lazy pagination with DMMClient.iter_products.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.product import Product
+
+
+def make_page(offset: int, hits: int, total_count: int) -> Dict[str, Any]:
+    """Build a fake ItemList response page."""
+
+    last = min(offset + hits - 1, total_count)
+    items = [
+        {"content_id": f"cid{i:05d}", "title": f"Product {i}"}
+        for i in range(offset, last + 1)
+    ]
+
+    return {
+        "result": {
+            "status": 200,
+            "result_count": len(items),
+            "total_count": total_count,
+            "first_position": offset,
+            "items": items,
+        }
+    }
+
+
+class TestIterProducts:
+    """Test DMMClient.iter_products pagination."""
+
+    @pytest.fixture
+    def client(self) -> DMMClient:
+        """Create a DMM client instance for testing."""
+
+        return DMMClient(api_key="test_key", affiliate_id="test_id")
+
+    def test_walks_all_pages(self, client: DMMClient) -> None:
+        """Test that every page is requested until total_count is reached."""
+
+        calls: List[Dict[str, Any]] = []
+
+        def fake_request(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            assert endpoint == "/ItemList"
+            calls.append(dict(params))
+
+            return make_page(params["offset"], params["hits"], 250)
+
+        with patch.object(client, "_make_request", side_effect=fake_request):
+            products = list(client.iter_products(site="FANZA", floor="videoa"))
+
+        assert len(products) == 250
+        assert all(isinstance(p, Product) for p in products)
+        assert products[0].content_id == "cid00001"
+        assert products[-1].content_id == "cid00250"
+        assert [c["offset"] for c in calls] == [1, 101, 201]
+        assert all(c["hits"] == 100 for c in calls)
+        assert all(c["floor"] == "videoa" for c in calls)
+
+    def test_is_lazy(self, client: DMMClient) -> None:
+        """Test that pages are only requested as the iterator is consumed."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            side_effect=lambda _, p: make_page(p["offset"], p["hits"], 1000),
+        ) as mock_request:
+            iterator = client.iter_products(site="FANZA", hits=10)
+
+            assert mock_request.call_count == 0
+
+            first = next(iterator)
+
+            assert first.content_id == "cid00001"
+            assert mock_request.call_count == 1
+
+    def test_respects_hits_and_offset(self, client: DMMClient) -> None:
+        """Test custom page size and start position."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            side_effect=lambda _, p: make_page(p["offset"], p["hits"], 30),
+        ) as mock_request:
+            products = list(client.iter_products(site="FANZA", hits=10, offset=11))
+
+        assert [p.content_id for p in products][0] == "cid00011"
+        assert len(products) == 20
+        assert mock_request.call_count == 2
+
+    def test_hits_clamped_to_maximum(self, client: DMMClient) -> None:
+        """Test that the page size never exceeds the API maximum."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            side_effect=lambda _, p: make_page(p["offset"], p["hits"], 5),
+        ) as mock_request:
+            list(client.iter_products(site="FANZA", hits=500))
+
+        assert mock_request.call_args[0][1]["hits"] == 100
+
+    def test_stops_at_offset_ceiling(self, client: DMMClient) -> None:
+        """Test that iteration stops at the 50,000 offset ceiling."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            side_effect=lambda _, p: make_page(p["offset"], p["hits"], 1_000_000),
+        ) as mock_request:
+            products = list(client.iter_products(site="FANZA", offset=49_851))
+
+        assert mock_request.call_count == 2
+        assert mock_request.call_args[0][1]["offset"] == 49_951
+        assert products[-1].content_id == "cid50050"
+
+    def test_stops_on_empty_page(self, client: DMMClient) -> None:
+        """Test that an empty page ends the iteration."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            return_value={"result": {"total_count": 500, "items": []}},
+        ) as mock_request:
+            products = list(client.iter_products(site="FANZA"))
+
+        assert not products
+        assert mock_request.call_count == 1
+
+    def test_missing_result_field(self, client: DMMClient) -> None:
+        """Test that a malformed page raises DMMAPIError."""
+
+        with patch.object(client, "_make_request", return_value={}):
+            with pytest.raises(DMMAPIError, match="missing 'result' field"):
+                list(client.iter_products(site="FANZA"))
@@ -0,0 +1,213 @@
+"""
+Tests for concurrent page fan-out with AsyncDMMClient.iter_products.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import aiohttp
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.fakeserver import FakeDMMServer
+
+from .test_iter_products import make_page
+
+
+class FakeItemList:
+    """Fake async ItemList endpoint that tracks request concurrency."""
+
+    def __init__(self, total_count: int, fail_offset: int = 0) -> None:
+        self.total_count = total_count
+        self.fail_offset = fail_offset
+        self.offsets: List[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        assert endpoint == "/ItemList"
+
+        self.offsets.append(params["offset"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            # later pages finish first so ordering is actually exercised
+            await asyncio.sleep(0.001 * (self.total_count - params["offset"]) / 100)
+
+            if params["offset"] == self.fail_offset:
+                raise DMMAPIError("HTTP 500: boom", status_code=500)
+
+            return make_page(params["offset"], params["hits"], self.total_count)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAsyncIterProducts:
+    """Test AsyncDMMClient.iter_products fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_ordered_fan_out(self) -> None:
+        """Test that all pages are fetched and yielded in API order."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        fake = FakeItemList(total_count=1050)
+
+        with patch.object(client, "_make_request", new=fake):
+            products = [
+                p async for p in client.iter_products(site="FANZA", concurrency=4)
+            ]
+
+        assert [p.content_id for p in products] == [
+            f"cid{i:05d}" for i in range(1, 1051)
+        ]
+        assert sorted(fake.offsets) == list(range(1, 1051, 100))
+        assert fake.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_unordered_fan_out(self) -> None:
+        """Test that unordered mode yields every product exactly once."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        fake = FakeItemList(total_count=1000)
+
+        with patch.object(client, "_make_request", new=fake):
+            products = [
+                p
+                async for p in client.iter_products(
+                    site="FANZA", concurrency=3, ordered=False
+                )
+            ]
+
+        content_ids = [p.content_id for p in products]
+
+        assert len(content_ids) == 1000
+        assert sorted(content_ids) == [f"cid{i:05d}" for i in range(1, 1001)]
+        assert content_ids != sorted(content_ids)
+        assert fake.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_when_concurrency_is_one(self) -> None:
+        """Test that concurrency=1 requests pages one at a time."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        fake = FakeItemList(total_count=300)
+
+        with patch.object(client, "_make_request", new=fake):
+            products = [
+                p
+                async for p in client.iter_products(
+                    site="FANZA", hits=50, concurrency=1
+                )
+            ]
+
+        assert len(products) == 300
+        assert fake.offsets == [1, 51, 101, 151, 201, 251]
+        assert fake.max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_stops_at_offset_ceiling(self) -> None:
+        """Test that no page beyond the 50,000 offset ceiling is requested."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        fake = FakeItemList(total_count=1_000_000)
+
+        with patch.object(client, "_make_request", new=fake):
+            products = [
+                p async for p in client.iter_products(site="FANZA", offset=49_701)
+            ]
+
+        assert max(fake.offsets) == 49_901
+        assert len(products) == 300
+
+    @pytest.mark.asyncio
+    async def test_page_error_propagates(self) -> None:
+        """Test that a failing page raises and cancels the remaining requests."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        fake = FakeItemList(total_count=2000, fail_offset=301)
+
+        with patch.object(client, "_make_request", new=fake):
+            with pytest.raises(DMMAPIError, match="HTTP 500"):
+                async for _ in client.iter_products(site="FANZA", concurrency=2):
+                    pass
+
+        assert fake.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_invalid_concurrency(self) -> None:
+        """Test that a concurrency lower than 1 is rejected."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+
+        with pytest.raises(ValueError, match="concurrency"):
+            async for _ in client.iter_products(site="FANZA", concurrency=0):
+                pass
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("coalesce", [True, False])
+    async def test_early_break_closes_pages(self, coalesce: bool) -> None:
+        """Test breaking out of the iteration leaves no request or session behind."""
+
+        sessions: List[aiohttp.ClientSession] = []
+        session_class = aiohttp.ClientSession
+
+        def make_session(*args: Any, **kwargs: Any) -> aiohttp.ClientSession:
+            sessions.append(session_class(*args, **kwargs))
+            return sessions[-1]
+
+        with FakeDMMServer(total_count=2000, latency=0.05) as server:
+            with patch("aiohttp.ClientSession", new=make_session):
+                async with AsyncDMMClient(
+                    "test_key", "test-990", base_url=server.base_url, coalesce=coalesce
+                ) as client:
+                    products = client.iter_products(site="FANZA", concurrency=5)
+
+                    async for product in products:
+                        if product.content_id == "fake00000150":
+                            break
+
+                    await products.aclose()
+                    request_count = server.request_count
+                    await asyncio.sleep(0.2)
+
+                    assert server.request_count == request_count
+
+                await asyncio.sleep(0.2)
+
+        assert not [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        assert len(sessions) == 1 and sessions[0].closed
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_abandoned_pages(self) -> None:
+        """Test closing the client stops the pages of an unclosed iteration."""
+
+        with FakeDMMServer(total_count=2000, latency=0.05) as server:
+            client = AsyncDMMClient("test_key", "test-990", base_url=server.base_url)
+            products = client.iter_products(site="FANZA", concurrency=5)
+
+            async for product in products:
+                if product.content_id == "fake00000150":
+                    break
+
+            await client.close()
+            request_count = server.request_count
+            await asyncio.sleep(0.2)
+
+            assert server.request_count == request_count
+            assert not client._page_tasks
+
+            assert len(await client.get_products(site="FANZA", hits=5)) == 5
+
+            await products.aclose()
+            await client.close()
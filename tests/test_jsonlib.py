@@ -0,0 +1,95 @@
+"""
+Tests for the pluggable JSON decoding backends.
+"""
+
+# pylint: disable=protected-access
+
+import importlib
+import json
+from typing import Any, List, Union
+from unittest.mock import Mock, patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.jsonlib import get_json_loads
+
+BODY = '{"result": {"site": [{"name": "FANZA", "code": "FANZA", "service": []}]}}'
+
+
+class TestGetJsonLoads:
+    """Test backend selection."""
+
+    def test_stdlib_backend_decodes_bytes(self) -> None:
+        """Test that the stdlib backend decodes raw bytes."""
+
+        loads = get_json_loads("json")
+
+        assert loads is json.loads
+        assert loads(b'{"status": 200}') == {"status": 200}
+
+    def test_prefers_orjson(self) -> None:
+        """Test that orjson is the default when it is installed."""
+
+        orjson = pytest.importorskip("orjson")
+
+        assert get_json_loads() is orjson.loads
+
+    def test_falls_back_to_stdlib(self) -> None:
+        """Test that the stdlib is used when orjson is missing."""
+
+        real_import = importlib.import_module
+
+        def import_module(name: str) -> Any:
+            if name == "orjson":
+                raise ImportError(name)
+
+            return real_import(name)
+
+        with patch("py_dmmjp.jsonlib.importlib.import_module", new=import_module):
+            assert get_json_loads() is json.loads
+
+    def test_unknown_backend(self) -> None:
+        """Test that unknown backend names are rejected."""
+
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_json_loads("simplejson")
+
+
+class TestDMMClientJsonLoads:
+    """Test decoding in DMMClient._load_json_from_response."""
+
+    def test_custom_decoder_receives_bytes(self) -> None:
+        """Test that a custom decoder is given the raw response body."""
+
+        seen: List[Union[bytes, str]] = []
+
+        def loads(data: Union[bytes, str]) -> Any:
+            seen.append(data)
+            return json.loads(data)
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id", json_loads=loads)
+        response = Mock(status_code=200, content=BODY.encode("utf-8"))
+
+        with patch.object(client._session, "get", return_value=response):
+            sites = client.get_floors()
+
+        assert sites[0].code == "FANZA"
+        assert seen == [BODY.encode("utf-8")]
+
+    @pytest.mark.parametrize("backend", ["json", "orjson"])
+    def test_invalid_body_raises_api_error(self, backend: str) -> None:
+        """Test that every backend's decode errors surface as DMMAPIError."""
+
+        if backend == "orjson":
+            pytest.importorskip("orjson")
+
+        client = DMMClient(
+            api_key="test_key",
+            affiliate_id="test_id",
+            json_loads=get_json_loads(backend),
+        )
+
+        with pytest.raises(DMMAPIError, match="Error while formatting DMM Response"):
+            client._load_json_from_response(b"{'invalid': json}")
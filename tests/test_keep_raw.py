@@ -0,0 +1,117 @@
+"""
+Tests for opt-in retention of raw API payloads.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.floor import FloorListResponse
+from py_dmmjp.genre import GenreSearchResponse
+from py_dmmjp.product import LazyProduct, Product, ProductApiResponse
+
+ITEM: Dict[str, Any] = {
+    "content_id": "abc00123",
+    "title": "テストタイトル",
+    "iteminfo": {"genre": [{"id": 1, "name": "ジャンル"}]},
+}
+
+
+def make_item_list(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build a single-page ItemList response."""
+
+    return {
+        "request": {"parameters": {}},
+        "result": {
+            "status": 200,
+            "result_count": len(items),
+            "total_count": len(items),
+            "first_position": 1,
+            "items": items,
+        },
+    }
+
+
+class TestModelKeepRaw:
+    """Test the keep_raw parameter of the models."""
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_product(self, lazy: bool) -> None:
+        """Test that products keep raw data by default and drop it on request."""
+
+        kept = Product.from_dict(ITEM, lazy=lazy)
+        dropped = Product.from_dict(ITEM, lazy=lazy, keep_raw=False)
+
+        assert kept.raw_data == ITEM
+        assert kept.raw_data is not ITEM
+        assert dropped.raw_data is None
+        assert dropped.genres[0].name == "ジャンル"
+
+    def test_product_api_response(self) -> None:
+        """Test that keep_raw applies to the response and its products."""
+
+        data = make_item_list([ITEM])
+
+        kept = ProductApiResponse.from_dict(data)
+        dropped = ProductApiResponse.from_dict(data, keep_raw=False)
+
+        assert kept.raw_response == data
+        assert kept.products[0].raw_data == ITEM
+        assert dropped.raw_response is None
+        assert dropped.products[0].raw_data is None
+
+    def test_search_responses(self) -> None:
+        """Test keep_raw on the other response classes."""
+
+        genres = {"request": {}, "result": {"status": 200, "genre": []}}
+        floors = {"request": {}, "result": {"site": []}}
+
+        assert GenreSearchResponse.from_dict(genres).raw_response == genres
+        assert (
+            GenreSearchResponse.from_dict(genres, keep_raw=False).raw_response is None
+        )
+        assert FloorListResponse.from_dict(floors).raw_response == floors
+        assert FloorListResponse.from_dict(floors, keep_raw=False).raw_response is None
+
+
+class TestDMMClientKeepRaw:
+    """Test the keep_raw client option."""
+
+    def fetch(self, client: DMMClient) -> Dict[str, List[Product]]:
+        """Fetch products through the single-shot and bulk paths."""
+
+        with patch.object(client, "_make_request", return_value=make_item_list([ITEM])):
+            return {
+                "get": client.get_products(site="FANZA"),
+                "iter": list(client.iter_products(site="FANZA")),
+                "crawl": list(client.crawl_products(site="FANZA")),
+            }
+
+    def test_default_keeps_raw_only_for_get_products(self) -> None:
+        """Test that bulk paths drop raw items by default."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id")
+        products = self.fetch(client)
+
+        assert products["get"][0].raw_data == ITEM
+        assert products["iter"][0].raw_data is None
+        assert products["crawl"][0].raw_data is None
+
+    @pytest.mark.parametrize("keep_raw", [True, False])
+    def test_explicit_setting_applies_everywhere(self, keep_raw: bool) -> None:
+        """Test that an explicit keep_raw overrides the per-path default."""
+
+        client = DMMClient(
+            api_key="test_key",
+            affiliate_id="test_id",
+            keep_raw=keep_raw,
+            lazy_products=True,
+        )
+
+        for products in self.fetch(client).values():
+            assert isinstance(products[0], LazyProduct)
+            assert (products[0].raw_data is not None) is keep_raw
@@ -0,0 +1,149 @@
+"""
+Tests for lazily parsed products.
+"""
+
+# pylint: disable=protected-access
+
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.product import (
+    PRODUCT_LAZY_FIELDS,
+    ItemDetails,
+    LazyProduct,
+    Prices,
+    Product,
+)
+
+
+@pytest.fixture
+def item() -> Dict[str, Any]:
+    """ItemList item with every kind of nested model."""
+
+    return {
+        "service_code": "digital",
+        "service_name": "動画",
+        "floor_code": "videoa",
+        "floor_name": "ビデオ",
+        "category_name": "ビデオ (動画)",
+        "content_id": "abc00123",
+        "product_id": "abc00123",
+        "title": "テストタイトル",
+        "volume": "120",
+        "URL": "https://video.dmm.co.jp/av/content/?id=abc00123",
+        "affiliateURL": "https://al.fanza.co.jp/?lurl=abc00123",
+        "imageURL": {"list": "https://pics.dmm.co.jp/abc00123pt.jpg"},
+        "sampleImageURL": {"sample_s": {"image": ["https://pics.dmm.co.jp/1.jpg"]}},
+        "prices": {
+            "price": "980~",
+            "deliveries": {"delivery": [{"type": "hd", "price": "980"}]},
+        },
+        "review": {"count": 3, "average": "4.33"},
+        "date": "2025-01-10 10:00:00",
+        "iteminfo": {
+            "genre": [{"id": 1, "name": "ジャンル"}],
+            "actress": [{"id": 2, "name": "女優", "ruby": "じょゆう"}],
+        },
+        "campaign": [{"date_begin": "2025-01-01", "title": "セール"}],
+        "directory": [{"id": 10, "name": "ディレクトリ"}],
+    }
+
+
+class TestLazyProduct:
+    """Test LazyProduct parsing and memoization."""
+
+    def test_matches_eager_product(self, item: Dict[str, Any]) -> None:
+        """Test that every field has the same value as with eager parsing."""
+
+        eager = Product.from_dict(item)
+        lazy = Product.from_dict(item, lazy=True)
+
+        assert isinstance(lazy, LazyProduct)
+
+        for f in fields(Product):
+            assert getattr(lazy, f.name) == getattr(eager, f.name), f.name
+
+        assert lazy.actresses[0].ruby == "じょゆう"
+        assert lazy.current_price == eager.current_price
+        assert lazy.raw_data == item
+
+    def test_nested_fields_parsed_on_first_access(self, item: Dict[str, Any]) -> None:
+        """Test that only the fields that are read get parsed."""
+
+        product = LazyProduct.from_dict(item)
+
+        assert product.title == "テストタイトル"
+        assert product.affiliate_url == "https://al.fanza.co.jp/?lurl=abc00123"
+        assert product.volume == 120
+        assert not product.parsed_fields
+
+        assert isinstance(product.prices, Prices)
+        assert product.parsed_fields == ["prices"]
+
+    def test_parsed_fields_are_memoized(self, item: Dict[str, Any]) -> None:
+        """Test that a nested field is parsed once and then reused."""
+
+        product = LazyProduct.from_dict(item)
+
+        with patch.object(
+            ItemDetails, "from_dict", wraps=ItemDetails.from_dict
+        ) as mock_parse:
+            first = product.item_info
+            second = product.item_info
+            genres = product.genres
+
+        assert first is second
+        assert genres[0].name == "ジャンル"
+        assert mock_parse.call_count == 1
+
+    def test_missing_and_assigned_fields(self, item: Dict[str, Any]) -> None:
+        """Test absent nested data and assignment before first access."""
+
+        del item["iteminfo"]
+        product = LazyProduct.from_dict(item)
+        product.date = datetime(2000, 1, 1)
+
+        assert product.item_info is None
+        assert product.genres == []
+        assert product.date == datetime(2000, 1, 1)
+        assert sorted(product.parsed_fields) == ["date", "item_info"]
+
+    def test_lazy_field_registry(self) -> None:
+        """Test that every lazy field is a Product field."""
+
+        names = {f.name for f in fields(Product)}
+
+        assert set(PRODUCT_LAZY_FIELDS) <= names
+
+
+class TestDMMClientLazyProducts:
+    """Test the lazy_products client option."""
+
+    def test_client_returns_lazy_products(self, item: Dict[str, Any]) -> None:
+        """Test that the client builds LazyProduct objects when asked to."""
+
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test_id", lazy_products=True
+        )
+        response = {
+            "result": {
+                "status": 200,
+                "result_count": 1,
+                "total_count": 1,
+                "first_position": 1,
+                "items": [item],
+            }
+        }
+
+        with patch.object(client, "_make_request", return_value=response):
+            products = client.get_products(site="FANZA")
+            streamed = list(client.iter_products(site="FANZA"))
+
+        assert isinstance(products[0], LazyProduct)
+        assert isinstance(streamed[0], LazyProduct)
+        assert products[0].review_average == 4.33
@@ -0,0 +1,96 @@
+"""
+Tests for running DMMClient calls in parallel threads.
+"""
+
+from typing import Iterator, List
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.fakeserver import FakeDMMServer
+from py_dmmjp.product import Product, ProductSearchParams
+
+
+@pytest.fixture
+def client() -> Iterator[DMMClient]:
+    """Client talking to a running FakeDMMServer."""
+
+    with FakeDMMServer(total_count=100, latency=0.01) as server:
+        with DMMClient("test_key", "test-990", base_url=server.base_url) as running:
+            yield running
+
+
+def content_ids(products: List[Product]) -> List[str]:
+    """Get the content IDs of products."""
+
+    return [p.content_id for p in products]
+
+
+class TestMapProducts:
+    """Test DMMClient.map_products."""
+
+    def test_results_in_input_order(self, client: DMMClient) -> None:
+        """Test results follow the order of the parameter sets."""
+
+        offsets = [91, 1, 51, 21, 71, 11, 41, 81, 31, 61]
+        params_list: List[ProductSearchParams] = [
+            {"site": "FANZA", "hits": 10, "offset": offset} for offset in offsets
+        ]
+
+        results = client.map_products(params_list, max_workers=4)
+
+        assert [content_ids(products) for products in results] == [
+            [f"fake{i:08d}" for i in range(offset, offset + 10)] for offset in offsets
+        ]
+
+    def test_partial_failure(self, client: DMMClient) -> None:
+        """Test a failed search returns its error in place with return_exceptions."""
+
+        results = client.map_products(
+            [
+                {"site": "FANZA", "hits": 5},
+                {"site": "FANZA", "hits": 1000},
+                {"site": "FANZA", "hits": 5, "offset": 6},
+            ],
+            return_exceptions=True,
+        )
+
+        assert isinstance(results[1], DMMAPIError)
+        assert results[1].status_code == 400
+        assert content_ids(results[0]) == [f"fake{i:08d}" for i in range(1, 6)]
+        assert content_ids(results[2]) == [f"fake{i:08d}" for i in range(6, 11)]
+
+    def test_failure_raised(self, client: DMMClient) -> None:
+        """Test a failed search is raised by default."""
+
+        with pytest.raises(DMMAPIError):
+            client.map_products(
+                [{"site": "FANZA", "hits": 5}, {"site": "FANZA", "hits": 1000}]
+            )
+
+    def test_empty(self, client: DMMClient) -> None:
+        """Test no searches give no results."""
+
+        assert not client.map_products([])
+
+    def test_invalid_max_workers(self, client: DMMClient) -> None:
+        """Test at least one worker is required."""
+
+        with pytest.raises(ValueError):
+            client.map_products([{"site": "FANZA"}], max_workers=0)
+
+
+class TestMapRequests:
+    """Test DMMClient.map_requests."""
+
+    def test_search_method(self, client: DMMClient) -> None:
+        """Test any search method can be mapped over parameter sets."""
+
+        results = client.map_requests(
+            client.get_genres,
+            [{"floor_id": 43, "hits": hits} for hits in (3, 1, 2)],
+            max_workers=3,
+        )
+
+        assert [len(genres) for genres in results] == [3, 1, 2]
@@ -0,0 +1,87 @@
+"""
+Tests for price string parsing.
+"""
+
+# pylint: disable=protected-access
+
+import pytest
+
+from py_dmmjp.pricing import parse_price, parse_prices
+from py_dmmjp.product import Delivery, Prices, Product
+
+
+class TestParsePrice:
+    """Test parse_price."""
+
+    @pytest.mark.parametrize(
+        "price, expected",
+        [
+            ("1980", (1980, 1980)),
+            ("¥1980", (1980, 1980)),
+            ("¥1,980", (1980, 1980)),
+            ("12,345,678", (12345678, 12345678)),
+            ("300~", (300, None)),
+            ("¥1,980~", (1980, None)),
+            ("500～", (500, None)),
+            ("500~1,000", (500, 1000)),
+            ("0", (0, 0)),
+            ("無料", (None, None)),
+            ("", (None, None)),
+        ],
+    )
+    def test_formats(self, price: str, expected: tuple) -> None:
+        """Test currency symbols, separators and ranges."""
+
+        assert parse_price(price) == expected
+
+    def test_memoized(self) -> None:
+        """Test repeated strings are served from the cache."""
+
+        parse_price("¥2,480~")
+        hits = parse_price.cache_info().hits
+
+        parse_price("¥2,480~")
+
+        assert parse_price.cache_info().hits == hits + 1
+
+    def test_batch(self) -> None:
+        """Test parse_prices returns minimum and maximum columns."""
+
+        minimums, maximums = parse_prices(["¥1,980", None, "300~", "", "500~1,000"])
+
+        assert minimums == [1980, None, 300, None, 500]
+        assert maximums == [1980, None, None, None, 1000]
+
+
+class TestPriceProperties:
+    """Test the integer price properties of the models."""
+
+    def test_prices(self) -> None:
+        """Test Prices exposes the lowest amount and the full range."""
+
+        prices = Prices(price="¥1,480~", list_price="¥2,980")
+
+        assert prices.price_int == 1480
+        assert prices.list_price_int == 2980
+        assert prices.price_range == (1480, None)
+        assert prices.list_price_range == (2980, 2980)
+        assert Prices().price_int is None
+        assert Prices().price_range == (None, None)
+
+    def test_delivery(self) -> None:
+        """Test Delivery parses its prices the same way."""
+
+        delivery = Delivery(type="hd", price="1,280", list_price="")
+
+        assert delivery.price_int == 1280
+        assert delivery.list_price_int is None
+
+    def test_product(self) -> None:
+        """Test the product shortcuts use the parsed prices."""
+
+        product = Product.from_dict(
+            {"prices": {"price": "¥3,278~", "list_price": "4,180"}}
+        )
+
+        assert product.current_price == 3278
+        assert product.original_price == 4180
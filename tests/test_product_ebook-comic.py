@@ -5,6 +5,7 @@ Tests for Ebook Comic products (service=ebook, floor=comic).
 # pylint: disable=duplicate-code,too-many-public-methods,line-too-long
 # mypy: disable-error-code="no-untyped-def"
 
+from datetime import datetime
 from typing import Any, Dict
 
 import pytest
@@ -154,7 +155,7 @@ class TestEbookComicProduct(ProductTestBase):
 
         product = Product.from_dict(product_data)
 
-        assert product.date is None
+        assert product.date == datetime(2025, 10, 9, 0, 0, 5)
 
     def test_product_image_urls(self, product_data):
         """Test ebook comic product image URLs."""
@@ -337,7 +338,7 @@ class TestEbookComicProduct(ProductTestBase):
         assert product.title is not None
         assert product.volume == 293
         assert product.number == 2
-        assert product.date is None
+        assert product.date == datetime(2025, 10, 9, 0, 0, 5)
         assert product.url is not None
         assert product.affiliate_url is not None
         assert product.jancode is None
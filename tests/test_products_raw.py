@@ -0,0 +1,101 @@
+"""
+Tests for the raw product item methods of DMMClient.
+"""
+
+# pylint: disable=protected-access
+
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.cache import MemoryCache
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+
+from .test_iter_products import make_page
+from .test_sharding import FakeCatalog
+
+
+class TestProductsRaw:
+    """Test the *_raw counterparts of the product methods."""
+
+    @pytest.fixture
+    def client(self) -> DMMClient:
+        """Create a DMM client instance for testing."""
+
+        return DMMClient(api_key="test_key", affiliate_id="test_id")
+
+    def test_get_products_raw(self, client: DMMClient) -> None:
+        """Test the decoded items list is returned unchanged."""
+
+        response = make_page(1, 3, 3)
+
+        with patch.object(client, "_make_request", return_value=response) as mock:
+            items = client.get_products_raw(site="FANZA", floor="videoa", hits=3)
+
+        assert items is response["result"]["items"]
+        mock.assert_called_once_with(
+            "/ItemList", {"site": "FANZA", "floor": "videoa", "hits": 3}
+        )
+
+    def test_get_products_matches_raw(self, client: DMMClient) -> None:
+        """Test get_products builds one Product per raw item."""
+
+        with patch.object(client, "_make_request", return_value=make_page(1, 3, 3)):
+            items = client.get_products_raw(site="FANZA")
+            products = client.get_products(site="FANZA")
+
+        assert [p.content_id for p in products] == [i["content_id"] for i in items]
+
+    def test_missing_result(self, client: DMMClient) -> None:
+        """Test a response without a result section is rejected."""
+
+        with patch.object(client, "_make_request", return_value={}):
+            with pytest.raises(DMMAPIError, match="missing 'result'"):
+                client.get_products_raw(site="FANZA")
+
+    def test_iter_products_raw(self, client: DMMClient) -> None:
+        """Test every page is walked and items are yielded as dicts."""
+
+        with patch.object(
+            client,
+            "_make_request",
+            side_effect=lambda _, p: make_page(p["offset"], p["hits"], 250),
+        ):
+            items = list(client.iter_products_raw(site="FANZA"))
+
+        assert len(items) == 250
+        assert all(isinstance(item, dict) for item in items)
+        assert items[-1]["content_id"] == "cid00250"
+
+    def test_crawl_products_raw(self, client: DMMClient) -> None:
+        """Test sharded raw crawling returns every item once."""
+
+        catalog = FakeCatalog(300)
+
+        with patch.object(client, "_make_request", side_effect=catalog):
+            items = list(
+                client.crawl_products_raw(
+                    site="FANZA", max_shard_size=100, max_workers=2
+                )
+            )
+
+        assert sorted(item["content_id"] for item in items) == [
+            f"cid{i:05d}" for i in range(300)
+        ]
+
+    def test_uses_cache(self) -> None:
+        """Test raw requests share the response cache with get_products."""
+
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test_id", cache=MemoryCache()
+        )
+
+        with patch.object(
+            client, "_send_request", return_value=make_page(1, 3, 3)
+        ) as mock:
+            client.get_products(site="FANZA", hits=3)
+            items = client.get_products_raw(site="FANZA", hits=3)
+
+        assert mock.call_count == 1
+        assert len(items) == 3
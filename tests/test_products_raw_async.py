@@ -0,0 +1,79 @@
+"""
+Tests for the raw product item methods of AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+
+from .test_iter_products import make_page
+from .test_iter_products_async import FakeItemList
+from .test_sharding_async import AsyncFakeCatalog
+
+
+class TestAsyncProductsRaw:
+    """Test the *_raw counterparts of the async product methods."""
+
+    @pytest.mark.asyncio
+    async def test_get_products_raw(self) -> None:
+        """Test the decoded items list is returned unchanged."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        response = make_page(1, 3, 3)
+
+        async def fake_request(endpoint: str, params: Dict[str, Any]) -> Any:
+            assert endpoint == "/ItemList"
+
+            return response
+
+        with patch.object(client, "_make_request", new=fake_request):
+            items = await client.get_products_raw(site="FANZA", hits=3)
+            products = await client.get_products(site="FANZA", hits=3)
+
+        assert items is response["result"]["items"]
+        assert [p.content_id for p in products] == [i["content_id"] for i in items]
+
+    @pytest.mark.asyncio
+    async def test_iter_products_raw(self) -> None:
+        """Test every page is fetched and items are yielded as dicts in order."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+
+        with patch.object(client, "_make_request", new=FakeItemList(total_count=250)):
+            items = [
+                item
+                async for item in client.iter_products_raw(site="FANZA", concurrency=3)
+            ]
+
+        assert [item["content_id"] for item in items] == [
+            f"cid{i:05d}" for i in range(1, 251)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_crawl_products_raw(self) -> None:
+        """Test sharded raw crawling returns every item once."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        catalog = AsyncFakeCatalog(300)
+
+        with patch.object(client, "_make_request", new=catalog.fetch):
+            items = [
+                item
+                async for item in client.crawl_products_raw(
+                    site="FANZA", max_shard_size=100
+                )
+            ]
+
+        assert sorted(item["content_id"] for item in items) == [
+            f"cid{i:05d}" for i in range(300)
+        ]
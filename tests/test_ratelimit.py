@@ -0,0 +1,120 @@
+"""
+Tests for client-side rate limiting.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.ratelimit import RateLimit, TokenBucket, get_token_bucket
+
+FLOOR_RESPONSE: Dict[str, Any] = {"result": {"site": []}}
+
+
+class TestRateLimit:
+    """Test RateLimit validation."""
+
+    def test_invalid_values(self) -> None:
+        """Test that non-positive rates and bursts are rejected."""
+
+        with pytest.raises(ValueError):
+            RateLimit(per_second=0)
+
+        with pytest.raises(ValueError):
+            RateLimit(per_second=1, burst=0)
+
+
+class TestTokenBucket:
+    """Test TokenBucket reservations and metrics."""
+
+    def test_burst_then_spacing(self) -> None:
+        """Test that a burst is free and later requests are spaced out."""
+
+        with patch("py_dmmjp.ratelimit.time.monotonic", return_value=100.0):
+            bucket = TokenBucket(RateLimit(per_second=2, burst=3))
+            delays = [bucket.reserve() for _ in range(5)]
+
+        assert delays == [0.0, 0.0, 0.0, 0.5, 1.0]
+        assert bucket.acquisitions == 5
+        assert bucket.waits == 2
+        assert bucket.total_wait == 1.5
+        assert bucket.max_wait == 1.0
+        assert bucket.average_wait == 0.3
+
+    def test_refill_is_capped_at_burst(self) -> None:
+        """Test that idle time never accumulates more than `burst` tokens."""
+
+        with patch("py_dmmjp.ratelimit.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(RateLimit(per_second=1, burst=2))
+            bucket.reserve()
+            bucket.reserve()
+
+        with patch("py_dmmjp.ratelimit.time.monotonic", return_value=60.0):
+            delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays == [0.0, 0.0, 1.0]
+
+    def test_acquire_sleeps(self) -> None:
+        """Test that acquire sleeps for the reserved delay."""
+
+        bucket = TokenBucket(RateLimit(per_second=1))
+
+        with patch("py_dmmjp.ratelimit.time.sleep") as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+
+        assert mock_sleep.call_count == 1
+        assert 0.9 < mock_sleep.call_args[0][0] <= 1.0
+
+    def test_reset_stats(self) -> None:
+        """Test that metrics can be reset."""
+
+        bucket = TokenBucket(RateLimit(per_second=1))
+        bucket.reserve()
+        bucket.reserve()
+        bucket.reset_stats()
+
+        assert bucket.acquisitions == 0
+        assert bucket.total_wait == 0.0
+
+
+class TestDMMClientRateLimit:
+    """Test rate limiting in DMMClient."""
+
+    def test_buckets_shared_per_api_id(self) -> None:
+        """Test that clients with the same API key share one bucket."""
+
+        limit = RateLimit(per_second=5, burst=2)
+        first = DMMClient(api_key="shared_key", affiliate_id="a", rate_limit=limit)
+        second = DMMClient(api_key="shared_key", affiliate_id="b", rate_limit=limit)
+        other = DMMClient(api_key="other_key", affiliate_id="a", rate_limit=limit)
+
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is get_token_bucket("shared_key", limit)
+        assert other.rate_limiter is not first.rate_limiter
+
+    def test_requests_acquire_tokens(self) -> None:
+        """Test that every network request takes a token, but cache hits do not."""
+
+        bucket = TokenBucket(RateLimit(per_second=1000, burst=10))
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test_id", rate_limit=bucket
+        )
+
+        with patch.object(client, "_send_request", return_value=FLOOR_RESPONSE):
+            client.get_floors()
+            client.get_floors()
+
+        assert client.rate_limiter is bucket
+        assert bucket.acquisitions == 2
+
+    def test_unlimited_by_default(self) -> None:
+        """Test that the client is not rate limited unless asked to."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id")
+
+        assert client.rate_limiter is None
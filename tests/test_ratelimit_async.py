@@ -0,0 +1,52 @@
+"""
+Tests for client-side rate limiting in AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.ratelimit import RateLimit, TokenBucket
+
+
+class TestAsyncDMMClientRateLimit:
+    """Test rate limiting in AsyncDMMClient."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_spaced(self) -> None:
+        """Test that concurrent requests wait for their reserved tokens."""
+
+        bucket = TokenBucket(RateLimit(per_second=4, burst=2))
+        client = AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", rate_limit=bucket
+        )
+        sleeps: List[float] = []
+
+        async def send(_url: str, _params: Dict[str, Any]) -> Dict[str, Any]:
+            return {"result": {"status": 200, "genre": []}}
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        client._send_request = send  # type: ignore[method-assign]
+
+        with patch("py_dmmjp.ratelimit.asyncio.sleep", new=fake_sleep):
+            await asyncio.gather(
+                *(client.get_genres(floor_id) for floor_id in range(1, 5))
+            )
+
+        assert bucket.acquisitions == 4
+        assert bucket.waits == 2
+        assert len(sleeps) == 2
+        assert sleeps[1] > sleeps[0] > 0
+        assert client.rate_limiter is bucket
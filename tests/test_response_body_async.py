@@ -0,0 +1,86 @@
+"""
+Tests for response body handling in AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+from unittest.mock import Mock, patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.exceptions import DMMAPIError
+
+from .conftest import GENRE_RESPONSE, make_async_response
+
+
+class TestAsyncDMMClientResponseBody:
+    """Test body reading and size limits in AsyncDMMClient._send_request."""
+
+    @pytest.mark.asyncio
+    async def test_body_read_once_as_bytes(self, capsys: pytest.CaptureFixture) -> None:
+        """Test that the body is read once, as bytes, without printing it."""
+
+        response = make_async_response(GENRE_RESPONSE)
+
+        async with AsyncDMMClient(api_key="test_key", affiliate_id="test_id") as client:
+            session = await client._ensure_session()
+
+            with patch.object(session, "get", Mock(return_value=response)):
+                assert await client.get_genres(25) == []
+
+        response.read.assert_awaited_once()
+        assert capsys.readouterr().out == ""
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_within_limit(self) -> None:
+        """Test that bodies within max_response_size are assembled from chunks."""
+
+        response = make_async_response(b"", [GENRE_RESPONSE[:10], GENRE_RESPONSE[10:]])
+
+        async with AsyncDMMClient(
+            api_key="test_key",
+            affiliate_id="test_id",
+            max_response_size=len(GENRE_RESPONSE),
+        ) as client:
+            session = await client._ensure_session()
+
+            with patch.object(session, "get", Mock(return_value=response)):
+                assert await client.get_genres(25) == []
+
+        response.read.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_declared_length_over_limit(self) -> None:
+        """Test that an oversized Content-Length is rejected before reading."""
+
+        response = make_async_response(b"", content_length=1024)
+
+        async with AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", max_response_size=512
+        ) as client:
+            session = await client._ensure_session()
+
+            with patch.object(session, "get", Mock(return_value=response)):
+                with pytest.raises(DMMAPIError, match="max_response_size"):
+                    await client.get_genres(25)
+
+    @pytest.mark.asyncio
+    async def test_streamed_body_over_limit(self) -> None:
+        """Test that a body is abandoned as soon as it grows past the limit."""
+
+        response = make_async_response(b"", [b"x" * 300, b"x" * 300])
+
+        async with AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", max_response_size=512
+        ) as client:
+            session = await client._ensure_session()
+
+            with patch.object(session, "get", Mock(return_value=response)):
+                with pytest.raises(DMMAPIError, match="512 bytes"):
+                    await client.get_genres(25)
@@ -0,0 +1,192 @@
+"""
+Tests for retrying transient failures.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import (
+    DMMAPIError,
+    DMMAuthError,
+    DMMConnectionError,
+    DMMTimeoutError,
+)
+from py_dmmjp.retry import RetryPolicy
+
+from .conftest import make_response
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy classification, backoff and budget."""
+
+    def test_is_retryable(self) -> None:
+        """Test which errors are considered transient."""
+
+        policy = RetryPolicy()
+
+        assert policy.is_retryable(DMMTimeoutError("timeout"))
+        assert policy.is_retryable(DMMConnectionError("down"))
+        assert policy.is_retryable(DMMAPIError("busy", status_code=503))
+        assert policy.is_retryable(DMMAPIError("slow down", status_code=429))
+        assert not policy.is_retryable(DMMAPIError("bad", status_code=400))
+        assert not policy.is_retryable(DMMAPIError("invalid json"))
+        assert not policy.is_retryable(DMMAuthError())
+
+    def test_backoff_curve(self) -> None:
+        """Test exponential growth, the cap and jitter bounds."""
+
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+        assert [policy.backoff(n) for n in range(1, 5)] == [1, 2, 4, 5]
+
+        jittered = RetryPolicy(backoff_factor=1, max_backoff=5)
+
+        assert all(0 <= jittered.backoff(4) <= 5 for _ in range(100))
+
+    def test_retries_until_success(self) -> None:
+        """Test that transient failures are retried and counted."""
+
+        policy = RetryPolicy(max_attempts=4, jitter=False)
+        fn = Mock(side_effect=[DMMTimeoutError("t"), DMMConnectionError("c"), "ok"])
+
+        with patch("py_dmmjp.retry.time.sleep") as mock_sleep:
+            assert policy.call(fn) == "ok"
+
+        assert fn.call_count == 3
+        assert [c[0][0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+        assert policy.retry_count == 2
+        assert policy.exhausted_count == 0
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        """Test that the last error is raised once attempts run out."""
+
+        policy = RetryPolicy(max_attempts=2)
+        fn = Mock(side_effect=DMMAPIError("busy", status_code=502))
+
+        with patch("py_dmmjp.retry.time.sleep"):
+            with pytest.raises(DMMAPIError, match="busy"):
+                policy.call(fn)
+
+        assert fn.call_count == 2
+        assert policy.retry_count == 1
+        assert policy.exhausted_count == 1
+
+    def test_non_retryable_raised_immediately(self) -> None:
+        """Test that permanent errors are not retried."""
+
+        policy = RetryPolicy()
+        fn = Mock(side_effect=DMMAPIError("bad request", status_code=400))
+
+        with pytest.raises(DMMAPIError):
+            policy.call(fn)
+
+        assert fn.call_count == 1
+        assert policy.retry_count == 0
+
+    def test_deadline(self) -> None:
+        """Test that no retry starts once the deadline would be exceeded."""
+
+        policy = RetryPolicy(
+            max_attempts=10, backoff_factor=1, jitter=False, deadline=2.5
+        )
+        fn = Mock(side_effect=DMMTimeoutError("t"))
+        clock: List[float] = [0.0]
+
+        def sleep(delay: float) -> None:
+            clock[0] += delay
+
+        with patch("py_dmmjp.retry.time.monotonic", side_effect=lambda: clock[0]):
+            with patch("py_dmmjp.retry.time.sleep", side_effect=sleep):
+                with pytest.raises(DMMTimeoutError):
+                    policy.call(fn)
+
+        assert fn.call_count == 2
+        assert clock[0] == 1.0
+
+    def test_invalid_values(self) -> None:
+        """Test argument validation."""
+
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+        with pytest.raises(ValueError):
+            RetryPolicy(backoff_factor=-1)
+
+
+class TestDMMClientRetry:
+    """Test retries in DMMClient."""
+
+    def test_no_retry_by_default(self) -> None:
+        """Test that failures are not retried unless a policy is given."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id")
+
+        with patch.object(
+            client._session, "get", side_effect=requests.exceptions.Timeout()
+        ) as mock_get:
+            with pytest.raises(DMMTimeoutError, match="Request timed out"):
+                client.get_floors()
+
+        assert client.retry_policy is None
+        assert mock_get.call_count == 1
+
+    def test_transient_failures_retried(self) -> None:
+        """Test that timeouts and 503 responses are retried."""
+
+        policy = RetryPolicy(max_attempts=3)
+        client = DMMClient(api_key="test_key", affiliate_id="test_id", retry=policy)
+        responses: List[Any] = [
+            requests.exceptions.ConnectionError(),
+            make_response(503, b"Service Unavailable"),
+            make_response(200),
+        ]
+
+        with patch.object(client._session, "get", side_effect=responses) as mock_get:
+            with patch("py_dmmjp.retry.time.sleep"):
+                floors = client.get_floors()
+
+        assert floors[0].code == "FANZA"
+        assert mock_get.call_count == 3
+        assert client.retry_policy is policy
+        assert policy.retry_count == 2
+
+    def test_auth_errors_not_retried(self) -> None:
+        """Test that authentication failures are raised immediately."""
+
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test_id", retry=RetryPolicy()
+        )
+
+        with patch.object(
+            client._session, "get", return_value=make_response(401)
+        ) as mock_get:
+            with pytest.raises(DMMAuthError):
+                client.get_floors()
+
+        assert mock_get.call_count == 1
+
+    def test_every_attempt_is_rate_limited(self) -> None:
+        """Test that retries take a rate limiter token like any request."""
+
+        limiter = Mock()
+        client = DMMClient(
+            api_key="test_key", affiliate_id="test_id", retry=RetryPolicy()
+        )
+        client._rate_limiter = limiter
+        params: Dict[str, Any] = {}
+
+        with patch.object(
+            client,
+            "_send_request",
+            side_effect=[DMMTimeoutError("t"), {"result": {"site": []}}],
+        ):
+            with patch("py_dmmjp.retry.time.sleep"):
+                client._make_request("/FloorList", params)
+
+        assert limiter.acquire.call_count == 2
@@ -0,0 +1,73 @@
+"""
+Tests for retrying transient failures in AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.exceptions import DMMAPIError, DMMTimeoutError
+from py_dmmjp.retry import RetryPolicy
+
+
+class TestAsyncDMMClientRetry:
+    """Test retries in AsyncDMMClient."""
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_retried(self) -> None:
+        """Test that transient failures are retried with backoff."""
+
+        policy = RetryPolicy(max_attempts=3, jitter=False)
+        client = AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", retry=policy
+        )
+        outcomes: List[Any] = [
+            DMMTimeoutError("Request timed out"),
+            DMMAPIError("HTTP 500", status_code=500),
+            {"result": {"status": 200, "genre": []}},
+        ]
+        sleeps: List[float] = []
+
+        async def send(_url: str, _params: Dict[str, Any]) -> Dict[str, Any]:
+            outcome = outcomes.pop(0)
+
+            if isinstance(outcome, Exception):
+                raise outcome
+
+            return outcome
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        client._send_request = send  # type: ignore[method-assign]
+
+        with patch("py_dmmjp.retry.asyncio.sleep", new=fake_sleep):
+            genres = await client.get_genres(25)
+
+        assert genres == []
+        assert sleeps == [0.5, 1.0]
+        assert policy.retry_count == 2
+
+    @pytest.mark.asyncio
+    async def test_asyncio_timeout_mapped(self) -> None:
+        """Test that aiohttp total timeouts surface as DMMTimeoutError."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        session = await client._ensure_session()
+
+        try:
+            with patch.object(session, "get", side_effect=asyncio.TimeoutError()):
+                with pytest.raises(DMMTimeoutError, match="Request timed out"):
+                    await client.get_genres(25)
+        finally:
+            await client.close()
@@ -0,0 +1,231 @@
+"""
+Tests for date-window sharding of large ItemList searches.
+"""
+
+# pylint: disable=protected-access
+
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.sharding import EARLIEST_RELEASE_DATE, DateWindow
+
+
+class FakeCatalog:
+    """Fake ItemList endpoint serving a synthetic catalog filtered by release date."""
+
+    def __init__(self, count: int, overlap: timedelta = timedelta(0)) -> None:
+        start = datetime(2020, 1, 1)
+        self.items = [
+            {
+                "content_id": f"cid{i:05d}",
+                "title": f"Product {i}",
+                "date": (start + timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            for i in range(count)
+        ]
+        self.overlap = overlap
+        self.requests: List[Dict[str, Any]] = []
+
+    def __call__(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        assert endpoint == "/ItemList"
+
+        self.requests.append(dict(params))
+
+        gte = datetime.fromisoformat(params["gte_date"]) - self.overlap
+        lte = datetime.fromisoformat(params["lte_date"]) + self.overlap
+        matches = [
+            item
+            for item in self.items
+            if gte <= datetime.strptime(item["date"], "%Y-%m-%d %H:%M:%S") <= lte
+        ]
+
+        offset = params.get("offset", 1)
+        hits = params.get("hits", 20)
+        page = matches[offset - 1 : offset - 1 + hits]
+
+        return {
+            "result": {
+                "status": 200,
+                "result_count": len(page),
+                "total_count": len(matches),
+                "first_position": offset,
+                "items": page,
+            }
+        }
+
+
+class TestDateWindow:
+    """Test DateWindow helpers."""
+
+    def test_from_params_with_dates(self) -> None:
+        """Test that explicit dates are parsed."""
+
+        window = DateWindow.from_params(
+            {"gte_date": "2016-04-01T00:00:00", "lte_date": "2016-04-30T23:59:59"}
+        )
+
+        assert window.start == datetime(2016, 4, 1)
+        assert window.end == datetime(2016, 4, 30, 23, 59, 59)
+
+    def test_from_params_defaults(self) -> None:
+        """Test that missing dates default to an open-ended window."""
+
+        window = DateWindow.from_params({})
+
+        assert window.start == EARLIEST_RELEASE_DATE
+        assert window.end > datetime.now()
+
+    def test_to_params(self) -> None:
+        """Test conversion to ItemList parameters."""
+
+        window = DateWindow(datetime(2020, 1, 1), datetime(2020, 1, 31, 12, 30))
+
+        assert window.to_params() == {
+            "gte_date": "2020-01-01T00:00:00",
+            "lte_date": "2020-01-31T12:30:00",
+        }
+
+    def test_split_is_adjacent_and_disjoint(self) -> None:
+        """Test that both halves cover the window without overlapping."""
+
+        window = DateWindow(datetime(2020, 1, 1), datetime(2020, 1, 3))
+        earlier, later = window.split()
+
+        assert earlier.start == window.start
+        assert later.end == window.end
+        assert later.start - earlier.end == timedelta(seconds=1)
+
+    def test_can_split(self) -> None:
+        """Test that a single-second window cannot be split."""
+
+        moment = datetime(2020, 1, 1)
+
+        assert not DateWindow(moment, moment).can_split()
+        assert DateWindow(moment, moment + timedelta(seconds=1)).can_split()
+
+
+class TestPlanProductShards:
+    """Test DMMClient.plan_product_shards."""
+
+    @pytest.fixture
+    def client(self) -> DMMClient:
+        """Create a DMM client instance for testing."""
+
+        return DMMClient(api_key="test_key", affiliate_id="test_id")
+
+    def test_single_shard_when_under_cap(self, client: DMMClient) -> None:
+        """Test that a small search is not split."""
+
+        with patch.object(client, "_make_request", side_effect=FakeCatalog(50)):
+            shards = client.plan_product_shards(site="FANZA", floor="videoa")
+
+        assert len(shards) == 1
+        assert shards[0]["floor"] == "videoa"
+
+    def test_splits_until_shards_fit(self, client: DMMClient) -> None:
+        """Test that every shard fits under the configured size."""
+
+        catalog = FakeCatalog(1000)
+
+        with patch.object(client, "_make_request", side_effect=catalog):
+            shards = client.plan_product_shards(site="FANZA", max_shard_size=150)
+
+        assert len(shards) > 1
+
+        for shard in shards:
+            result = catalog("/ItemList", {**shard, "hits": 1, "offset": 1})["result"]
+
+            assert 0 < result["total_count"] <= 150
+
+        starts = [DateWindow.from_params(s).start for s in shards]
+
+        assert starts == sorted(starts)
+
+    def test_respects_existing_date_range(self, client: DMMClient) -> None:
+        """Test that shards stay inside the requested date range."""
+
+        with patch.object(client, "_make_request", side_effect=FakeCatalog(1000)):
+            shards = client.plan_product_shards(
+                site="FANZA",
+                gte_date="2020-01-10T00:00:00",
+                lte_date="2020-01-20T00:00:00",
+                max_shard_size=100,
+            )
+
+        windows = [DateWindow.from_params(s) for s in shards]
+
+        assert windows[0].start >= datetime(2020, 1, 10)
+        assert windows[-1].end <= datetime(2020, 1, 20)
+
+
+class TestCrawlProducts:
+    """Test DMMClient.crawl_products."""
+
+    @pytest.fixture
+    def client(self) -> DMMClient:
+        """Create a DMM client instance for testing."""
+
+        return DMMClient(api_key="test_key", affiliate_id="test_id")
+
+    def test_crawls_every_product(self, client: DMMClient) -> None:
+        """Test that sharded crawling returns the full catalog."""
+
+        with patch.object(client, "_make_request", side_effect=FakeCatalog(700)):
+            products = list(client.crawl_products(site="FANZA", max_shard_size=200))
+
+        assert sorted(p.content_id for p in products) == [
+            f"cid{i:05d}" for i in range(700)
+        ]
+
+    def test_dedupes_overlapping_shards(self, client: DMMClient) -> None:
+        """Test that products repeated across shard edges are yielded once."""
+
+        catalog = FakeCatalog(700, overlap=timedelta(hours=2))
+
+        with patch.object(client, "_make_request", side_effect=catalog):
+            products = list(client.crawl_products(site="FANZA", max_shard_size=200))
+
+        content_ids = [p.content_id for p in products]
+
+        assert len(content_ids) == len(set(content_ids))
+        assert set(content_ids) == {f"cid{i:05d}" for i in range(700)}
+
+    def test_parallel_crawl(self, client: DMMClient) -> None:
+        """Test that crawling shards on worker threads returns the full catalog."""
+
+        with patch.object(client, "_make_request", side_effect=FakeCatalog(700)):
+            products = list(
+                client.crawl_products(
+                    site="FANZA", max_shard_size=100, max_workers=4, hits=50
+                )
+            )
+
+        assert sorted(p.content_id for p in products) == [
+            f"cid{i:05d}" for i in range(700)
+        ]
+
+    def test_parallel_crawl_stopped_early(self, client: DMMClient) -> None:
+        """Test that worker threads stop requesting pages once iteration stops."""
+
+        catalog = FakeCatalog(700)
+
+        def slow_catalog(endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            time.sleep(0.05)
+            return catalog(endpoint, params)
+
+        with patch.object(client, "_make_request", side_effect=slow_catalog):
+            products = client.crawl_products(
+                site="FANZA", max_shard_size=100, max_workers=4, hits=10
+            )
+            next(products)
+            request_count = len(catalog.requests)
+            products.close()
+            time.sleep(0.5)
+
+        # Only the requests in flight when iteration stopped may complete.
+        assert len(catalog.requests) <= request_count + 4
@@ -0,0 +1,77 @@
+"""
+Tests for date-window sharding with AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+from datetime import timedelta
+from typing import Any, Dict
+from unittest.mock import patch
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.sharding import DateWindow
+
+from .test_sharding import FakeCatalog
+
+
+class AsyncFakeCatalog(FakeCatalog):
+    """Async wrapper around the synthetic catalog endpoint."""
+
+    async def fetch(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Serve a page of the catalog asynchronously."""
+
+        return self(endpoint, params)
+
+
+class TestAsyncSharding:
+    """Test AsyncDMMClient.plan_product_shards and crawl_products."""
+
+    @pytest.mark.asyncio
+    async def test_plan_product_shards(self) -> None:
+        """Test that shards fit under the cap and are chronological."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        catalog = AsyncFakeCatalog(1000)
+
+        with patch.object(client, "_make_request", new=catalog.fetch):
+            shards = await client.plan_product_shards(
+                site="FANZA", max_shard_size=150, concurrency=3
+            )
+
+        assert len(shards) > 1
+
+        for shard in shards:
+            result = catalog("/ItemList", {**shard, "hits": 1, "offset": 1})["result"]
+
+            assert 0 < result["total_count"] <= 150
+
+        starts = [DateWindow.from_params(s).start for s in shards]
+
+        assert starts == sorted(starts)
+
+    @pytest.mark.asyncio
+    async def test_crawl_products_dedupes(self) -> None:
+        """Test that the crawl returns every product exactly once."""
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        catalog = AsyncFakeCatalog(700, overlap=timedelta(hours=2))
+
+        with patch.object(client, "_make_request", new=catalog.fetch):
+            products = [
+                p
+                async for p in client.crawl_products(
+                    site="FANZA", max_shard_size=200, hits=50
+                )
+            ]
+
+        content_ids = [p.content_id for p in products]
+
+        assert len(content_ids) == len(set(content_ids))
+        assert set(content_ids) == {f"cid{i:05d}" for i in range(700)}
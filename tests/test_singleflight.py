@@ -0,0 +1,124 @@
+"""
+Tests for request coalescing in DMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.singleflight import SingleFlight
+
+PRODUCT_RESPONSE: Dict[str, Any] = {
+    "result": {"status": 200, "result_count": 0, "total_count": 0, "items": []}
+}
+
+
+class TestSingleFlight:
+    """Test the thread-based SingleFlight helper."""
+
+    def test_concurrent_calls_share_one_result(self) -> None:
+        """Test that callers arriving during a flight receive its result."""
+
+        flights: SingleFlight[int] = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls: List[int] = []
+
+        def slow() -> int:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return 42
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flights.do, "key", slow)
+            started.wait(5)
+            followers = [executor.submit(flights.do, "key", slow) for _ in range(3)]
+
+            while flights.coalesced < 3:
+                threading.Event().wait(0.001)
+
+            release.set()
+
+            assert leader.result() == 42
+            assert [f.result() for f in followers] == [42, 42, 42]
+
+        assert len(calls) == 1
+        assert flights.in_flight == 0
+
+    def test_errors_are_shared_and_not_remembered(self) -> None:
+        """Test that a failed flight raises for every caller and is not reused."""
+
+        flights: SingleFlight[int] = SingleFlight()
+
+        def fail() -> int:
+            raise DMMAPIError("boom")
+
+        with pytest.raises(DMMAPIError):
+            flights.do("key", fail)
+
+        assert flights.do("key", lambda: 1) == 1
+
+    def test_distinct_keys_run_separately(self) -> None:
+        """Test that different keys never share a flight."""
+
+        flights: SingleFlight[str] = SingleFlight()
+
+        assert flights.do("a", lambda: "a") == "a"
+        assert flights.do("b", lambda: "b") == "b"
+        assert flights.coalesced == 0
+
+
+class TestDMMClientCoalescing:
+    """Test coalescing in DMMClient._make_request."""
+
+    def test_identical_requests_coalesced(self) -> None:
+        """Test that concurrent identical requests send one HTTP call."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id")
+        release = threading.Event()
+        calls: List[Dict[str, Any]] = []
+
+        def send(_url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            release.wait(5)
+            return PRODUCT_RESPONSE
+
+        assert client._flights is not None
+
+        with patch.object(client, "_send_request", side_effect=send):
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = [
+                    executor.submit(client.get_product_by_cid, "abc123", "FANZA")
+                    for _ in range(5)
+                ]
+
+                while client._flights.coalesced < 4:
+                    threading.Event().wait(0.001)
+
+                release.set()
+
+                assert [f.result() for f in futures] == [None] * 5
+
+        assert len(calls) == 1
+
+    def test_coalescing_disabled(self) -> None:
+        """Test that coalescing can be turned off."""
+
+        client = DMMClient(api_key="test_key", affiliate_id="test_id", coalesce=False)
+
+        with patch.object(
+            client, "_send_request", return_value=PRODUCT_RESPONSE
+        ) as mock_send:
+            client.get_product_by_cid("abc123", "FANZA")
+            client.get_product_by_cid("abc123", "FANZA")
+
+        assert client._flights is None
+        assert mock_send.call_count == 2
@@ -0,0 +1,138 @@
+"""
+Tests for request coalescing in AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from typing import Any, Dict, List
+
+from py_dmmjp.async_client import AsyncDMMClient
+from py_dmmjp.exceptions import DMMAPIError
+from py_dmmjp.singleflight import AsyncSingleFlight
+
+PRODUCT_RESPONSE: Dict[str, Any] = {
+    "result": {"status": 200, "result_count": 0, "total_count": 0, "items": []}
+}
+
+
+class TestAsyncSingleFlight:
+    """Test the event-loop based AsyncSingleFlight helper."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_flight(self) -> None:
+        """Test that cancelling one waiter leaves the shared call running."""
+
+        flights: AsyncSingleFlight[int] = AsyncSingleFlight()
+        release = asyncio.Event()
+
+        async def slow() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.ensure_future(flights.do("key", slow))
+        second = asyncio.ensure_future(flights.do("key", slow))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+
+        assert await second == 7
+        assert first.cancelled()
+        assert flights.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_last_cancelled_caller_cancels_flight(self) -> None:
+        """Test that the shared call is cancelled once every waiter is."""
+
+        flights: AsyncSingleFlight[int] = AsyncSingleFlight()
+        started: List[asyncio.Task[Any]] = []
+
+        async def slow() -> int:
+            started.append(asyncio.current_task())  # type: ignore[arg-type]
+            await asyncio.sleep(10)
+            return 7
+
+        callers = [asyncio.ensure_future(flights.do("key", slow)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        for caller in callers:
+            caller.cancel()
+
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert started[0].cancelled()
+        assert flights.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self) -> None:
+        """Test that every waiter receives the flight's exception."""
+
+        flights: AsyncSingleFlight[int] = AsyncSingleFlight()
+
+        async def fail() -> int:
+            await asyncio.sleep(0)
+            raise DMMAPIError("boom")
+
+        results = await asyncio.gather(
+            flights.do("key", fail), flights.do("key", fail), return_exceptions=True
+        )
+
+        assert all(isinstance(r, DMMAPIError) for r in results)
+        assert flights.coalesced == 1
+        assert flights.in_flight == 0
+
+
+class TestAsyncDMMClientCoalescing:
+    """Test coalescing in AsyncDMMClient._make_request."""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_coalesced(self) -> None:
+        """Test that concurrent identical requests send one HTTP call."""
+
+        calls: List[Dict[str, Any]] = []
+
+        async def send(_url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            await asyncio.sleep(0.01)
+            return PRODUCT_RESPONSE
+
+        client = AsyncDMMClient(api_key="test_key", affiliate_id="test_id")
+        client._send_request = send  # type: ignore[method-assign]
+
+        results = await asyncio.gather(
+            *(client.get_product_by_cid("abc123", "FANZA") for _ in range(10)),
+            client.get_product_by_cid("xyz789", "FANZA"),
+        )
+
+        assert results == [None] * 11
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_coalescing_disabled(self) -> None:
+        """Test that coalescing can be turned off."""
+
+        calls: List[Dict[str, Any]] = []
+
+        async def send(_url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+            calls.append(params)
+            return PRODUCT_RESPONSE
+
+        client = AsyncDMMClient(
+            api_key="test_key", affiliate_id="test_id", coalesce=False
+        )
+        client._send_request = send  # type: ignore[method-assign]
+
+        await asyncio.gather(
+            *(client.get_product_by_cid("abc123", "FANZA") for _ in range(3))
+        )
+
+        assert len(calls) == 3
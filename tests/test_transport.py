@@ -0,0 +1,190 @@
+"""
+Tests for pluggable transports.
+"""
+
+# pylint: disable=protected-access
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+import requests
+
+from py_dmmjp.client import DMMClient
+from py_dmmjp.exceptions import (
+    DMMAPIError,
+    DMMAuthError,
+    DMMConnectionError,
+    DMMTimeoutError,
+)
+from py_dmmjp.retry import RetryPolicy
+from py_dmmjp.transport import RequestsTransport, Transport, TransportResponse
+
+from .conftest import FLOOR_RESPONSE
+
+
+class LibraryTimeout(Exception):
+    """Timeout raised by an imaginary HTTP library."""
+
+
+class LibraryDisconnect(Exception):
+    """Connection error raised by an imaginary HTTP library."""
+
+
+class LibraryError(Exception):
+    """Base error of an imaginary HTTP library."""
+
+
+class FakeTransport(Transport):
+    """In-process transport answering requests from a list of responses."""
+
+    timeout_errors = (LibraryTimeout,)
+    connection_errors = (LibraryDisconnect,)
+    request_errors = (LibraryError,)
+
+    def __init__(self, *responses: Any) -> None:
+        self.responses = list(responses)
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+        self.closed = False
+
+    def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        self.requests.append((url, dict(params)))
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def make_client(transport: Transport, retry: Optional[RetryPolicy] = None) -> DMMClient:
+    """Create a client sending its requests through a transport."""
+
+    return DMMClient("test_key", "test-990", transport=transport, retry=retry)
+
+
+class TestTransport:
+    """Test DMMClient with a custom transport."""
+
+    def test_requests_sent_through_transport(self) -> None:
+        """Test requests and responses go through the transport."""
+
+        transport = FakeTransport(TransportResponse(200, FLOOR_RESPONSE))
+        client = make_client(transport)
+
+        floors = client.get_floors()
+
+        assert floors[0].code == "FANZA"
+        assert transport.requests == [
+            (
+                "https://api.dmm.com/affiliate/v3/FloorList",
+                {"api_id": "test_key", "affiliate_id": "test-990", "output": "json"},
+            )
+        ]
+
+    @pytest.mark.parametrize(
+        "status, error, message",
+        [
+            (401, DMMAuthError, "Invalid API key"),
+            (403, DMMAuthError, "Access forbidden"),
+            (500, DMMAPIError, "HTTP 500: Internal Server Error"),
+        ],
+    )
+    def test_status_mapping(self, status: int, error: type, message: str) -> None:
+        """Test error statuses raise the same errors as the default transport."""
+
+        client = make_client(
+            FakeTransport(TransportResponse(status, b"Internal Server Error"))
+        )
+
+        with pytest.raises(error, match=message):
+            client.get_floors()
+
+    @pytest.mark.parametrize(
+        "exception, error",
+        [
+            (LibraryTimeout(), DMMTimeoutError),
+            (LibraryDisconnect(), DMMConnectionError),
+            (LibraryError("boom"), DMMAPIError),
+        ],
+    )
+    def test_exception_mapping(self, exception: Exception, error: type) -> None:
+        """Test the declared exceptions of a transport are translated."""
+
+        client = make_client(FakeTransport(exception))
+
+        with pytest.raises(error) as raised:
+            client.get_floors()
+
+        assert raised.value.__cause__ is exception
+
+    def test_retried_like_default_transport(self) -> None:
+        """Test translated failures are retried by the retry policy."""
+
+        transport = FakeTransport(
+            LibraryTimeout(),
+            TransportResponse(503, b"busy"),
+            TransportResponse(200, FLOOR_RESPONSE),
+        )
+        client = make_client(transport, RetryPolicy(max_attempts=3, backoff_factor=0))
+
+        assert client.get_floors()[0].code == "FANZA"
+        assert len(transport.requests) == 3
+
+    def test_closed_with_client(self) -> None:
+        """Test closing the client closes its transport."""
+
+        transport = FakeTransport()
+
+        with make_client(transport):
+            pass
+
+        assert transport.closed
+
+    def test_session_and_transport_exclusive(self) -> None:
+        """Test a session and a transport cannot both be given."""
+
+        with pytest.raises(ValueError):
+            DMMClient(
+                "test_key",
+                "test-990",
+                session=requests.Session(),
+                transport=FakeTransport(),
+            )
+
+
+class TestRequestsTransport:
+    """Test the default transport."""
+
+    def test_default_transport(self) -> None:
+        """Test the client uses a RequestsTransport with its timeout by default."""
+
+        client = DMMClient("test_key", "test-990", timeout=5)
+
+        assert isinstance(client._transport, RequestsTransport)
+        assert client._transport.timeout == 5
+        assert client._session is client._transport.session
+
+    def test_response_body(self) -> None:
+        """Test the transport returns raw bodies and error texts."""
+
+        session = requests.Session()
+        transport = RequestsTransport(session)
+
+        ok = requests.Response()
+        ok.status_code = 200
+        ok._content = b'{"result": {}}'
+        error = requests.Response()
+        error.status_code = 404
+        error._content = "見つかりません".encode("utf-8")
+        error.encoding = "utf-8"
+
+        session.get = lambda *args, **kwargs: ok  # type: ignore[method-assign]
+        assert transport.get("http://test", {}) == TransportResponse(
+            200, b'{"result": {}}'
+        )
+
+        session.get = lambda *args, **kwargs: error  # type: ignore[method-assign]
+        assert transport.get("http://test", {}).text == "見つかりません"
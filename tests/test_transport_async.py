@@ -0,0 +1,110 @@
+"""
+Tests for pluggable transports with AsyncDMMClient.
+"""
+
+# pylint: disable=protected-access
+
+import sys
+
+import pytest
+
+if sys.version_info < (3, 9):
+    pytest.skip("AsyncDMMClient requires Python 3.9+", allow_module_level=True)
+
+import asyncio
+from typing import Any, Dict, List
+
+from py_dmmjp.async_client import AiohttpTransport, AsyncDMMClient
+from py_dmmjp.exceptions import DMMAPIError, DMMAuthError, DMMTimeoutError
+from py_dmmjp.retry import RetryPolicy
+from py_dmmjp.transport import AsyncTransport, TransportResponse
+
+from .conftest import FLOOR_RESPONSE
+
+
+class FakeAsyncTransport(AsyncTransport):
+    """In-process transport answering requests from a list of responses."""
+
+    def __init__(self, *responses: Any) -> None:
+        self.responses = list(responses)
+        self.urls: List[str] = []
+        self.closed = False
+
+    async def get(self, url: str, params: Dict[str, Any]) -> TransportResponse:
+        self.urls.append(url)
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class TestAsyncTransport:
+    """Test AsyncDMMClient with a custom transport."""
+
+    @pytest.mark.asyncio
+    async def test_requests_sent_through_transport(self) -> None:
+        """Test requests and responses go through the transport."""
+
+        transport = FakeAsyncTransport(TransportResponse(200, FLOOR_RESPONSE))
+
+        async with AsyncDMMClient(
+            "test_key", "test-990", transport=transport
+        ) as client:
+            floors = await client.get_floors()
+
+        assert floors[0].code == "FANZA"
+        assert transport.urls == ["https://api.dmm.com/affiliate/v3/FloorList"]
+        assert transport.closed
+
+    @pytest.mark.asyncio
+    async def test_error_mapping(self) -> None:
+        """Test statuses and exceptions map to the usual errors."""
+
+        transport = FakeAsyncTransport(
+            TransportResponse(401, b""),
+            TransportResponse(502, b"Bad Gateway"),
+            asyncio.TimeoutError(),
+        )
+        client = AsyncDMMClient("test_key", "test-990", transport=transport)
+
+        with pytest.raises(DMMAuthError):
+            await client.get_floors()
+
+        with pytest.raises(DMMAPIError, match="HTTP 502: Bad Gateway") as error:
+            await client.get_floors()
+
+        assert error.value.status_code == 502
+
+        with pytest.raises(DMMTimeoutError):
+            await client.get_floors()
+
+    @pytest.mark.asyncio
+    async def test_retried(self) -> None:
+        """Test failed requests are retried through the transport."""
+
+        transport = FakeAsyncTransport(
+            TransportResponse(503, b"busy"), TransportResponse(200, FLOOR_RESPONSE)
+        )
+        client = AsyncDMMClient(
+            "test_key",
+            "test-990",
+            transport=transport,
+            retry=RetryPolicy(max_attempts=2, backoff_factor=0),
+        )
+
+        assert (await client.get_floors())[0].code == "FANZA"
+        assert len(transport.urls) == 2
+
+    def test_default_transport(self) -> None:
+        """Test the client uses an AiohttpTransport by default."""
+
+        client = AsyncDMMClient("test_key", "test-990", max_response_size=10)
+
+        assert isinstance(client._transport, AiohttpTransport)
+        assert client._transport.max_response_size == 10
+        assert client._session is None